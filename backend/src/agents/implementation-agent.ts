@@ -2,7 +2,13 @@ import { randomUUID } from "crypto";
 import { Message } from "../ai-clients";
 import { assert } from "console";
 import { InferenceTask } from "../api/types/inference";
-import { AgentBase, CRDTConnector, TextWriter, ToDoEvent } from "../core";
+import {
+  AgentBase,
+  CRDTConnector,
+  recordTaskUsage,
+  TextWriter,
+  ToDoEvent,
+} from "../core";
 import { CURSOR_TOOL } from "../core/tools";
 import { CodeOutputProcessor } from "../core/code-output-processor";
 
@@ -222,6 +228,9 @@ export class ImplementationAgent extends AgentBase {
         case "delta":
           codeOutputProcessor.processChunk(event.data.text);
           break;
+        case "usage":
+          recordTaskUsage(this.task, "implementation", event.data);
+          break;
         case "error":
           console.error(event.data.message);
           break;
@@ -2,7 +2,12 @@ import { randomUUID } from "crypto";
 import { Message } from "../ai-clients";
 import { assert } from "console";
 import { InferenceTask } from "../api/types/inference";
-import { AgentBase, CRDTConnector, TextWriter } from "../core";
+import {
+  AgentBase,
+  CRDTConnector,
+  recordTaskUsage,
+  TextWriter,
+} from "../core";
 import { CodeOutputProcessor } from "../core/code-output-processor";
 
 const SYSTEM_PROMPT = `
@@ -179,6 +184,9 @@ export class OutlinerAgent extends AgentBase {
         case "delta":
           codeOutputProcessor.processChunk(event.data.text);
           break;
+        case "usage":
+          recordTaskUsage(this.task, "outliner", event.data);
+          break;
         case "error":
           console.error(event.data.message);
           break;
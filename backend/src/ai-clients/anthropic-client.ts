@@ -7,6 +7,7 @@ import type {
   Message,
   StreamEvent,
   StopReason,
+  TokenUsage,
   ToolCall,
 } from "./types";
 
@@ -461,6 +462,15 @@ export class AnthropicClient implements AIClient {
         if (finalMessage?.stop_reason) {
           stopReason = this.mapStopReason(finalMessage.stop_reason);
         }
+        if (finalMessage?.usage) {
+          yield {
+            type: "usage",
+            data: {
+              inputTokens: finalMessage.usage.input_tokens,
+              outputTokens: finalMessage.usage.output_tokens,
+            },
+          };
+        }
 
         if (stopReason) {
           yield { type: "__internal_stop", stopReason };
@@ -738,18 +748,25 @@ export class AnthropicClient implements AIClient {
   private eventsToResponse(events: StreamEvent[]): ChatResponse {
     let content = "";
     const toolCalls: ToolCall[] = [];
+    let usage: TokenUsage | undefined;
 
     for (const event of events) {
       if (event.type === "delta" && event.data.text) {
         content += event.data.text;
       } else if (event.type === "tool_call") {
         toolCalls.push(event.data);
+      } else if (event.type === "usage") {
+        usage = {
+          inputTokens: (usage?.inputTokens ?? 0) + event.data.inputTokens,
+          outputTokens: (usage?.outputTokens ?? 0) + event.data.outputTokens,
+        };
       }
     }
 
     return {
       content,
       toolCalls: toolCalls.length > 0 ? toolCalls : undefined,
+      usage,
     };
   }
 
@@ -12,6 +12,7 @@ import type {
   Message,
   StreamEvent,
   StopReason,
+  TokenUsage,
   ToolCall,
 } from "./types";
 
@@ -60,6 +61,12 @@ interface BedrockStreamEvent {
   messageStop?: {
     stopReason?: string;
   };
+  metadata?: {
+    usage?: {
+      inputTokens?: number;
+      outputTokens?: number;
+    };
+  };
 }
 
 export class BedrockClient implements AIClient {
@@ -428,6 +435,17 @@ export class BedrockClient implements AIClient {
             stopReason = this.mapStopReason(typedEvent.messageStop.stopReason);
           }
 
+          const usage = typedEvent.metadata?.usage;
+          if (usage) {
+            yield {
+              type: "usage",
+              data: {
+                inputTokens: usage.inputTokens ?? 0,
+                outputTokens: usage.outputTokens ?? 0,
+              },
+            };
+          }
+
           const delta = typedEvent.contentBlockDelta?.delta;
           if (typeof delta?.text !== "undefined") {
             yield { type: "delta", data: { text: delta.text } };
@@ -702,18 +720,25 @@ export class BedrockClient implements AIClient {
   private eventsToResponse(events: StreamEvent[]): ChatResponse {
     let content = "";
     const toolCalls: ToolCall[] = [];
+    let usage: TokenUsage | undefined;
 
     for (const event of events) {
       if (event.type === "delta" && event.data.text) {
         content += event.data.text;
       } else if (event.type === "tool_call") {
         toolCalls.push(event.data);
+      } else if (event.type === "usage") {
+        usage = {
+          inputTokens: (usage?.inputTokens ?? 0) + event.data.inputTokens,
+          outputTokens: (usage?.outputTokens ?? 0) + event.data.outputTokens,
+        };
       }
     }
 
     return {
       content,
       toolCalls: toolCalls.length > 0 ? toolCalls : undefined,
+      usage,
     };
   }
 
@@ -7,6 +7,7 @@ import type {
   Message,
   StreamEvent,
   StopReason,
+  TokenUsage,
   ToolCall,
 } from "./types";
 
@@ -388,6 +389,8 @@ export class OpenAIClient implements AIClient {
       tools: openAITools && openAITools.length > 0 ? openAITools : undefined,
       tool_choice: this.mapToolChoice(request.toolChoice),
       stream: true as const,
+      // Token counts arrive in a final chunk without choices
+      stream_options: { include_usage: true },
     };
 
     let lastError: OpenAIError | null = null;
@@ -409,6 +412,16 @@ export class OpenAIClient implements AIClient {
 
         for await (const chunk of stream) {
           hasYieldedEvents = true;
+          if (chunk.usage) {
+            yield {
+              type: "usage",
+              data: {
+                inputTokens: chunk.usage.prompt_tokens,
+                outputTokens: chunk.usage.completion_tokens,
+              },
+            };
+          }
+
           const choice = chunk.choices?.[0];
           if (!choice) continue;
 
@@ -674,18 +687,25 @@ export class OpenAIClient implements AIClient {
   private eventsToResponse(events: StreamEvent[]): ChatResponse {
     let content = "";
     const toolCalls: ToolCall[] = [];
+    let usage: TokenUsage | undefined;
 
     for (const event of events) {
       if (event.type === "delta" && event.data.text) {
         content += event.data.text;
       } else if (event.type === "tool_call") {
         toolCalls.push(event.data);
+      } else if (event.type === "usage") {
+        usage = {
+          inputTokens: (usage?.inputTokens ?? 0) + event.data.inputTokens,
+          outputTokens: (usage?.outputTokens ?? 0) + event.data.outputTokens,
+        };
       }
     }
 
     return {
       content,
       toolCalls: toolCalls.length > 0 ? toolCalls : undefined,
+      usage,
     };
   }
 
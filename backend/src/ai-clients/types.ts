@@ -42,13 +42,15 @@ export interface ChatRequest {
   context?: Record<string, unknown>;
 }
 
+export interface TokenUsage {
+  inputTokens: number;
+  outputTokens: number;
+}
+
 export interface ChatResponse {
   content: string;
   toolCalls?: ToolCall[];
-  usage?: {
-    inputTokens: number;
-    outputTokens: number;
-  };
+  usage?: TokenUsage;
 }
 
 export type StopReason =
@@ -66,6 +68,8 @@ export type StreamEvent =
   | { type: "tool_call"; data: ToolCall }
   | { type: "tool_result"; data: { toolCallId: string; result: unknown } }
   | { type: "error"; data: { message: string } }
+  // Tokens of one model call; emitted once per call, so tool loops emit several
+  | { type: "usage"; data: TokenUsage }
   | { type: "end"; data: { messages: Message[]; stopReason?: StopReason } };
 
 /**
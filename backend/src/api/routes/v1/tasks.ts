@@ -4,12 +4,28 @@ import { databaseService } from "../../services/database-service";
 import type {
   CreateInferenceTaskRequest,
   InferenceTaskResponse,
+  TaskStatus,
 } from "../../types/inference";
 
 const router = Router();
 
-router.get("/", (_: Request, res: Response) => {
-  const tasks = inferenceService.getAllTasks();
+const TASK_STATUSES: TaskStatus[] = [
+  "pending",
+  "processing",
+  "completed",
+  "failed",
+];
+const DEFAULT_WAIT_TIMEOUT_MS = 30000;
+const MAX_WAIT_TIMEOUT_MS = 60000;
+
+// Optional `ids` query (comma-separated) restricts the listing to those tasks,
+// letting clients poll many in-flight tasks with a single request
+router.get("/", (req: Request, res: Response) => {
+  const idsParam = req.query.ids;
+  const tasks =
+    typeof idsParam === "string" && idsParam.length > 0
+      ? inferenceService.getTasks(idsParam.split(","))
+      : inferenceService.getAllTasks();
   res.json(tasks);
 });
 
@@ -79,4 +95,43 @@ router.get("/:taskId", (req: Request, res: Response) => {
   res.json(task);
 });
 
+// Long-poll: responds as soon as the task status changes from `since`
+// (or reaches completed/failed when `since` is omitted), or after `timeout` ms.
+router.get("/:taskId/wait", async (req: Request, res: Response) => {
+  const { taskId } = req.params;
+  const since = req.query.since as string | undefined;
+  const timeoutParam = parseInt(req.query.timeout as string);
+
+  if (since !== undefined && !TASK_STATUSES.includes(since as TaskStatus)) {
+    return res.status(400).json({
+      error: `Invalid since status. Must be one of: ${TASK_STATUSES.join(", ")}`,
+    });
+  }
+
+  const timeoutMs = isNaN(timeoutParam)
+    ? DEFAULT_WAIT_TIMEOUT_MS
+    : Math.min(Math.max(timeoutParam, 0), MAX_WAIT_TIMEOUT_MS);
+
+  // Stop waiting if the client goes away before the task changes
+  const abortController = new AbortController();
+  res.on("close", () => abortController.abort());
+
+  const task = await inferenceService.waitForTaskUpdate(
+    taskId,
+    since as TaskStatus | undefined,
+    timeoutMs,
+    abortController.signal
+  );
+
+  if (!task) {
+    return res.status(404).json({
+      error: "Task not found",
+    });
+  }
+
+  if (!res.writableEnded) {
+    res.json(task);
+  }
+});
+
 export default router;
@@ -1,22 +1,54 @@
 import { randomUUID } from "crypto";
-import { InferenceTask, AgentName } from "../types/inference";
+import { EventEmitter } from "events";
+import { InferenceTask, AgentName, TaskStatus } from "../types/inference";
 import {
   SequentialAgent,
   OutlinerAgent,
   ImplementationAgent,
 } from "../../agents";
-import { CRDTConnector, TextWriter, ToDoEvent, ToDoObserver } from "../../core";
+import {
+  CRDTConnector,
+  Queue,
+  TextWriter,
+  ToDoEvent,
+  ToDoObserver,
+} from "../../core";
 
 // Configuration for task cleanup
 const MAX_TASKS = 100_000; // Maximum number of tasks to keep in memory
 const TASK_RETENTION_MS = 7 * 24 * 60 * 60 * 1000; // Keep completed tasks for 7 days
 const CLEANUP_INTERVAL_MS = 60 * 60 * 1000; // Run cleanup every hour
 
+const isTerminalStatus = (status: TaskStatus): boolean =>
+  status === "completed" || status === "failed";
+
+/**
+ * Parses MAX_CONCURRENT_TASKS. Unset or empty means unlimited; anything else
+ * must be a positive integer.
+ */
+export function parseMaxConcurrentTasks(value: string | undefined): number {
+  if (value === undefined || value.trim() === "") return Infinity;
+
+  const limit = Number(value);
+  if (!Number.isInteger(limit) || limit < 1) {
+    throw new Error(
+      `MAX_CONCURRENT_TASKS must be a positive integer, got "${value}"`
+    );
+  }
+  return limit;
+}
+
 class InferenceService {
   private tasks: Map<string, InferenceTask> = new Map();
+  private taskEvents = new EventEmitter();
+  // Unlimited unless setMaxConcurrentTasks() is called at startup
+  private taskQueue = new Queue(Infinity);
   private cleanupInterval?: NodeJS.Timeout;
 
   constructor() {
+    // One listener per waiting client, so the default limit of 10 is too low
+    this.taskEvents.setMaxListeners(0);
+
     // Start periodic cleanup
     this.cleanupInterval = setInterval(() => {
       this.cleanupOldTasks();
@@ -78,6 +110,14 @@ class InferenceService {
     }
   }
 
+  /**
+   * Caps the number of tasks processed at once; further tasks stay pending
+   * until a slot frees up. Must be called before the first task is created.
+   */
+  setMaxConcurrentTasks(maxConcurrentTasks: number): void {
+    this.taskQueue = new Queue(maxConcurrentTasks);
+  }
+
   createTask(
     roomId: string,
     prompt: string,
@@ -96,7 +136,9 @@ class InferenceService {
 
     this.tasks.set(taskId, task);
 
-    this.processTaskInBackground(taskId);
+    // Processing (and startedAt) begins once the task gets a slot, which is
+    // immediately unless a concurrency cap is configured
+    this.taskQueue.enqueue(() => this.processTaskInBackground(taskId));
 
     return taskId;
   }
@@ -109,13 +151,62 @@ class InferenceService {
     return Array.from(this.tasks.values());
   }
 
+  getTasks(taskIds: string[]): InferenceTask[] {
+    return taskIds
+      .map((taskId) => this.tasks.get(taskId))
+      .filter((task): task is InferenceTask => task !== undefined);
+  }
+
+  /**
+   * Resolves once the task status differs from `since` (or, without `since`,
+   * once the task is completed/failed), or when the timeout elapses.
+   * Resolves to undefined if the task does not exist.
+   */
+  waitForTaskUpdate(
+    taskId: string,
+    since: TaskStatus | undefined,
+    timeoutMs: number,
+    signal?: AbortSignal
+  ): Promise<InferenceTask | undefined> {
+    const isSettled = (task: InferenceTask) =>
+      since ? task.status !== since : isTerminalStatus(task.status);
+
+    const task = this.tasks.get(taskId);
+    if (!task || isSettled(task) || timeoutMs <= 0 || signal?.aborted) {
+      return Promise.resolve(task);
+    }
+
+    return new Promise((resolve) => {
+      const finish = () => {
+        clearTimeout(timer);
+        this.taskEvents.off(taskId, onUpdate);
+        signal?.removeEventListener("abort", finish);
+        resolve(this.tasks.get(taskId));
+      };
+      const onUpdate = (updated: InferenceTask) => {
+        if (isSettled(updated)) finish();
+      };
+      const timer = setTimeout(finish, timeoutMs);
+
+      this.taskEvents.on(taskId, onUpdate);
+      signal?.addEventListener("abort", finish);
+    });
+  }
+
+  private setStatus(task: InferenceTask, status: TaskStatus): void {
+    task.status = status;
+    task.updatedAt = new Date();
+    this.taskEvents.emit(task.id, task);
+  }
+
   private async processTaskInBackground(taskId: string): Promise<void> {
     const task = this.tasks.get(taskId);
     if (!task) return;
 
-    task.status = "processing";
-    task.updatedAt = new Date();
+    task.startedAt = new Date();
+    this.setStatus(task, "processing");
 
+    let finalStatus: TaskStatus;
     const start = process.hrtime.bigint();
 
     try {
@@ -186,9 +277,9 @@ class InferenceService {
 
       await connector.disconnect();
 
-      task.status = "completed";
+      finalStatus = "completed";
     } catch (error) {
-      task.status = "failed";
+      finalStatus = "failed";
       task.error =
         error instanceof Error ? error.message : "Unknown error occurred";
     }
@@ -197,7 +288,8 @@ class InferenceService {
     const durationSec = Number(end - start) / 1e9;
     console.log(`Execution time: ${durationSec.toFixed(3)} s`);
 
-    task.updatedAt = new Date();
+    task.finishedAt = new Date();
+    this.setStatus(task, finalStatus);
   }
 }
 
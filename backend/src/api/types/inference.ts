@@ -1,13 +1,34 @@
 export type AgentName = "outliner" | "sequential";
 
+export type TaskStatus = "pending" | "processing" | "completed" | "failed";
+
+export interface AgentTokenUsage {
+  inputTokens: number;
+  outputTokens: number;
+  calls: number; // Model calls, including tool-use iterations
+}
+
+export interface TaskTokenUsage {
+  inputTokens: number;
+  outputTokens: number;
+  // Keyed by agent: "sequential", "outliner" or "implementation"
+  agents: Record<string, AgentTokenUsage>;
+}
+
 export interface InferenceTask {
   id: string;
   roomId: string;
-  status: "pending" | "processing" | "completed" | "failed";
+  status: TaskStatus;
   prompt: string;
   agentName: AgentName;
   error?: string;
   createdAt: Date;
+  // Set when a processing slot frees up; the gap from createdAt is queue wait
+  startedAt?: Date;
+  // Set when the task reaches completed or failed
+  finishedAt?: Date;
+  // Tokens used by the task's model calls, set once the first call reports usage
+  usage?: TaskTokenUsage;
   updatedAt: Date;
 }
 
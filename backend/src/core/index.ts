@@ -3,3 +3,4 @@ export * from "./crdt-connector";
 export * from "./text-writer";
 export * from "./todo-observer";
 export * from "./queue";
+export * from "./task-usage";
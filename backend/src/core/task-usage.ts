@@ -0,0 +1,29 @@
+import { TokenUsage } from "../ai-clients";
+import { InferenceTask } from "../api/types/inference";
+
+/**
+ * Adds the tokens of one model call to the task totals and to the calling
+ * agent's share. Concurrent implementation agents share one entry.
+ */
+export function recordTaskUsage(
+  task: InferenceTask,
+  agent: string,
+  usage: TokenUsage
+): void {
+  if (!task.usage) {
+    task.usage = { inputTokens: 0, outputTokens: 0, agents: {} };
+  }
+
+  const agentUsage = task.usage.agents[agent] ?? {
+    inputTokens: 0,
+    outputTokens: 0,
+    calls: 0,
+  };
+  agentUsage.inputTokens += usage.inputTokens;
+  agentUsage.outputTokens += usage.outputTokens;
+  agentUsage.calls += 1;
+  task.usage.agents[agent] = agentUsage;
+
+  task.usage.inputTokens += usage.inputTokens;
+  task.usage.outputTokens += usage.outputTokens;
+}
@@ -13,9 +13,21 @@ import type { onConnectPayload } from "@hocuspocus/server";
 import { SQLite } from "@hocuspocus/extension-sqlite";
 import express, { Application, Request, Response, NextFunction } from "express";
 import v1Routes from "./api/routes/v1";
+import {
+  inferenceService,
+  parseMaxConcurrentTasks,
+} from "./api/services/inference-service";
 
 dotenv.config();
 
+// Opt-in cap on concurrent inference tasks; invalid values stop startup
+const MAX_CONCURRENT_TASKS = parseMaxConcurrentTasks(
+  process.env.MAX_CONCURRENT_TASKS
+);
+if (Number.isFinite(MAX_CONCURRENT_TASKS)) {
+  inferenceService.setMaxConcurrentTasks(MAX_CONCURRENT_TASKS);
+}
+
 const app: Application = express();
 const PORT = Number(process.env.PORT) || 3001;
 const NODE_ENV = process.env.NODE_ENV || "development";
@@ -97,6 +109,9 @@ server.on(
 server.listen(PORT, () => {
   console.log(`Server running on port ${PORT} (${NODE_ENV})`);
   console.log(`AI Provider: ${process.env.AI_PROVIDER || 'bedrock (default)'}`);
+  if (Number.isFinite(MAX_CONCURRENT_TASKS)) {
+    console.log(`Max concurrent tasks: ${MAX_CONCURRENT_TASKS}`);
+  }
   console.log(`Health: http://localhost:${PORT}/api/v1/health`);
   console.log(`WS: ws://localhost:${PORT}/crdt`);
 });
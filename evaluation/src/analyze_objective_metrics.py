@@ -10,6 +10,9 @@ import numpy as np
 from scipy import stats
 from pathlib import Path
 import json
+import sys
+
+from evaluation.dataset import resolve_results_dir
 
 
 def cohens_d_paired(diff: np.ndarray) -> float:
@@ -93,7 +96,8 @@ def main():
     print("="*70)
 
     # Load data
-    csv_file = Path("/Users/codecrdt/evaluation/evaluation_results/objective_metrics.csv")
+    results_dir = resolve_results_dir(sys.argv[1] if len(sys.argv) > 1 else None)
+    csv_file = results_dir / "objective_metrics.csv"
     df = pd.read_csv(csv_file)
 
     print(f"\nLoaded {len(df)} results")
@@ -151,7 +155,7 @@ def main():
         print(f"  Significance: {sig_level}")
 
     # Save results
-    output_file = Path("/Users/codecrdt/evaluation/evaluation_results/objective_metrics_analysis.json")
+    output_file = results_dir / "objective_metrics_analysis.json"
     with open(output_file, 'w') as f:
         json.dump(all_results, f, indent=2)
 
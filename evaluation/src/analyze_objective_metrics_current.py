@@ -14,6 +14,9 @@ import numpy as np
 from scipy import stats
 from pathlib import Path
 import json
+import sys
+
+from evaluation.dataset import resolve_results_dir
 
 
 def cohens_d_independent(group1: np.ndarray, group2: np.ndarray) -> float:
@@ -132,7 +135,8 @@ def main():
     print("=" * 70)
 
     # Load data
-    csv_file = Path("/Users/codecrdt/evaluation/evaluation_results/objective_metrics.csv")
+    results_dir = resolve_results_dir(sys.argv[1] if len(sys.argv) > 1 else None)
+    csv_file = results_dir / "objective_metrics.csv"
     df = pd.read_csv(csv_file)
 
     print(f"\nLoaded {len(df)} results")
@@ -199,7 +203,7 @@ def main():
             print("✓  I² < 50% indicates low heterogeneity. Pooling may be valid.")
 
     # Save results
-    output_file = Path("/Users/codecrdt/evaluation/evaluation_results/objective_metrics_corrected.json")
+    output_file = results_dir / "objective_metrics_corrected.json"
     with open(output_file, 'w') as f:
         json.dump(all_results, f, indent=2)
 
@@ -16,8 +16,8 @@ For each of the 600 evaluation results, we:
 """
 
 import json
-import glob
 import subprocess
+import sys
 import tempfile
 import os
 from pathlib import Path
@@ -25,6 +25,8 @@ from typing import Dict, List, Tuple
 import pandas as pd
 import re
 
+from evaluation.dataset import ResultsDataset, resolve_results_dir, result_file_path
+
 
 def setup_typescript_project(temp_dir: Path) -> None:
     """
@@ -192,15 +194,13 @@ def run_eslint_check(code: str, temp_dir: Path) -> Tuple[int, int, str]:
         return 999, 999, f"Error: {str(e)}"
 
 
-def compute_metrics_for_result(result_file: str) -> Dict:
+def compute_metrics_for_result(result_file: str, result: Dict, code: str) -> Dict:
     """
     Compute objective metrics for a single evaluation result.
-    """
-    with open(result_file, 'r') as f:
-        result = json.load(f)
-
-    code = result.get('response_content', '')
 
+    `result` is a row of the consolidated results dataset and `code` the
+    generated code it references.
+    """
     if not code or result.get('error'):
         return {
             'file': result_file,
@@ -249,22 +249,25 @@ def compute_metrics_for_result(result_file: str) -> Dict:
 
 def main():
     """Main analysis pipeline."""
-    results_dir = "/Users/codecrdt/evaluation/evaluation_results"
+    results_dir = resolve_results_dir(sys.argv[1] if len(sys.argv) > 1 else None)
 
     print("Computing objective metrics for all evaluation results...")
     print("This will take several minutes (~600 files × ~5 seconds each)...")
 
-    results_files = sorted(glob.glob(f"{results_dir}/results/*.json"))
-    print(f"Found {len(results_files)} result files")
+    dataset = ResultsDataset(results_dir)
+    results = dataset.query().to_dict('records')
+    print(f"Found {len(results)} results")
 
     all_metrics = []
 
-    for i, result_file in enumerate(results_files):
+    for i, result in enumerate(results):
         if i % 50 == 0:
-            print(f"Processing {i}/{len(results_files)}...")
+            print(f"Processing {i}/{len(results)}...")
 
+        result_file = str(result_file_path(results_dir, result))
         try:
-            metrics = compute_metrics_for_result(result_file)
+            code = dataset.code(result)
+            metrics = compute_metrics_for_result(result_file, result, code)
             all_metrics.append(metrics)
         except Exception as e:
             print(f"Error processing {result_file}: {e}")
@@ -6,14 +6,16 @@ Optimized version that sets up a single TypeScript project and checks all files
 """
 
 import json
-import glob
 import subprocess
 import os
 import sys
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Tuple
 import pandas as pd
 
+from evaluation.dataset import ResultsDataset, resolve_results_dir, result_file_path
+
 
 # Enable unbuffered output
 sys.stdout.reconfigure(line_buffering=True)
@@ -46,7 +48,7 @@ def setup_evaluation_project(project_dir: Path) -> None:
             "noUnusedLocals": False,
             "noUnusedParameters": False
         },
-        "include": ["generated/*.tsx"]
+        "include": ["*.tsx"]
     }
 
     with open(project_dir / "tsconfig.json", "w") as f:
@@ -62,10 +64,6 @@ def setup_evaluation_project(project_dir: Path) -> None:
     with open(project_dir / "package.json", "w") as f:
         json.dump(package_json, f, indent=2)
 
-    # Create generated directory
-    generated_dir = project_dir / "generated"
-    generated_dir.mkdir(exist_ok=True)
-
     print("✅ Project setup complete")
 
 
@@ -168,17 +166,19 @@ def run_eslint_check_simple(code_file: Path, project_dir: Path) -> Tuple[int, in
         return 999, 999
 
 
-def compute_metrics_for_result(result_file: str, project_dir: Path, generated_dir: Path) -> Dict:
+def compute_metrics_for_result(
+    result_file: str, result: Dict, code: str, project_dir: Path
+) -> Dict:
     """
     Compute objective metrics for a single evaluation result.
-    """
-    with open(result_file, 'r') as f:
-        result = json.load(f)
 
+    `result` is a row of the consolidated results dataset and `code` the
+    generated code it references. The tools run on a temporary copy of the
+    code inside the project, removed once the result is processed.
+    """
     task = result.get('prompt_id')
     mode = result.get('mode')
-    run_num = result.get('run_number')
-    code = result.get('response_content', '')
+    run_num = int(result.get('run_number'))
 
     # Create metrics dict
     metrics = {
@@ -206,14 +206,15 @@ def compute_metrics_for_result(result_file: str, project_dir: Path, generated_di
         })
         return metrics
 
-    # Save code to generated directory
+    # Temporary copy for the tools, next to the project's tsconfig.json
     code_filename = f"{task}_{mode}_run{run_num:03d}.tsx"
-    code_file = generated_dir / code_filename
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".tsx", prefix=f"{task}_{mode}_run{run_num:03d}_", dir=project_dir, delete=False
+    ) as f:
+        f.write(code)
+    code_file = Path(f.name)
 
     try:
-        with open(code_file, 'w') as f:
-            f.write(code)
-
         # Run TypeScript check
         compile_success, ts_errors = run_typescript_check(code_file, project_dir)
 
@@ -236,6 +237,8 @@ def compute_metrics_for_result(result_file: str, project_dir: Path, generated_di
             'lint_error_count': 999,
             'lint_warning_count': 999
         })
+    finally:
+        code_file.unlink(missing_ok=True)
 
     return metrics
 
@@ -246,27 +249,29 @@ def main():
     print("COMPUTING OBJECTIVE METRICS FOR ALL EVALUATION RESULTS")
     print("="*70)
 
-    results_dir = Path("/Users/codecrdt/evaluation/evaluation_results")
+    results_dir = resolve_results_dir(sys.argv[1] if len(sys.argv) > 1 else None)
     project_dir = results_dir / "objective_evaluation_project"
-    generated_dir = project_dir / "generated"
 
     # Setup project
     setup_evaluation_project(project_dir)
 
-    # Get all result files
-    results_files = sorted(glob.glob(str(results_dir / "results" / "*.json")))
-    print(f"\nFound {len(results_files)} result files")
+    # Load all results from the cached consolidated dataset
+    dataset = ResultsDataset(results_dir)
+    results = dataset.query().to_dict('records')
+    print(f"\nFound {len(results)} results")
     print(f"Processing... (this may take 10-15 minutes)\n")
 
     all_metrics = []
 
-    for i, result_file in enumerate(results_files):
+    for i, result in enumerate(results):
         if i % 50 == 0:
-            print(f"Progress: {i}/{len(results_files)} ({i*100//len(results_files)}%)")
+            print(f"Progress: {i}/{len(results)} ({i*100//len(results)}%)")
             sys.stdout.flush()
 
+        result_file = str(result_file_path(results_dir, result))
         try:
-            metrics = compute_metrics_for_result(result_file, project_dir, generated_dir)
+            code = dataset.code(result)
+            metrics = compute_metrics_for_result(result_file, result, code, project_dir)
             all_metrics.append(metrics)
         except Exception as e:
             print(f"ERROR processing {result_file}: {e}", file=sys.stderr)
@@ -276,7 +281,7 @@ def main():
                 'error_message': str(e)
             })
 
-    print(f"Progress: {len(results_files)}/{len(results_files)} (100%)")
+    print(f"Progress: {len(results)}/{len(results)} (100%)")
 
     # Convert to DataFrame
     df = pd.DataFrame(all_metrics)
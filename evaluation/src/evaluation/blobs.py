@@ -0,0 +1,158 @@
+"""Content-addressed, compressed storage for generated code."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Any
+
+BLOB_DIR = "blobs"
+
+# Raised when a referenced blob is missing, truncated or otherwise damaged
+BLOB_READ_ERRORS = (OSError, EOFError, zlib.error)
+
+# Result record keys that reference a blob instead of holding the code
+CONTENT_KEY = "response_content"
+CONTENT_BLOB_KEY = "response_content_blob"
+RAW_CONTENT_KEY = "content"
+RAW_CONTENT_BLOB_KEY = "content_blob"
+
+
+class BlobStore:
+    """Store each distinct piece of generated code once, gzip-compressed.
+
+    Blobs are keyed by the SHA-256 of their UTF-8 bytes and laid out as
+    ``blobs/<first two hex digits>/<digest>.gz``. Identical code from different
+    runs, and the copies in ``response_content`` and ``raw_response``, share a
+    single blob.
+    """
+
+    def __init__(self, root: Path):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the blobs, usually ``<output_dir>/blobs``
+        """
+        self.root = root
+
+    @classmethod
+    def for_output_dir(cls, output_dir: Path) -> BlobStore:
+        """Get the blob store of an evaluation output directory."""
+        return cls(output_dir / BLOB_DIR)
+
+    def path(self, digest: str) -> Path:
+        """Get the file path of a blob."""
+        return self.root / digest[:2] / f"{digest}.gz"
+
+    def put(self, text: str) -> str:
+        """Store text and return its digest. Existing blobs are not rewritten."""
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        if path.exists():
+            return digest
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(gzip.compress(data, mtime=0))
+        os.replace(tmp_path, path)
+        return digest
+
+    def get(self, digest: str) -> str:
+        """Read the text stored under a digest.
+
+        Raises:
+            FileNotFoundError: If the blob does not exist
+            gzip.BadGzipFile, EOFError, zlib.error: If the blob is damaged
+        """
+        with open(self.path(digest), "rb") as f:
+            return gzip.decompress(f.read()).decode("utf-8")
+
+    def externalize(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Replace generated code in a result record with blob references.
+
+        Returns a shallow copy; the input record is not modified.
+        """
+        record = dict(record)
+        content = record.get(CONTENT_KEY)
+        if content:
+            record[CONTENT_BLOB_KEY] = self.put(content)
+            del record[CONTENT_KEY]
+
+        raw_response = record.get("raw_response")
+        if isinstance(raw_response, dict) and raw_response.get(RAW_CONTENT_KEY):
+            raw_response = dict(raw_response)
+            raw_response[RAW_CONTENT_BLOB_KEY] = self.put(raw_response.pop(RAW_CONTENT_KEY))
+            record["raw_response"] = raw_response
+
+        return record
+
+    def resolve(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Fill blob references in a result record back in with the code.
+
+        Records without references are returned unchanged, so results written
+        before blob storage existed read the same way.
+        """
+        if CONTENT_BLOB_KEY not in record and not _has_raw_blob(record):
+            return record
+
+        record = dict(record)
+        digest = record.pop(CONTENT_BLOB_KEY, None)
+        if digest:
+            record[CONTENT_KEY] = self.get(digest)
+
+        if _has_raw_blob(record):
+            raw_response = dict(record["raw_response"])
+            raw_response[RAW_CONTENT_KEY] = self.get(raw_response.pop(RAW_CONTENT_BLOB_KEY))
+            record["raw_response"] = raw_response
+
+        return record
+
+
+def _has_raw_blob(record: dict[str, Any]) -> bool:
+    raw_response = record.get("raw_response")
+    return isinstance(raw_response, dict) and RAW_CONTENT_BLOB_KEY in raw_response
+
+
+def read_result(path: Path, with_content: bool = True) -> dict[str, Any]:
+    """Read a ``results/*.json`` record, in either the inline or the blob format.
+
+    Args:
+        path: Path of the result file inside ``<output_dir>/results``
+        with_content: Load generated code from the blob store. Analyses that
+            only need scores and timings can skip it and avoid the extra I/O.
+
+    Returns:
+        The result record. Without content, ``response_content`` is left out
+        for blob-format records.
+    """
+    with open(path, encoding="utf-8") as f:
+        record = json.load(f)
+
+    if not with_content:
+        return record
+    return BlobStore.for_output_dir(Path(path).parent.parent).resolve(record)
+
+
+def read_results(output_dir: Path, with_content: bool = True) -> list[dict[str, Any]]:
+    """Read all result records of an evaluation output directory.
+
+    Args:
+        output_dir: Evaluation output directory containing ``results/``
+        with_content: Load generated code from the blob store
+
+    Returns:
+        Result records sorted by file name
+    """
+    blobs = BlobStore.for_output_dir(Path(output_dir))
+    records = []
+    for path in sorted((Path(output_dir) / "results").glob("*.json")):
+        with open(path, encoding="utf-8") as f:
+            record = json.load(f)
+        records.append(blobs.resolve(record) if with_content else record)
+    return records
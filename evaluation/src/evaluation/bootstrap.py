@@ -0,0 +1,304 @@
+"""Vectorized bootstrap confidence intervals for summaries and effect sizes.
+
+A resample draws runs with replacement. Each batch of resamples is one
+(resamples × runs) index matrix, turned into a matrix of how often each run
+was drawn. Means and variances of every metric are then matrix products,
+and quantiles come from cumulative counts in each metric's sort order, so
+no resample is ever materialized or sorted. All metrics of a group share
+the same resampled runs; a run missing a metric is left out of that
+metric's statistics.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Hashable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+# Resample × run counts held in memory at once; larger groups resample in batches
+CHUNK_ELEMENTS = 4_000_000
+
+# Fewer jobs than this run in-process; process start-up would cost more than it saves
+PARALLEL_MIN_JOBS = 16
+
+
+@dataclass
+class BootstrapJob:
+    """Groups of runs to bootstrap together, e.g. the modes of one prompt.
+
+    Attributes:
+        key: Identifies the job's result
+        metrics: Metric names, the columns of the group matrices
+        groups: (runs × metrics) values per group name, NaN for missing values
+        quantiles: Quantiles to bootstrap besides mean and median, per metric
+        effect_size: Two group names; Cohen's d of the second versus the first
+        effect_values: Values Cohen's d is computed from, if they differ from
+            ``groups`` (e.g. with outliers set to NaN); same shapes
+    """
+
+    key: Hashable
+    metrics: list[str]
+    groups: dict[str, np.ndarray]
+    quantiles: dict[str, dict[str, float]] = field(default_factory=dict)
+    effect_size: tuple[str, str] | None = None
+    effect_values: dict[str, np.ndarray] | None = None
+
+
+def percentile_interval(
+    estimates: np.ndarray, point: float, confidence_level: float
+) -> dict[str, float]:
+    """Percentile interval of bootstrap estimates around a point estimate.
+
+    Args:
+        estimates: Statistic of each resample (NaN where undefined)
+        point: Statistic of the original sample
+        confidence_level: Coverage of the interval
+
+    Returns:
+        ``estimate``, ``ci_lower`` and ``ci_upper`` (NaN if undefined)
+    """
+    estimates = estimates[~np.isnan(estimates)]
+    if len(estimates) == 0:
+        return {"estimate": float(point), "ci_lower": float("nan"), "ci_upper": float("nan")}
+    alpha = 1 - confidence_level
+    lower, upper = np.quantile(estimates, [alpha / 2, 1 - alpha / 2])
+    return {"estimate": float(point), "ci_lower": float(lower), "ci_upper": float(upper)}
+
+
+def resample_counts(n: int, resamples: int, rng: np.random.Generator) -> Iterator[np.ndarray]:
+    """Draw counts of each of n runs in bootstrap resamples, in batches.
+
+    Args:
+        n: Number of runs
+        resamples: Total number of resamples
+        rng: Random generator
+
+    Yields:
+        (n × batch) matrices, one column per resample; column sums are n
+    """
+    batch = max(1, CHUNK_ELEMENTS // n)
+    for start in range(0, resamples, batch):
+        size = min(batch, resamples - start)
+        # Index matrix: row i holds the runs drawn in resample i
+        indices = rng.integers(0, n, size=(size, n), dtype=np.int32)
+        cells = (indices * np.int32(size) + np.arange(size, dtype=np.int32)[:, None]).ravel()
+        yield np.bincount(cells, minlength=n * size).reshape(n, size).astype(np.int32)
+
+
+def weighted_moments(
+    counts: np.ndarray, values: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sample size, mean and variance (ddof=1) of every metric in every resample.
+
+    Args:
+        counts: (runs × resamples) draw counts
+        values: (runs × metrics) values, NaN for missing ones
+
+    Returns:
+        (metrics × resamples) sizes, means and variances; NaN where undefined
+    """
+    present = ~np.isnan(values)
+    # Center on the sample mean to keep the variance numerically stable
+    sizes = present.sum(axis=0)
+    center = np.where(present, values, 0.0).sum(axis=0) / np.maximum(sizes, 1)
+    centered = np.where(present, values - center, 0.0)
+    weights = counts.astype(np.float64)
+    n = present.T.astype(np.float64) @ weights
+    sums = centered.T @ weights
+    squares = (centered**2).T @ weights
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = center[:, None] + sums / n
+        variance = (squares - sums**2 / n) / (n - 1)
+    return n, np.where(n > 0, mean, np.nan), np.where(n > 1, np.maximum(variance, 0.0), np.nan)
+
+
+def weighted_quantiles(counts: np.ndarray, values: np.ndarray, levels: list[float]) -> np.ndarray:
+    """Quantiles of one metric in every resample, interpolated like ``np.quantile``.
+
+    Args:
+        counts: (runs × resamples) draw counts
+        values: Values of the runs, NaN for missing ones
+        levels: Quantiles in [0, 1]
+
+    Returns:
+        (levels × resamples) quantiles; NaN for resamples without values
+    """
+    result = np.full((len(levels), counts.shape[1]), np.nan)
+    present = np.flatnonzero(~np.isnan(values))
+    if len(present) == 0:
+        return result
+    order = present[np.argsort(values[present])]
+    ordered = values[order]
+    cumulative = _cumulative_rows(counts[order])
+    total = cumulative[-1]
+
+    def order_statistic(k: np.ndarray) -> np.ndarray:
+        # The k-th smallest drawn value (0-based) is the first run whose cumulative count exceeds k
+        position = (cumulative <= k).sum(axis=0)
+        return ordered[np.minimum(position, len(ordered) - 1)]
+
+    for i, level in enumerate(levels):
+        position = level * np.maximum(total - 1, 0)
+        lower = np.floor(position)
+        low = order_statistic(lower)
+        high = order_statistic(np.ceil(position))
+        result[i] = np.where(total > 0, low + (high - low) * (position - lower), np.nan)
+    return result
+
+
+def _cumulative_rows(counts: np.ndarray) -> np.ndarray:
+    # Adding whole rows is several times faster than np.cumsum along axis 0,
+    # which walks the columns one by one
+    cumulative = np.empty_like(counts)
+    running = np.zeros(counts.shape[1], dtype=counts.dtype)
+    for i, row in enumerate(counts):
+        running += row
+        cumulative[i] = running
+    return cumulative
+
+
+def _group_statistics(
+    counts: np.ndarray, values: np.ndarray, metrics: list[str], quantiles: dict[str, dict]
+) -> dict[tuple[str, str], np.ndarray]:
+    """Mean, median and extra quantiles per metric in each resample."""
+    _, mean, _ = weighted_moments(counts, values)
+    statistics = {(metric, "mean"): mean[k] for k, metric in enumerate(metrics)}
+    for k, metric in enumerate(metrics):
+        levels = {"median": 0.5, **quantiles.get(metric, {})}
+        estimates = weighted_quantiles(counts, values[:, k], list(levels.values()))
+        for name, estimate in zip(levels, estimates, strict=True):
+            statistics[metric, name] = estimate
+    return statistics
+
+
+def _bootstrap_group(
+    job: BootstrapJob, name: str, resamples: int, rng: np.random.Generator
+) -> tuple[dict[tuple[str, str], np.ndarray], tuple[np.ndarray, ...] | None]:
+    """Statistics of one group, original sample first, then each resample.
+
+    Returns:
+        Statistics by (metric, statistic), and the (n, mean, variance)
+        moments of the effect-size values if the group is compared
+    """
+    values = job.groups[name]
+    compared = job.effect_size is not None and name in job.effect_size
+    effect_values = (job.effect_values or job.groups)[name]
+
+    # Drawing every run once gives the statistics of the original sample
+    batches = [np.ones((len(values), 1), dtype=np.int32)]
+    batches.extend(resample_counts(len(values), resamples, rng))
+
+    statistics: dict[tuple[str, str], list[np.ndarray]] = {}
+    moments: list[tuple[np.ndarray, ...]] = []
+    for counts in batches:
+        for key, value in _group_statistics(counts, values, job.metrics, job.quantiles).items():
+            statistics.setdefault(key, []).append(value)
+        if compared:
+            moments.append(weighted_moments(counts, effect_values))
+
+    joined = {key: np.concatenate(parts) for key, parts in statistics.items()}
+    if not compared:
+        return joined, None
+    return joined, tuple(np.hstack(parts) for parts in zip(*moments, strict=True))
+
+
+def _cohens_d(moments1: tuple[np.ndarray, ...], moments2: tuple[np.ndarray, ...]) -> np.ndarray:
+    (n1, mean1, var1), (n2, mean2, var2) = moments1, moments2
+    pooled_std = np.sqrt((var1 + var2) / 2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        d = np.where(pooled_std > 0, (mean2 - mean1) / pooled_std, np.nan)
+    return np.where((n1 > 1) & (n2 > 1), d, np.nan)
+
+
+def bootstrap_job(
+    job: BootstrapJob,
+    resamples: int,
+    confidence_level: float,
+    seed: np.random.SeedSequence | int = 0,
+) -> dict[str, Any]:
+    """Bootstrap the groups of one job.
+
+    Args:
+        job: Groups to bootstrap
+        resamples: Number of bootstrap resamples
+        confidence_level: Coverage of the intervals
+        seed: Seed of the job's random stream
+
+    Returns:
+        Per group name, intervals by metric and statistic (``mean``,
+        ``median`` and the job's quantiles), and under ``effect_size`` the
+        Cohen's d interval per metric. Metrics with fewer than 2 values in a
+        group, and groups without runs, are left out.
+    """
+    rng = np.random.default_rng(seed)
+    intervals: dict[str, Any] = {}
+    moments = {}
+    for name, values in job.groups.items():
+        if len(values) == 0:
+            continue
+        statistics, moments[name] = _bootstrap_group(job, name, resamples, rng)
+        sizes = (~np.isnan(values)).sum(axis=0)
+        group: dict[str, dict[str, dict[str, float]]] = {}
+        for (metric, statistic), estimates in statistics.items():
+            if sizes[job.metrics.index(metric)] >= 2:
+                interval = percentile_interval(estimates[1:], estimates[0], confidence_level)
+                group.setdefault(metric, {})[statistic] = interval
+        intervals[name] = group
+
+    if job.effect_size and all(moments.get(name) is not None for name in job.effect_size):
+        first, second = (moments[name] for name in job.effect_size)
+        d = _cohens_d(first, second)
+        intervals["effect_size"] = {
+            metric: percentile_interval(d[k, 1:], d[k, 0], confidence_level)
+            for k, metric in enumerate(job.metrics)
+            if first[0][k, 0] >= 2 and second[0][k, 0] >= 2
+        }
+    return intervals
+
+
+def run_bootstrap(
+    jobs: list[BootstrapJob],
+    resamples: int,
+    confidence_level: float,
+    seed: int = 0,
+    workers: int | None = None,
+) -> dict[Hashable, dict[str, Any]]:
+    """Bootstrap many jobs, in a process pool when there are enough of them.
+
+    Each job gets its own random stream spawned from ``seed``, so results do
+    not depend on the number of workers.
+
+    Args:
+        jobs: Jobs to bootstrap
+        resamples: Number of bootstrap resamples per group
+        confidence_level: Coverage of the intervals
+        seed: Seed of the random streams
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+
+    Returns:
+        Intervals per job key, see ``bootstrap_job()``
+    """
+    seeds = np.random.SeedSequence(seed).spawn(len(jobs))
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < PARALLEL_MIN_JOBS:
+        results = [
+            bootstrap_job(job, resamples, confidence_level, job_seed)
+            for job, job_seed in zip(jobs, seeds, strict=True)
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            results = list(
+                executor.map(
+                    bootstrap_job,
+                    jobs,
+                    [resamples] * len(jobs),
+                    [confidence_level] * len(jobs),
+                    seeds,
+                    chunksize=max(1, len(jobs) // (4 * workers)),
+                )
+            )
+    return {job.key: result for job, result in zip(jobs, results, strict=True)}
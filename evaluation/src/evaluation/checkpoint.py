@@ -0,0 +1,316 @@
+"""Persistence of evaluation results: checkpoint journal and background writer."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from .blobs import BLOB_READ_ERRORS, BlobStore, read_result
+from .config import EvaluationResult
+
+if TYPE_CHECKING:
+    from .store import ResultsStore
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE = "checkpoint.json"
+JOURNAL_FILE = "checkpoint.jsonl"
+
+# A record that fails with one of these is skipped, so its run is executed again
+UNREADABLE_RECORD_ERRORS = (json.JSONDecodeError, KeyError, ValueError, *BLOB_READ_ERRORS)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist directory entries (renames, unlinks) where the platform allows it."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON to a temporary file and rename it over ``path``.
+
+    Readers see either the old file or the complete new one, never a
+    truncated write. The temporary name does not match ``*.json``.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+class CheckpointJournal:
+    """Append-only JSON Lines journal of finished runs.
+
+    Each result is written as one line and fsync'd, so checkpoint cost per run
+    is constant and a crash loses at most the run being written. ``compact()``
+    folds the journal into ``checkpoint.json`` once the evaluation is done.
+    """
+
+    def __init__(self, output_dir: Path, blobs: BlobStore | None = None):
+        """Initialize the journal.
+
+        Args:
+            output_dir: Evaluation output directory holding the checkpoint files
+            blobs: Blob store for generated code; records keep it inline if None
+        """
+        self.output_dir = output_dir
+        self.blobs = blobs
+        self.journal_path = output_dir / JOURNAL_FILE
+        self.checkpoint_path = output_dir / CHECKPOINT_FILE
+        self._file: IO[str] | None = None
+
+    def append(self, result: EvaluationResult) -> None:
+        """Durably append a finished run to the journal."""
+        self.append_many([result])
+
+    def append_many(self, results: list[EvaluationResult]) -> None:
+        """Durably append several finished runs with a single fsync."""
+        if not results:
+            return
+        if self._file is None:
+            self._file = open(self.journal_path, "a", encoding="utf-8")
+        self._file.write("".join(json.dumps(self._record(r)) + "\n" for r in results))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _record(self, result: EvaluationResult) -> dict[str, Any]:
+        data = result.to_dict()
+        return self.blobs.externalize(data) if self.blobs else data
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def compact(self, results: list[EvaluationResult]) -> None:
+        """Replace the journal with a single ``checkpoint.json``.
+
+        The new checkpoint is written to a temporary file, fsync'd and renamed
+        over the old one before the journal is removed. Readers merge both
+        files, so a crash at any point leaves a complete checkpoint.
+        """
+        self.close()
+
+        tmp_path = self.checkpoint_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump([self._record(r) for r in results], f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+        _fsync_directory(self.output_dir)
+
+        self.journal_path.unlink(missing_ok=True)
+        _fsync_directory(self.output_dir)
+
+
+@dataclass
+class _WriteRequest:
+    """A pending write: a JSON file to replace or a result to journal."""
+
+    path: Path | None = None
+    data: Any = None
+    result: EvaluationResult | None = None
+    is_result_record: bool = False
+
+
+class ResultWriter:
+    """Persist results on a dedicated thread, off the event loop.
+
+    Callers enqueue writes and return immediately. The writer thread drains
+    whatever is queued, coalesces repeated writes to the same file (the latest
+    data wins), appends all journal records with one fsync and serializes JSON
+    itself, so disk I/O never runs on the latency-measuring path. JSON files
+    are replaced atomically, so a crash never leaves a truncated one.
+    """
+
+    def __init__(
+        self,
+        journal: CheckpointJournal | None = None,
+        blobs: BlobStore | None = None,
+        store: ResultsStore | None = None,
+        max_batch: int = 64,
+    ):
+        """Start the writer thread.
+
+        Args:
+            journal: Checkpoint journal that ``append()`` records go to
+            blobs: Blob store that generated code in result records is moved to
+            store: Results store that ``append()`` records are also written to.
+                It is used and closed on the writer thread only.
+            max_batch: Maximum number of queued writes handled per batch
+        """
+        self.journal = journal
+        self.blobs = blobs
+        self.store = store
+        self.max_batch = max_batch
+        self._queue: queue.Queue[_WriteRequest | None] = queue.Queue()
+        self._error: Exception | None = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="result-writer", daemon=True)
+        self._thread.start()
+
+    def write_json(self, path: Path, data: Any) -> None:
+        """Queue ``data`` to be written as JSON to ``path``."""
+        self._put(_WriteRequest(path=path, data=data))
+
+    def write_result(self, path: Path, record: dict[str, Any]) -> None:
+        """Queue a result record to be written to ``path``, code stored as blobs."""
+        self._put(_WriteRequest(path=path, data=record, is_result_record=True))
+
+    def append(self, result: EvaluationResult) -> None:
+        """Queue a finished run for the checkpoint journal and results store."""
+        self._put(_WriteRequest(result=result))
+
+    def close(self) -> None:
+        """Flush all queued writes and stop the writer thread.
+
+        Raises:
+            RuntimeError: If any write failed
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+
+        if self._error is not None:
+            raise RuntimeError(f"Failed to persist results: {self._error}") from self._error
+
+    def _put(self, request: _WriteRequest) -> None:
+        if self._closed:
+            raise RuntimeError("ResultWriter is closed")
+        self._queue.put(request)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch and batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self._write_batch([request for request in batch if request is not None])
+            if batch[-1] is None:
+                if self.store is not None:
+                    self.store.close()
+                return
+
+    def _write_batch(self, batch: list[_WriteRequest]) -> None:
+        files: dict[Path, _WriteRequest] = {}
+        records: list[EvaluationResult] = []
+        for request in batch:
+            if request.result is not None:
+                records.append(request.result)
+            elif request.path is not None:
+                files[request.path] = request
+
+        try:
+            if records and self.journal:
+                self.journal.append_many(records)
+            if records and self.store is not None:
+                self.store.write(records)
+            for path, request in files.items():
+                data = request.data
+                if request.is_result_record and self.blobs:
+                    data = self.blobs.externalize(data)
+                _write_json_atomic(path, data)
+        except Exception as e:
+            logger.exception("Failed to persist evaluation results")
+            if self._error is None:
+                self._error = e
+
+
+def load_checkpoint(output_dir: Path, with_content: bool = True) -> list[EvaluationResult]:
+    """Load checkpointed results from either checkpoint format.
+
+    Reads the compacted ``checkpoint.json`` and then replays ``checkpoint.jsonl``
+    on top of it, so a run recorded in both files resolves to its latest
+    journal entry. A truncated final journal line (from a crash mid-write) is
+    skipped, as is any entry whose code blob is missing or damaged; runs
+    without a readable entry are executed again on resume. Generated code
+    stored in the blob store is read back transparently.
+
+    Args:
+        output_dir: Evaluation output directory
+        with_content: Load generated code referenced from the blob store
+
+    Returns:
+        Results in checkpoint order, one per (prompt, mode, run)
+    """
+    results: dict[tuple[str, str, int], EvaluationResult] = {}
+    blobs = BlobStore.for_output_dir(output_dir)
+
+    def to_result(item: dict[str, Any]) -> EvaluationResult:
+        return EvaluationResult.from_dict(blobs.resolve(item) if with_content else item)
+
+    checkpoint_path = output_dir / CHECKPOINT_FILE
+    if checkpoint_path.exists():
+        with open(checkpoint_path, encoding="utf-8") as f:
+            items = json.load(f)
+        for index, item in enumerate(items):
+            try:
+                result = to_result(item)
+            except UNREADABLE_RECORD_ERRORS as e:
+                logger.warning(f"Skipping unreadable checkpoint entry {index}: {e}")
+                continue
+            results[result.run_key] = result
+
+    journal_path = output_dir / JOURNAL_FILE
+    if journal_path.exists():
+        with open(journal_path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    result = to_result(json.loads(line))
+                except UNREADABLE_RECORD_ERRORS as e:
+                    logger.warning(f"Skipping unreadable checkpoint line {line_number}: {e}")
+                    continue
+                results[result.run_key] = result
+
+    return list(results.values())
+
+
+def has_checkpoint(output_dir: Path) -> bool:
+    """Check whether an output directory holds checkpoint data in either format."""
+    return (output_dir / CHECKPOINT_FILE).exists() or (output_dir / JOURNAL_FILE).exists()
+
+
+def load_output_results(output_dir: Path) -> list[EvaluationResult]:
+    """Load every run recorded in an output directory.
+
+    Merges the checkpoint with ``results/*.json``. Result files are written as
+    soon as a run finishes, so they win over an older checkpoint entry.
+
+    Args:
+        output_dir: Evaluation output directory
+
+    Returns:
+        Results, one per (prompt, mode, run)
+    """
+    results = {result.run_key: result for result in load_checkpoint(output_dir)}
+
+    for result_file in sorted((output_dir / "results").glob("*.json")):
+        try:
+            result = EvaluationResult.from_dict(read_result(result_file))
+        except UNREADABLE_RECORD_ERRORS as e:
+            logger.warning(f"Skipping unreadable result file {result_file.name}: {e}")
+            continue
+        results[result.run_key] = result
+
+    return list(results.values())
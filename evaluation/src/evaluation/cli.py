@@ -1,6 +1,7 @@
 """Command-line interface for the evaluation framework."""
 
 import asyncio
+import json
 import logging
 import sys
 from pathlib import Path
@@ -12,9 +13,22 @@ from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.table import Table
 
+from .checkpoint import has_checkpoint, load_output_results
 from .config import EvaluationConfig, PromptCategory, PromptConfiguration
-from .evaluator import AgentEvaluator
+from .dataset import ResultsDataset
+from .distributed import (
+    SHUTDOWN_GRACE,
+    EvaluationCoordinator,
+    EvaluationWorker,
+    ProtocolError,
+    parse_address,
+    spawn_local_workers,
+)
+from .evaluator import AgentEvaluator, check_plan_selection, load_evaluation_plan, plan_selection
+from .metrics import MetricsCollector
 from .report import ReportGenerator
+from .store import COLUMNS as STORE_COLUMNS
+from .store import RESULTS_DB, ResultsStore
 
 console = Console()
 
@@ -60,7 +74,13 @@ def cli(verbose: bool) -> None:
     default="./output",
     help="Output directory for results",
 )
-@click.option("--runs", "-r", type=int, default=50, help="Number of runs per prompt")
+@click.option(
+    "--runs",
+    "-r",
+    type=int,
+    default=None,
+    help="Number of runs per prompt (default: runs_per_prompt; the plan's with --resume)",
+)
 @click.option("--mock", "-m", is_flag=True, help="Use mock backend for testing")
 @click.option(
     "--category",
@@ -74,18 +94,57 @@ def cli(verbose: bool) -> None:
 @click.option(
     "--modes",
     type=click.Choice(["both", "sequential", "parallel"]),
-    default="both",
-    help="Which agent modes to evaluate",
+    default=None,
+    help="Which agent modes to evaluate (default: both; the plan's with --resume)",
+)
+@click.option(
+    "--resume",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Resume an interrupted evaluation from its output directory",
+)
+@click.option(
+    "--adaptive",
+    is_flag=True,
+    help="Stop sampling a prompt early once its stopping rule is met (see adaptive_sampling)",
+)
+@click.option(
+    "--metrics-port",
+    type=int,
+    default=None,
+    help="Serve live metrics in Prometheus format on this port (see metrics_port)",
+)
+@click.option(
+    "--serve",
+    is_flag=True,
+    help="Act as coordinator: hand runs out to workers instead of running them here",
+)
+@click.option(
+    "--listen",
+    default=None,
+    help="Coordinator address as host:port (default: coordinator_host/coordinator_port)",
+)
+@click.option(
+    "--local-workers",
+    type=int,
+    default=0,
+    help="Worker processes to start on this machine (implies --serve)",
 )
 def evaluate(
     config: Path,
     prompts: Path,
     output: Path,
-    runs: int,
+    runs: int | None,
     mock: bool,
     category: str,
     prompt_ids: list[str],
-    modes: str,
+    modes: str | None,
+    resume: Path | None,
+    adaptive: bool,
+    metrics_port: int | None,
+    serve: bool,
+    listen: str | None,
+    local_workers: int,
 ) -> None:
     """Run evaluation experiments."""
     console.print(
@@ -103,9 +162,23 @@ def evaluate(
         else:
             config_data = {}
 
+        # A resumed evaluation keeps the runs, modes and prompts of its plan
+        plan = load_evaluation_plan(resume) if resume is not None else None
+        planned_ids: list[str] = []
+        if plan is not None:
+            planned_runs, planned_modes, planned_ids = plan_selection(plan)
+            runs = planned_runs if runs is None else runs
+            modes = planned_modes if modes is None else modes
+        modes = modes or "both"
+
         # Override with CLI arguments
         config_data["output_dir"] = output
-        config_data["runs_per_prompt"] = runs
+        if runs is not None:
+            config_data["runs_per_prompt"] = runs
+        if adaptive:
+            config_data["adaptive_sampling"] = True
+        if metrics_port is not None:
+            config_data["metrics_port"] = metrics_port
 
         eval_config = EvaluationConfig(**config_data)
 
@@ -113,7 +186,9 @@ def evaluate(
         prompt_config = PromptConfiguration(prompts)
 
         # Filter prompts
-        if prompt_ids:
+        if plan is not None and not prompt_ids and category == "all":
+            selected_prompts = [p for p in prompt_config.prompts if p.id in planned_ids]
+        elif prompt_ids:
             selected_prompts = [p for p in prompt_config.prompts if p.id in prompt_ids]
         elif category != "all":
             selected_prompts = prompt_config.get_prompts_by_category(PromptCategory(category))
@@ -124,8 +199,19 @@ def evaluate(
             console.print("[red]No prompts selected for evaluation![/red]")
             sys.exit(1)
 
+        # Options that contradict the plan would change what is being resumed
+        if plan is not None:
+            check_plan_selection(
+                plan, eval_config.runs_per_prompt, modes, [p.id for p in selected_prompts]
+            )
+
         # Display evaluation plan
-        _display_evaluation_plan(selected_prompts, eval_config, mock, modes)
+        distributed = None
+        if serve or local_workers:
+            distributed = f"Coordinator with {local_workers} local workers"
+            if not local_workers:
+                distributed = "Coordinator (remote workers)"
+        _display_evaluation_plan(selected_prompts, eval_config, mock, modes, resume, distributed)
 
         # Confirm before proceeding
         if not click.confirm("Proceed with evaluation?"):
@@ -136,7 +222,23 @@ def evaluate(
         evaluator = AgentEvaluator(eval_config, use_mock=mock)
 
         # Run evaluation with selected modes
-        results = asyncio.run(evaluator.run_evaluation(selected_prompts, modes=modes))
+        if serve or local_workers:
+            results = asyncio.run(
+                _run_coordinated(
+                    evaluator,
+                    selected_prompts,
+                    modes=modes,
+                    resume=resume,
+                    listen=listen,
+                    local_workers=local_workers,
+                    config_path=config if config.exists() else None,
+                    mock=mock,
+                )
+            )
+        else:
+            results = asyncio.run(
+                evaluator.run_evaluation(selected_prompts, modes=modes, resume_dir=resume)
+            )
 
         # Generate report
         console.print("\n[bold]Generating report...[/bold]")
@@ -164,63 +266,188 @@ def evaluate(
         sys.exit(1)
 
 
+async def _run_coordinated(
+    evaluator: AgentEvaluator,
+    prompts: list,
+    modes: str,
+    resume: Path | None,
+    listen: str | None,
+    local_workers: int,
+    config_path: Path | None,
+    mock: bool,
+) -> list:
+    """Run an evaluation as coordinator, optionally with local worker processes."""
+    config = evaluator.config
+    if listen:
+        host, port = parse_address(listen, config.coordinator_port)
+    else:
+        host, port = config.coordinator_host, config.coordinator_port
+
+    coordinator = EvaluationCoordinator(
+        host=host, port=port, lease_timeout=config.lease_timeout, token=config.coordinator_token
+    )
+    await coordinator.start()
+
+    worker_host = "127.0.0.1" if host in ("", "0.0.0.0", "::") else host
+    workers = await spawn_local_workers(
+        local_workers,
+        worker_host,
+        coordinator.port,
+        str(config_path) if config_path else None,
+        mock,
+    )
+    if not workers:
+        console.print(
+            f"Waiting for workers: codecrdt-eval worker --connect {worker_host}:{coordinator.port}"
+        )
+
+    try:
+        return await evaluator.run_evaluation(
+            prompts, modes=modes, resume_dir=resume, coordinator=coordinator
+        )
+    finally:
+        for process in workers:
+            try:
+                await asyncio.wait_for(process.wait(), timeout=SHUTDOWN_GRACE)
+            except TimeoutError:
+                process.terminate()
+                await process.wait()
+
+
+@cli.command()
+@click.option("--connect", required=True, help="Coordinator address as host:port")
+@click.option(
+    "--config",
+    "-c",
+    type=click.Path(path_type=Path),
+    default="config.yaml",
+    help="Path to configuration file (backends, limits, coordinator token)",
+)
+@click.option("--mock", "-m", is_flag=True, help="Use mock backend for testing")
+@click.option(
+    "--slots",
+    type=int,
+    default=None,
+    help="Runs executed concurrently (default: max_concurrent_requests per backend)",
+)
+def worker(connect: str, config: Path, mock: bool, slots: int | None) -> None:
+    """Execute runs leased from an evaluation coordinator."""
+    if config.exists():
+        with open(config) as f:
+            config_data = yaml.safe_load(f) or {}
+    else:
+        config_data = {}
+    eval_config = EvaluationConfig(**config_data)
+
+    host, port = parse_address(connect, eval_config.coordinator_port)
+    evaluation_worker = EvaluationWorker(eval_config, host, port, slots=slots, use_mock=mock)
+    try:
+        asyncio.run(evaluation_worker.run())
+    except (ConnectionError, ProtocolError) as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument("results_dir", type=click.Path(exists=True, path_type=Path))
 def analyze(results_dir: Path) -> None:
     """Analyze existing evaluation results."""
     console.print(f"Analyzing results from: {results_dir}")
 
-    # Load checkpoint file
-    checkpoint_file = results_dir / "checkpoint.json"
-    if not checkpoint_file.exists():
+    report_config = {"confidence_level": 0.95, "generate_visualizations": True}
+
+    # Consolidated, cached table built from the results store or, for older
+    # runs, the checkpoint and result files
+    if not (ResultsStore.exists_in(results_dir) or has_checkpoint(results_dir)):
         console.print("[red]No checkpoint file found![/red]")
         sys.exit(1)
 
-    import json
-
-    with open(checkpoint_file) as f:
-        data = json.load(f)
-
-    # Convert to EvaluationResult objects
-    from datetime import datetime
-
-    from .config import AgentMode, EvaluationResult
-
-    results = []
-    for item in data:
-        result = EvaluationResult(
-            prompt_id=item["prompt_id"],
-            prompt_name=item["prompt_name"],
-            mode=AgentMode(item["mode"]),
-            run_number=item["run_number"],
-            timestamp=datetime.fromisoformat(item["timestamp"]),
-            response_time=item["response_time"],
-            total_tokens=item.get("total_tokens"),
-            response_content=item.get("response_content", ""),
-            error=item.get("error"),
-            overall_score=item.get("overall_score"),
-            code_quality_score=item.get("code_quality_score"),
-            architecture_score=item.get("architecture_score"),
-            performance_score=item.get("performance_score"),
-            accessibility_score=item.get("accessibility_score"),
-            metadata=item.get("metadata", {}),
-        )
-        results.append(result)
+    metrics = MetricsCollector.from_dataset(
+        ResultsDataset(results_dir), confidence_level=report_config["confidence_level"]
+    )
 
-    # Generate new report
+    # Generate new report; statistics come from the metrics DataFrame, and
+    # result objects are only loaded for the runs the report lists
     console.print("Generating analysis report...")
     report_gen = ReportGenerator(
-        results=results,
-        output_dir=results_dir,
-        config={"confidence_level": 0.95, "generate_visualizations": True},
+        results=None, output_dir=results_dir, config=report_config, metrics=metrics
     )
 
     report_gen.generate_full_report()
     console.print("[green]Analysis complete![/green]")
 
 
+@cli.group()
+def store() -> None:
+    """Manage the columnar results store (results.sqlite)."""
+
+
+@store.command("import")
+@click.argument("results_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
+def store_import(results_dir: Path) -> None:
+    """Build the results store of an existing evaluation run.
+
+    Reads the checkpoint and results/*.json files of RESULTS_DIR and writes
+    every run to RESULTS_DIR/results.sqlite.
+    """
+    results = load_output_results(results_dir)
+    if not results:
+        console.print("[red]No results found![/red]")
+        sys.exit(1)
+
+    with ResultsStore.for_output_dir(results_dir) as results_store:
+        written = results_store.write(results)
+    console.print(f"[green]Imported {written} runs into {results_dir / RESULTS_DB}[/green]")
+
+
+@store.command("export")
+@click.argument("results_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(["csv", "jsonl"]),
+    default="csv",
+    help="Export format",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Output file (default: RESULTS_DIR/results.<format>)",
+)
+def store_export(results_dir: Path, export_format: str, output: Path | None) -> None:
+    """Export the results store of an evaluation run.
+
+    CSV holds the scalar columns with code referenced by digest. JSON Lines
+    holds full result records with the generated code inline.
+    """
+    if not ResultsStore.exists_in(results_dir):
+        console.print("[red]No results store found! Run 'store import' first.[/red]")
+        sys.exit(1)
+
+    output = output or results_dir / f"results.{export_format}"
+    with ResultsStore.for_output_dir(results_dir) as results_store:
+        if export_format == "csv":
+            df = results_store.load_dataframe([name for name, _ in STORE_COLUMNS])
+            df.to_csv(output, index=False)
+            count = len(df)
+        else:
+            results = results_store.load_results(with_content=True)
+            with open(output, "w", encoding="utf-8") as f:
+                for result in results:
+                    f.write(json.dumps(result.to_dict()) + "\n")
+            count = len(results)
+    console.print(f"[green]Exported {count} runs to {output}[/green]")
+
+
 def _display_evaluation_plan(
-    prompts: list, config: EvaluationConfig, mock: bool, modes: str
+    prompts: list,
+    config: EvaluationConfig,
+    mock: bool,
+    modes: str,
+    resume: Path | None = None,
+    distributed: str | None = None,
 ) -> None:
     """Display the evaluation plan."""
     table = Table(title="Evaluation Plan", show_header=True)
@@ -229,7 +456,7 @@ def _display_evaluation_plan(
 
     # Add configuration details
     table.add_row("Backend Mode", "Mock" if mock else "Live")
-    table.add_row("Backend URL", config.backend_url)
+    table.add_row("Backend URL", ", ".join(config.get_backend_urls()))
     table.add_row("Number of Prompts", str(len(prompts)))
     table.add_row("Runs per Prompt", str(config.runs_per_prompt))
 
@@ -244,7 +471,22 @@ def _display_evaluation_plan(
 
     num_modes = 2 if modes == "both" else 1
     total_evals = len(prompts) * config.runs_per_prompt * num_modes
-    table.add_row("Total Evaluations", str(total_evals))
+    maximum = " (maximum)" if config.adaptive_sampling else ""
+    table.add_row("Total Evaluations", f"{total_evals}{maximum}")
+    if config.adaptive_sampling:
+        if config.sampling_rule == "ci_width":
+            rule = f"CI width of {config.sampling_metric} <= {config.sampling_target_ci_width:g}"
+        else:
+            rule = f"O'Brien-Fleming boundary on {config.sampling_metric}"
+        table.add_row("Adaptive Sampling", f"{rule}, looks every {config.sampling_batch_size} runs")
+    if config.scheduling == "longest_first":
+        table.add_row(
+            "Scheduling", f"Longest first within blocks of {config.schedule_block_runs} run(s)"
+        )
+    if resume:
+        table.add_row("Resume From", str(resume))
+    if distributed:
+        table.add_row("Execution", distributed)
 
     estimated_time = total_evals * 10 / 60  # Assume 10 seconds per eval
     table.add_row("Estimated Time", f"~{estimated_time:.1f} minutes")
@@ -3,16 +3,581 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import time
 import uuid
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
 from typing import Any
 
-from aiohttp import ClientError, ClientSession, ClientTimeout
+from aiohttp import (
+    ClientError,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionCreateStartParams,
+    TraceRequestEndParams,
+    TraceRequestStartParams,
+)
 from asyncio_throttle import Throttler
 
 logger = logging.getLogger(__name__)
 
+# Task statuses after which the backend no longer updates a task
+TERMINAL_TASK_STATUSES = ("completed", "failed")
+
+# Upper bound on how long a single long-poll request asks the backend to wait
+LONG_POLL_TIMEOUT = 30.0
+
+# Overall wait budget for one task
+TASK_WAIT_TIMEOUT = 1200.0
+
+# Timeout for a single backend health check, seconds
+HEALTH_CHECK_TIMEOUT = 5.0
+
+# Backend task lifecycle timestamps (JSON key -> response key)
+TASK_TIMESTAMPS = {
+    "createdAt": "created_at",
+    "startedAt": "started_at",
+    "finishedAt": "finished_at",
+}
+
+# Seconds between batched status requests, and max task IDs per request
+BATCH_POLL_INTERVAL = 1.0
+BATCH_POLL_MAX_IDS = 100
+
+# Consecutive failed polling ticks before the waiters are failed; fewer are retried
+BATCH_POLL_MAX_FAILURES = 5
+
+
+class PhaseTimings:
+    """Monotonic-clock durations of the phases of one run, in seconds."""
+
+    def __init__(self) -> None:
+        """Initialize with no phases recorded."""
+        self.timings: dict[str, float] = {}
+
+    def record(self, phase: str, duration: float) -> None:
+        """Add a duration to a phase; phases entered repeatedly accumulate."""
+        self.timings[phase] = self.timings.get(phase, 0.0) + duration
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the block as a phase, including when it raises."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, time.monotonic() - start)
+
+    def request(self, phase: str) -> RequestTrace:
+        """Trace context that records transport timings of a request under a phase."""
+        return RequestTrace(self, phase)
+
+
+@dataclass
+class RequestTrace:
+    """Per-request trace context, passed to aiohttp as ``trace_request_ctx``."""
+
+    timings: PhaseTimings
+    phase: str
+
+
+def create_request_tracing() -> TraceConfig:
+    """Create a trace config recording transport timings of traced requests.
+
+    Requests passing a ``RequestTrace`` as ``trace_request_ctx`` get
+    ``<phase>_connect`` (time to open a new connection, 0 when a pooled one is
+    reused) and ``<phase>_first_byte`` (request start until the response
+    headers arrive). Other requests are not affected.
+    """
+
+    def request_trace(context: SimpleNamespace) -> RequestTrace | None:
+        trace = getattr(context, "trace_request_ctx", None)
+        return trace if isinstance(trace, RequestTrace) else None
+
+    async def on_request_start(
+        session: ClientSession, context: SimpleNamespace, params: TraceRequestStartParams
+    ) -> None:
+        context.request_start = time.monotonic()
+
+    async def on_connection_create_start(
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionCreateStartParams,
+    ) -> None:
+        context.connect_start = time.monotonic()
+
+    async def on_connection_create_end(
+        session: ClientSession, context: SimpleNamespace, params: TraceConnectionCreateEndParams
+    ) -> None:
+        trace = request_trace(context)
+        if trace:
+            trace.timings.record(f"{trace.phase}_connect", time.monotonic() - context.connect_start)
+
+    async def on_request_end(
+        session: ClientSession, context: SimpleNamespace, params: TraceRequestEndParams
+    ) -> None:
+        trace = request_trace(context)
+        if trace:
+            # Adds nothing when a new connection was opened, else marks reuse
+            trace.timings.record(f"{trace.phase}_connect", 0.0)
+            trace.timings.record(
+                f"{trace.phase}_first_byte", time.monotonic() - context.request_start
+            )
+
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
+
+
+def task_timestamps(task_data: dict[str, Any]) -> dict[str, datetime]:
+    """Parse the lifecycle timestamps of a backend task payload.
+
+    Backends that predate ``startedAt``/``finishedAt`` yield only the ones
+    they report; unparsable values are skipped.
+
+    Returns:
+        Timestamps by ``created_at``, ``started_at`` and ``finished_at``
+    """
+    timestamps = {}
+    for key, name in TASK_TIMESTAMPS.items():
+        value = task_data.get(key)
+        if not isinstance(value, str):
+            continue
+        try:
+            timestamps[name] = datetime.fromisoformat(value)
+        except ValueError:
+            continue
+    return timestamps
+
+
+def token_usage(task_data: dict[str, Any]) -> dict[str, Any] | None:
+    """Extract the token counts of a backend task payload.
+
+    Returns:
+        ``input_tokens``, ``output_tokens`` and per-agent counts under
+        ``agents``, or None if the backend reported no usage
+    """
+    usage = task_data.get("usage")
+    if not isinstance(usage, dict):
+        return None
+
+    def counts(data: dict[str, Any]) -> dict[str, int]:
+        return {
+            "input_tokens": int(data.get("inputTokens", 0)),
+            "output_tokens": int(data.get("outputTokens", 0)),
+        }
+
+    return {
+        **counts(usage),
+        "agents": {
+            agent: {**counts(data), "calls": int(data.get("calls", 0))}
+            for agent, data in (usage.get("agents") or {}).items()
+        },
+    }
+
+
+def record_backend_timings(
+    timings: PhaseTimings, timestamps: dict[str, datetime], task_wait: float
+) -> None:
+    """Split the observed task wait into backend queue wait, processing and lag.
+
+    Backend durations are differences of backend timestamps, so clock skew
+    between client and backend does not affect them. ``completion_lag`` is
+    what remains of the client's wait: polling delay and network round trips.
+    """
+    created = timestamps.get("created_at")
+    started = timestamps.get("started_at")
+    finished = timestamps.get("finished_at")
+    if created and started:
+        timings.record("backend_queue_wait", (started - created).total_seconds())
+    if started and finished:
+        timings.record("backend_processing", (finished - started).total_seconds())
+    if created and finished:
+        # Timestamps have millisecond resolution; never report a negative lag
+        backend_time = (finished - created).total_seconds()
+        timings.record("completion_lag", max(task_wait - backend_time, 0.0))
+
+
+def create_pooled_session(
+    timeout: int = 120,
+    pool_size: int = 100,
+    pool_size_per_host: int = 0,
+    keepalive_timeout: float = 30.0,
+    dns_cache_ttl: int = 300,
+) -> ClientSession:
+    """Create an aiohttp session backed by a keep-alive connection pool.
+
+    A single session is meant to be shared by every request of an evaluation
+    so that warm TCP connections to the backend are reused. Requests can opt
+    into transport timings, see ``create_request_tracing``.
+
+    Args:
+        timeout: Request timeout in seconds (default: 120).
+        pool_size: Maximum number of open connections, 0 for unlimited (default: 100).
+        pool_size_per_host: Maximum connections per host, 0 for unlimited (default: 0).
+        keepalive_timeout: Seconds an idle connection is kept open (default: 30.0).
+        dns_cache_ttl: Seconds resolved addresses are cached (default: 300).
+
+    Returns:
+        A new client session. The caller is responsible for closing it.
+    """
+    connector = TCPConnector(
+        limit=pool_size,
+        limit_per_host=pool_size_per_host,
+        keepalive_timeout=keepalive_timeout,
+        ttl_dns_cache=dns_cache_ttl,
+    )
+    return ClientSession(
+        timeout=ClientTimeout(total=timeout),
+        connector=connector,
+        trace_configs=[create_request_tracing()],
+    )
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Check whether an exception signals backend or provider overload.
+
+    HTTP 429 and 5xx responses as well as timeouts count as overload.
+    """
+    if isinstance(error, ClientResponseError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, TimeoutError)
+
+
+def error_code(error: BaseException) -> str:
+    """Classify a request failure for error counters.
+
+    Returns:
+        The HTTP status for error responses, "timeout", "connection" for other
+        transport errors, or the exception type name.
+    """
+    if isinstance(error, ClientResponseError):
+        return str(error.status)
+    if isinstance(error, TimeoutError):
+        return "timeout"
+    if isinstance(error, ClientError):
+        return "connection"
+    return type(error).__name__
+
+
+class AIMDController:
+    """Additive-increase/multiplicative-decrease controller for a concurrency limit.
+
+    The limit grows by one after a full window of healthy completions (as many
+    as the current limit) and is multiplied by ``backoff_factor`` on an overload
+    signal: an HTTP 429/5xx, a timeout, or a latency above ``latency_tolerance``
+    times the smoothed baseline. After a decrease, further signals are ignored
+    until the requests admitted under the old limit have completed, so one
+    overload episode is only counted once. Spikes are folded into the baseline
+    as well, so a lasting shift in latency backs off only until the baseline
+    has caught up with it.
+
+    Attributes:
+        limit: Current concurrency limit.
+        min_limit: Lower bound for the limit.
+        max_limit: Upper bound for the limit.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        latency_tolerance: float = 2.0,
+        backoff_factor: float = 0.5,
+        smoothing: float = 0.2,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            initial_limit: Starting limit, clamped to [min_limit, max_limit].
+            min_limit: Lower bound for the limit (default: 1).
+            max_limit: Upper bound for the limit (default: 16).
+            latency_tolerance: Latency spike threshold as a multiple of the
+                baseline (default: 2.0).
+            backoff_factor: Multiplier applied on overload (default: 0.5).
+            smoothing: EWMA weight of new latency samples (default: 0.2).
+        """
+        self.min_limit = min_limit
+        self.max_limit = max(min_limit, max_limit)
+        self.limit = min(max(initial_limit, self.min_limit), self.max_limit)
+        self.latency_tolerance = latency_tolerance
+        self.backoff_factor = backoff_factor
+        self.smoothing = smoothing
+        self._baselines: dict[str | None, float] = {}
+        self._healthy_in_window = 0
+        self._cooldown = 0
+
+    def on_success(self, latency: float, key: str | None = None) -> None:
+        """Record a completed request and its latency.
+
+        Args:
+            latency: Request latency in seconds.
+            key: Workload class the latency baseline is tracked for, so that
+                slow prompts are not mistaken for spikes on fast ones.
+        """
+        baseline = self._baselines.get(key)
+        self._baselines[key] = (
+            latency
+            if baseline is None
+            else (1 - self.smoothing) * baseline + self.smoothing * latency
+        )
+
+        if baseline is not None and latency > baseline * self.latency_tolerance:
+            self.on_overload()
+            return
+
+        if self._cooldown > 0:
+            self._cooldown -= 1
+            return
+
+        self._healthy_in_window += 1
+        if self._healthy_in_window >= self.limit:
+            self.limit = min(self.limit + 1, self.max_limit)
+            self._healthy_in_window = 0
+
+    def on_overload(self) -> None:
+        """Record an overload signal and back off."""
+        if self._cooldown > 0:
+            self._cooldown -= 1
+            return
+
+        previous = self.limit
+        self.limit = max(int(self.limit * self.backoff_factor), self.min_limit)
+        self._healthy_in_window = 0
+        self._cooldown = previous
+        if self.limit != previous:
+            logger.info(f"Overload detected, concurrency limit {previous} -> {self.limit}")
+
+
+class AdmissionLimiter:
+    """Count- and rate-based admission control for one stage of requests.
+
+    Used as an async context manager around each request of the stage; entering
+    returns the concurrency limit in effect at admission. The concurrency slot
+    is held for the whole block, while the rate limit only counts admissions.
+    With a controller attached, the concurrency limit follows the controller.
+
+    Attributes:
+        max_concurrent: Maximum requests in flight, or None for unlimited.
+        requests_per_minute: Maximum admissions per minute, or None for unlimited.
+        controller: Optional adaptive controller driving ``max_concurrent``.
+        in_flight: Number of requests currently admitted.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int | None = None,
+        requests_per_minute: int | None = None,
+        controller: AIMDController | None = None,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_concurrent: Maximum requests in flight (default: unlimited).
+            requests_per_minute: Maximum admissions per minute (default: unlimited).
+            controller: Adaptive controller that overrides ``max_concurrent``.
+        """
+        self.controller = controller
+        self.max_concurrent = controller.limit if controller else max_concurrent
+        self.requests_per_minute = requests_per_minute
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+        self._throttler = (
+            Throttler(rate_limit=requests_per_minute, period=60.0) if requests_per_minute else None
+        )
+
+    def _has_capacity(self) -> bool:
+        return self.max_concurrent is None or self.in_flight < self.max_concurrent
+
+    async def __aenter__(self) -> int | None:
+        """Wait for a concurrency slot, then for the rate limit."""
+        async with self._condition:
+            await self._condition.wait_for(self._has_capacity)
+            self.in_flight += 1
+            limit = self.max_concurrent
+
+        try:
+            if self._throttler:
+                await self._throttler.acquire()
+        except BaseException:
+            await self._release()
+            raise
+        return limit
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any | None,
+    ) -> None:
+        """Release the concurrency slot."""
+        await self._release()
+
+    async def _release(self) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    async def record_success(self, latency: float, key: str | None = None) -> None:
+        """Feed a successful request's latency to the controller, if any."""
+        if self.controller:
+            self.controller.on_success(latency, key)
+            await self._apply_limit()
+
+    async def record_overload(self) -> None:
+        """Feed an overload signal to the controller, if any."""
+        if self.controller:
+            self.controller.on_overload()
+            await self._apply_limit()
+
+    async def _apply_limit(self) -> None:
+        assert self.controller is not None
+        async with self._condition:
+            self.max_concurrent = self.controller.limit
+            self._condition.notify_all()
+
+
+class TaskStatusPoller:
+    """Shared status poller for all in-flight tasks of a client.
+
+    Instead of one ``GET /api/v1/tasks/{id}`` loop per task, every pending task
+    is covered by a single ``GET /api/v1/tasks?ids=...`` request per tick, so
+    request volume stays flat as concurrency grows. A failed tick is retried
+    on the next one; waiters only fail once ``max_failures`` ticks in a row
+    have failed, or when their own wait budget runs out.
+
+    Attributes:
+        client: The backend client whose session is used for requests.
+        interval: Seconds between polling ticks.
+        max_failures: Consecutive failed ticks before waiters are failed.
+    """
+
+    def __init__(
+        self,
+        client: BackendClient,
+        interval: float = BATCH_POLL_INTERVAL,
+        max_failures: int = BATCH_POLL_MAX_FAILURES,
+    ) -> None:
+        """Initialize the poller.
+
+        Args:
+            client: The backend client whose session is used for requests.
+            interval: Seconds between polling ticks (default: 1.0).
+            max_failures: Consecutive failed ticks before waiters are failed
+                (default: 5).
+        """
+        self.client = client
+        self.interval = interval
+        self.max_failures = max_failures
+        self._pending: dict[str, asyncio.Future[dict[str, Any] | None]] = {}
+        self._last_seen: dict[str, dict[str, Any]] = {}
+        self._runner: asyncio.Task[None] | None = None
+
+    async def wait(self, task_id: str) -> dict[str, Any] | None:
+        """Wait until a task is completed or failed.
+
+        Args:
+            task_id: The ID of the task to wait for.
+
+        Returns:
+            The final task payload, the last payload seen if the wait budget
+            ran out, or None if the task was not found.
+        """
+        future = self._pending.get(task_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[task_id] = future
+
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._run())
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), TASK_WAIT_TIMEOUT)
+        except TimeoutError:
+            return self._last_seen.get(task_id)
+        finally:
+            self._pending.pop(task_id, None)
+            self._last_seen.pop(task_id, None)
+
+    async def close(self) -> None:
+        """Stop the polling loop."""
+        if self._runner and not self._runner.done():
+            self._runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._runner
+        self._runner = None
+
+    async def _run(self) -> None:
+        """Poll all pending tasks once per tick until none remain."""
+        failures = 0
+        while self._pending:
+            await asyncio.sleep(self.interval)
+
+            task_ids = [tid for tid, fut in self._pending.items() if not fut.done()]
+            try:
+                for i in range(0, len(task_ids), BATCH_POLL_MAX_IDS):
+                    await self._poll_batch(task_ids[i : i + BATCH_POLL_MAX_IDS])
+            except Exception as e:
+                failures += 1
+                if failures < self.max_failures:
+                    # Transient errors (a dropped connection, a 502) are retried next tick
+                    logger.warning(
+                        f"Task status poll failed ({failures}/{self.max_failures}), "
+                        f"retrying: {e}"
+                    )
+                    continue
+                # A persistently broken backend fails every waiter rather than
+                # letting them hang until their wait budget runs out
+                for future in self._pending.values():
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            failures = 0
+
+    async def _poll_batch(self, task_ids: list[str]) -> None:
+        """Fetch the status of a batch of tasks and resolve finished ones.
+
+        Args:
+            task_ids: IDs of the pending tasks to query.
+        """
+        session = self.client.session
+        if not session:
+            raise RuntimeError("Session not initialized. Use async context manager.")
+
+        async with session.get(
+            f"{self.client.base_url}/api/v1/tasks", params={"ids": ",".join(task_ids)}
+        ) as response:
+            response.raise_for_status()
+            tasks = await response.json()
+
+        by_id = {task.get("id"): task for task in tasks}
+        for task_id in task_ids:
+            future = self._pending.get(task_id)
+            if future is None or future.done():
+                continue
+
+            task_data = by_id.get(task_id)
+            if task_data is None:
+                # Task not found, might be completed and cleaned up
+                future.set_result(None)
+            elif task_data.get("status") in TERMINAL_TASK_STATUSES:
+                future.set_result(task_data)
+            else:
+                self._last_seen[task_id] = task_data
+
 
 class BackendClient:
     """Client for interacting with the collaborative agents backend via HTTP API.
@@ -23,8 +588,13 @@ class BackendClient:
     Attributes:
         base_url: The base URL for HTTP requests.
         timeout: Request timeout in seconds.
-        throttler: Rate limiter for concurrent requests.
+        generation_limiter: Admission control for code generation tasks.
+        evaluation_limiter: Admission control for LLM-judge evaluation calls.
         session: The aiohttp client session.
+        long_poll_supported: Whether the backend exposes the task long-poll
+            endpoint. Cleared on first use against a backend without it.
+        status_poller: Shared batched poller used when long-poll is unavailable.
+        error_counts: Failed requests by (operation, error code), see ``error_code``.
     """
 
     def __init__(
@@ -32,6 +602,14 @@ class BackendClient:
         base_url: str,
         timeout: int = 120,
         max_concurrent: int = 1,
+        use_long_poll: bool = True,
+        session: ClientSession | None = None,
+        generation_concurrency: int | None = None,
+        generation_rpm: int | None = None,
+        evaluation_concurrency: int | None = None,
+        evaluation_rpm: int | None = None,
+        generation_controller: AIMDController | None = None,
+        evaluation_controller: AIMDController | None = None,
     ) -> None:
         """Initialize the backend client.
 
@@ -39,11 +617,39 @@ class BackendClient:
             base_url: Base URL for HTTP requests (e.g., "http://localhost:3001").
             timeout: Request timeout in seconds (default: 120).
             max_concurrent: Maximum concurrent requests (default: 1).
+            use_long_poll: Wait for task completion via the backend's long-poll
+                endpoint instead of polling (default: True).
+            session: Shared session to use instead of creating one. A shared
+                session is left open on exit; its owner closes it.
+            generation_concurrency: Maximum generation tasks in flight
+                (default: max_concurrent).
+            generation_rpm: Maximum generation tasks started per minute
+                (default: unlimited).
+            evaluation_concurrency: Maximum evaluation calls in flight
+                (default: max_concurrent).
+            evaluation_rpm: Maximum evaluation calls started per minute
+                (default: unlimited).
+            generation_controller: Adaptive controller for the generation
+                concurrency limit; overrides generation_concurrency.
+            evaluation_controller: Adaptive controller for the evaluation
+                concurrency limit; overrides evaluation_concurrency.
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = ClientTimeout(total=timeout)
-        self.throttler = Throttler(rate_limit=max_concurrent)
-        self.session: ClientSession | None = None
+        self._timeout_seconds = timeout
+        self.generation_limiter = AdmissionLimiter(
+            generation_concurrency or max_concurrent, generation_rpm, generation_controller
+        )
+        self.evaluation_limiter = AdmissionLimiter(
+            evaluation_concurrency or max_concurrent, evaluation_rpm, evaluation_controller
+        )
+        self.session: ClientSession | None = session
+        self._owns_session = session is None
+        self.long_poll_supported = use_long_poll
+        self.status_poller = TaskStatusPoller(self)
+        # Leave headroom below the total request timeout for the response itself
+        self.long_poll_timeout = min(LONG_POLL_TIMEOUT, timeout / 2)
+        self.error_counts: Counter[tuple[str, str]] = Counter()
 
     async def __aenter__(self) -> BackendClient:
         """Async context manager entry.
@@ -51,7 +657,8 @@ class BackendClient:
         Returns:
             Self reference for use in async with statements.
         """
-        self.session = ClientSession(timeout=self.timeout)
+        if self._owns_session:
+            self.session = create_pooled_session(timeout=self._timeout_seconds)
         return self
 
     async def __aexit__(
@@ -67,9 +674,31 @@ class BackendClient:
             exc_val: Exception value if an exception occurred.
             exc_tb: Exception traceback if an exception occurred.
         """
-        if self.session:
+        await self.status_poller.close()
+        if self.session and self._owns_session:
             await self.session.close()
 
+    async def check_health(self) -> bool:
+        """Check whether the backend reports itself healthy.
+
+        Returns:
+            True if ``GET /api/v1/health`` succeeded with status "healthy".
+        """
+        if not self.session:
+            raise RuntimeError("Session not initialized. Use async context manager.")
+
+        try:
+            async with self.session.get(
+                f"{self.base_url}/api/v1/health", timeout=ClientTimeout(total=HEALTH_CHECK_TIMEOUT)
+            ) as response:
+                if response.status != 200:
+                    return False
+                data = await response.json()
+                return bool(data.get("status") == "healthy")
+        except Exception as e:
+            logger.warning(f"Health check failed for {self.base_url}: {e}")
+            return False
+
     async def create_document(self) -> str:
         """Create a new room ID for collaboration.
 
@@ -80,7 +709,11 @@ class BackendClient:
         return f"eval_room_{uuid.uuid4().hex[:12]}"
 
     async def send_prompt(
-        self, document_id: str, prompt: str, mode: str = "sequential"
+        self,
+        document_id: str,
+        prompt: str,
+        mode: str = "sequential",
+        prompt_id: str | None = None,
     ) -> dict[str, Any]:
         """Send a prompt to generate code via the tasks API.
 
@@ -88,6 +721,8 @@ class BackendClient:
             document_id: The room ID for the task.
             prompt: The prompt text for code generation.
             mode: Execution mode ("sequential" or "parallel").
+            prompt_id: ID of the prompt; the adaptive concurrency controller
+                tracks latency per mode and prompt ID (per mode without one).
 
         Returns:
             A dictionary containing the response data, including:
@@ -98,18 +733,61 @@ class BackendClient:
             - error: Error message if any
             - elapsed_time: Time taken in seconds
             - success: Whether the task succeeded
+            - concurrency_limit: Generation concurrency limit at admission
+            - timings: Monotonic durations of the generation phases, seconds
+            - backend_timestamps: The task's created/started/finished times as
+              reported by the backend, ISO 8601
+            - usage: Input/output tokens in total and per agent, see
+              ``token_usage`` (None if the backend does not report them)
         """
-        async with self.throttler:
-            if not self.session:
-                raise RuntimeError("Session not initialized. Use async context manager.")
+        timings = PhaseTimings()
+        admission_start = time.monotonic()
+        async with self.generation_limiter as concurrency_limit:
+            timings.record("generation_admission", time.monotonic() - admission_start)
+            response = await self._run_generation_task(
+                document_id, prompt, mode, timings, prompt_id
+            )
+
+        response["concurrency_limit"] = concurrency_limit
+        response["timings"] = timings.timings
+        return response
+
+    async def _run_generation_task(
+        self,
+        document_id: str,
+        prompt: str,
+        mode: str,
+        timings: PhaseTimings,
+        prompt_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Create a generation task, wait for it and fetch the room text.
 
-            start_time = time.time()
+        Called with a generation slot held; see ``send_prompt``. Each phase is
+        recorded in ``timings``; whatever ``elapsed_time`` the phases do not
+        cover is recorded as ``client_overhead``.
+        """
+        if not self.session:
+            raise RuntimeError("Session not initialized. Use async context manager.")
 
-            try:
-                # Map mode to agentName
-                agent_name = "sequential" if mode == "sequential" else "outliner"
+        start_time = time.monotonic()
+
+        def failure(error: str) -> dict[str, Any]:
+            return {
+                "document_id": document_id,
+                "mode": mode,
+                "prompt": prompt,
+                "content": "",
+                "error": error,
+                "elapsed_time": time.monotonic() - start_time,
+                "success": False,
+            }
+
+        try:
+            # Map mode to agentName
+            agent_name = "sequential" if mode == "sequential" else "outliner"
 
-                # Create task via /api/v1/tasks endpoint
+            # Create task via /api/v1/tasks endpoint
+            with timings.phase("task_create"):
                 async with self.session.post(
                     f"{self.base_url}/api/v1/tasks",
                     json={
@@ -117,84 +795,132 @@ class BackendClient:
                         "prompt": prompt,
                         "agentName": agent_name,
                     },
+                    trace_request_ctx=timings.request("task_create"),
                 ) as response:
                     response.raise_for_status()
                     result = await response.json()
                     task_id = result.get("taskId")
 
-                    if not task_id:
-                        return {
-                            "document_id": document_id,
-                            "mode": mode,
-                            "prompt": prompt,
-                            "content": "",
-                            "error": "Failed to create task",
-                            "elapsed_time": time.time() - start_time,
-                            "success": False,
-                        }
-
-                    # Poll for task completion with exponential backoff
-                    poll_interval = 0.5  # Start with 500ms
-                    max_polls = 240  # Max 2 minutes total
-                    for attempt in range(max_polls):
-                        await asyncio.sleep(poll_interval)
-
-                        async with self.session.get(
-                            f"{self.base_url}/api/v1/tasks/{task_id}"
-                        ) as task_response:
-                            if task_response.status == 404:
-                                # Task not found, might be completed and cleaned up
-                                break
-
-                            task_response.raise_for_status()
-                            task_data = await task_response.json()
-
-                            if task_data.get("status") == "completed":
-                                break
-                            elif task_data.get("status") == "failed":
-                                return {
-                                    "document_id": document_id,
-                                    "mode": mode,
-                                    "prompt": prompt,
-                                    "content": "",
-                                    "error": task_data.get("error", "Task failed"),
-                                    "elapsed_time": time.time() - start_time,
-                                    "success": False,
-                                }
-
-                        # Exponential backoff with max of 5 seconds
-                        poll_interval = min(poll_interval * 1.1, 5.0)
-
-                    # Get the generated content from the room
-                    content = await self._get_room_text(document_id)
+            if not task_id:
+                return failure("Failed to create task")
 
-                    return {
-                        "document_id": document_id,
-                        "mode": mode,
-                        "prompt": prompt,
-                        "content": content,
-                        "error": None,
-                        "elapsed_time": time.time() - start_time,
-                        "success": True,
-                    }
+            with timings.phase("task_wait"):
+                task_data = await self._wait_for_task(task_id)
+            timestamps = task_timestamps(task_data or {})
+            record_backend_timings(timings, timestamps, timings.timings["task_wait"])
+            backend_timestamps = {name: ts.isoformat() for name, ts in timestamps.items()}
+            usage = token_usage(task_data or {})
 
-            except Exception as e:
-                logger.error(f"Failed to send prompt: {e}")
+            if task_data and task_data.get("status") == "failed":
+                self.error_counts["generation", "task_failed"] += 1
                 return {
-                    "document_id": document_id,
-                    "mode": mode,
-                    "prompt": prompt,
-                    "content": "",
-                    "error": str(e),
-                    "elapsed_time": time.time() - start_time,
-                    "success": False,
+                    **failure(task_data.get("error", "Task failed")),
+                    "backend_timestamps": backend_timestamps,
+                    "usage": usage,
                 }
 
-    async def _get_room_text(self, room_id: str) -> str:
+            # Get the generated content from the room
+            with timings.phase("room_text"):
+                content = await self._get_room_text(
+                    document_id, trace=timings.request("room_text")
+                )
+
+            elapsed_time = time.monotonic() - start_time
+            timings.record(
+                "client_overhead",
+                elapsed_time
+                - sum(timings.timings[p] for p in ("task_create", "task_wait", "room_text")),
+            )
+            key = f"{mode}:{prompt_id}" if prompt_id else mode
+            await self.generation_limiter.record_success(elapsed_time, key=key)
+
+            return {
+                "document_id": document_id,
+                "mode": mode,
+                "prompt": prompt,
+                "content": content,
+                "error": None,
+                "elapsed_time": elapsed_time,
+                "success": True,
+                "backend_timestamps": backend_timestamps,
+                "usage": usage,
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to send prompt: {e}")
+            self.error_counts["generation", error_code(e)] += 1
+            if is_overload_error(e):
+                await self.generation_limiter.record_overload()
+            return failure(str(e))
+
+    async def _wait_for_task(self, task_id: str) -> dict[str, Any] | None:
+        """Wait until a task is completed or failed.
+
+        Uses the long-poll endpoint when the backend supports it and falls
+        back to the shared batched status poller otherwise.
+
+        Args:
+            task_id: The ID of the task to wait for.
+
+        Returns:
+            The last task payload seen, or None if the task was not found.
+        """
+        if self.long_poll_supported:
+            task_data = await self._long_poll_task(task_id)
+            if self.long_poll_supported:
+                return task_data
+
+        return await self.status_poller.wait(task_id)
+
+    async def _long_poll_task(self, task_id: str) -> dict[str, Any] | None:
+        """Wait for task completion via ``GET /api/v1/tasks/{id}/wait``.
+
+        Each request returns as soon as the task status changes, so completion
+        is observed without polling delay.
+
+        Args:
+            task_id: The ID of the task to wait for.
+
+        Returns:
+            The last task payload seen, or None if the task or the endpoint
+            was not found. ``long_poll_supported`` is cleared in the latter case.
+        """
+        if not self.session:
+            raise RuntimeError("Session not initialized. Use async context manager.")
+
+        status = "pending"
+        task_data: dict[str, Any] | None = None
+        deadline = time.monotonic() + TASK_WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            async with self.session.get(
+                f"{self.base_url}/api/v1/tasks/{task_id}/wait",
+                params={"since": status, "timeout": str(int(self.long_poll_timeout * 1000))},
+            ) as response:
+                if response.status == 404:
+                    try:
+                        data = await response.json(content_type=None)
+                    except ValueError:
+                        data = None
+                    if not isinstance(data, dict) or data.get("error") != "Task not found":
+                        logger.info("Backend has no long-poll endpoint, falling back to polling")
+                        self.long_poll_supported = False
+                    return None
+
+                response.raise_for_status()
+                task_data = await response.json()
+
+            status = task_data.get("status", status)
+            if status in TERMINAL_TASK_STATUSES:
+                break
+
+        return task_data
+
+    async def _get_room_text(self, room_id: str, trace: RequestTrace | None = None) -> str:
         """Get the current text content of a room.
 
         Args:
             room_id: The ID of the room to retrieve.
+            trace: Records transport timings of the request, see ``create_request_tracing``.
 
         Returns:
             The room text content as a string.
@@ -203,13 +929,16 @@ class BackendClient:
             return ""
 
         try:
-            async with self.session.get(f"{self.base_url}/api/v1/rooms/{room_id}/text") as response:
+            async with self.session.get(
+                f"{self.base_url}/api/v1/rooms/{room_id}/text", trace_request_ctx=trace
+            ) as response:
                 response.raise_for_status()
                 data = await response.json()
                 content: str = data.get("text", "")
                 return content
         except Exception as e:
             logger.error(f"Failed to get room text: {e}")
+            self.error_counts["room_text", error_code(e)] += 1
             return ""
 
     async def evaluate_code(self, code: str) -> dict[str, Any]:
@@ -228,43 +957,154 @@ class BackendClient:
             - accessibility: Accessibility score
             - summary: Summary text
             - error: Error message if evaluation failed
+            - concurrency_limit: Evaluation concurrency limit at admission
+            - timings: Monotonic durations of the evaluation phases, seconds
         """
-        async with self.throttler:
-            if not self.session:
-                raise RuntimeError("Session not initialized. Use async context manager.")
-
-            try:
-                async with self.session.post(
-                    f"{self.base_url}/api/v1/evaluation/evaluate", json={"code": code}
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+        timings = PhaseTimings()
+        admission_start = time.monotonic()
+        async with self.evaluation_limiter as concurrency_limit:
+            timings.record("evaluation_admission", time.monotonic() - admission_start)
+            with timings.phase("evaluation_request"):
+                result = await self._run_evaluation_request(
+                    code, trace=timings.request("evaluation")
+                )
+
+        result["concurrency_limit"] = concurrency_limit
+        result["timings"] = timings.timings
+        return result
+
+    async def _run_evaluation_request(
+        self, code: str, trace: RequestTrace | None = None
+    ) -> dict[str, Any]:
+        """Call the evaluation endpoint. Called with an evaluation slot held."""
+        if not self.session:
+            raise RuntimeError("Session not initialized. Use async context manager.")
 
-                    # Check if this is an error response
-                    if "error" in data:
-                        return {
-                            "success": False,
-                            "error": data.get("error", "Evaluation failed"),
-                        }
+        start_time = time.monotonic()
+        try:
+            async with self.session.post(
+                f"{self.base_url}/api/v1/evaluation/evaluate",
+                json={"code": code},
+                trace_request_ctx=trace,
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
 
-                    # Backend returns the evaluation directly
+                # Check if this is an error response
+                if "error" in data:
+                    self.error_counts["evaluation", "error_response"] += 1
                     return {
-                        "success": True,
-                        "overall_score": data.get("overallScore", 0),
-                        "code_quality": data.get("codeQuality", {}).get("score", 0),
-                        "architecture": data.get("architectureAndState", {}).get("score", 0),
-                        "performance": data.get("runtimePerformance", {}).get("score", 0),
-                        "accessibility": data.get("accessibilityAndUX", {}).get("score", 0),
-                        "summary": data.get("summary", ""),
+                        "success": False,
+                        "error": data.get("error", "Evaluation failed"),
                     }
 
-            except ClientError as e:
-                logger.error(f"Failed to evaluate code: {e}")
+                await self.evaluation_limiter.record_success(time.monotonic() - start_time)
+
+                # Backend returns the evaluation directly
                 return {
-                    "success": False,
-                    "error": str(e),
+                    "success": True,
+                    "overall_score": data.get("overallScore", 0),
+                    "code_quality": data.get("codeQuality", {}).get("score", 0),
+                    "architecture": data.get("architectureAndState", {}).get("score", 0),
+                    "performance": data.get("runtimePerformance", {}).get("score", 0),
+                    "accessibility": data.get("accessibilityAndUX", {}).get("score", 0),
+                    "summary": data.get("summary", ""),
                 }
 
+        except ClientError as e:
+            logger.error(f"Failed to evaluate code: {e}")
+            self.error_counts["evaluation", error_code(e)] += 1
+            if is_overload_error(e):
+                await self.evaluation_limiter.record_overload()
+            return {
+                "success": False,
+                "error": str(e),
+            }
+
+
+class BackendPool:
+    """Balance evaluation runs across several backend instances.
+
+    Each run is pinned to one backend for its whole lifetime, since the
+    generated room lives there. A run goes to the healthy backend with the
+    fewest outstanding runs; health is re-checked against ``/api/v1/health``
+    periodically while the pool is open.
+
+    Attributes:
+        clients: One client per backend.
+        outstanding: Outstanding runs per backend URL.
+        healthy: Last health check result per backend URL.
+    """
+
+    def __init__(self, clients: Sequence[BackendClient], health_check_interval: float = 30.0):
+        """Initialize the pool.
+
+        Args:
+            clients: One client per backend; entered and exited with the pool.
+            health_check_interval: Seconds between health checks (default: 30.0).
+        """
+        if not clients:
+            raise ValueError("BackendPool requires at least one client")
+
+        self.clients = list(clients)
+        self.health_check_interval = health_check_interval
+        self.outstanding: dict[str, int] = {c.base_url: 0 for c in self.clients}
+        self.healthy: dict[str, bool] = {c.base_url: True for c in self.clients}
+        self._health_task: asyncio.Task[None] | None = None
+        self._exit_stack = contextlib.AsyncExitStack()
+
+    async def __aenter__(self) -> BackendPool:
+        """Enter all clients and start health checking."""
+        for client in self.clients:
+            await self._exit_stack.enter_async_context(client)
+        await self.check_health()
+        if len(self.clients) > 1:
+            self._health_task = asyncio.create_task(self._health_loop())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any | None,
+    ) -> None:
+        """Stop health checking and exit all clients."""
+        if self._health_task:
+            self._health_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._health_task
+            self._health_task = None
+        await self._exit_stack.aclose()
+
+    async def check_health(self) -> None:
+        """Refresh the health status of every backend."""
+        results = await asyncio.gather(*(c.check_health() for c in self.clients))
+        for client, is_healthy in zip(self.clients, results, strict=True):
+            if self.healthy[client.base_url] != is_healthy:
+                state = "healthy" if is_healthy else "unhealthy"
+                logger.warning(f"Backend {client.base_url} is {state}")
+            self.healthy[client.base_url] = is_healthy
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await self.check_health()
+
+    def acquire(self) -> BackendClient:
+        """Pick the least loaded healthy backend and count a run against it.
+
+        Falls back to all backends if none is healthy, so runs fail visibly
+        instead of stalling. Call ``release`` when the run is finished.
+        """
+        candidates = [c for c in self.clients if self.healthy[c.base_url]] or self.clients
+        client = min(candidates, key=lambda c: self.outstanding[c.base_url])
+        self.outstanding[client.base_url] += 1
+        return client
+
+    def release(self, client: BackendClient) -> None:
+        """Mark a run acquired from ``acquire`` as finished."""
+        self.outstanding[client.base_url] -= 1
+
 
 class MockBackendClient(BackendClient):
     """Mock client for testing without a real backend.
@@ -297,6 +1137,10 @@ class MockBackendClient(BackendClient):
         """Mock context manager exit."""
         pass
 
+    async def check_health(self) -> bool:
+        """Mock health check; always healthy."""
+        return True
+
     async def create_document(self) -> str:
         """Create a mock room ID.
 
@@ -307,7 +1151,11 @@ class MockBackendClient(BackendClient):
         return f"mock_room_{int(time.time())}"
 
     async def send_prompt(
-        self, document_id: str, prompt: str, mode: str = "sequential"
+        self,
+        document_id: str,
+        prompt: str,
+        mode: str = "sequential",
+        prompt_id: str | None = None,
     ) -> dict[str, Any]:
         """Send a mock prompt.
 
@@ -315,11 +1163,17 @@ class MockBackendClient(BackendClient):
             document_id: The room ID.
             prompt: The prompt text.
             mode: The execution mode.
+            prompt_id: ID of the prompt (unused by the mock).
 
         Returns:
             Mock response data.
         """
-        await asyncio.sleep(self.mock_delay * 2)
+        timings = PhaseTimings()
+        created = datetime.now()
+        with timings.phase("task_wait"):
+            await asyncio.sleep(self.mock_delay * 2)
+        timestamps = {"created_at": created, "started_at": created, "finished_at": datetime.now()}
+        record_backend_timings(timings, timestamps, timings.timings["task_wait"])
 
         # Generate mock code based on prompt
         mock_code = f"""// Generated code for: {prompt[:50]}...
@@ -336,6 +1190,26 @@ const MockComponent: React.FC = () => {{
 
 export default MockComponent;"""
 
+        # Roughly 4 characters per token; in parallel mode the outliner writes
+        # half the code and the implementation agents read its outline
+        input_tokens, output_tokens = len(prompt) // 4, len(mock_code) // 4
+        outline = output_tokens // 2
+        if mode == "sequential":
+            agents = {"sequential": (input_tokens, output_tokens)}
+        else:
+            agents = {
+                "outliner": (input_tokens, outline),
+                "implementation": (input_tokens + outline, output_tokens - outline),
+            }
+        usage = {
+            "input_tokens": sum(i for i, _ in agents.values()),
+            "output_tokens": output_tokens,
+            "agents": {
+                agent: {"input_tokens": i, "output_tokens": o, "calls": 1}
+                for agent, (i, o) in agents.items()
+            },
+        }
+
         return {
             "document_id": document_id,
             "mode": mode,
@@ -344,6 +1218,9 @@ export default MockComponent;"""
             "error": None,
             "elapsed_time": self.mock_delay * 2,
             "success": True,
+            "timings": timings.timings,
+            "backend_timestamps": {name: ts.isoformat() for name, ts in timestamps.items()},
+            "usage": usage,
         }
 
     async def evaluate_code(self, code: str) -> dict[str, Any]:
@@ -355,7 +1232,9 @@ export default MockComponent;"""
         Returns:
             Mock evaluation scores.
         """
-        await asyncio.sleep(self.mock_delay)
+        timings = PhaseTimings()
+        with timings.phase("evaluation_request"):
+            await asyncio.sleep(self.mock_delay)
 
         import random
 
@@ -371,4 +1250,5 @@ export default MockComponent;"""
             "performance": base_score + random.uniform(-5, 5),
             "accessibility": base_score + random.uniform(-5, 5),
             "summary": "Mock evaluation: Code shows good structure with room for improvement.",
+            "timings": timings.timings,
         }
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -51,6 +51,9 @@ class EvaluationConfig(BaseModel):
     """Main configuration for evaluation runs."""
 
     backend_url: str = "http://localhost:3001"
+    # Several backend instances to balance runs across; replaces backend_url when set
+    backend_urls: list[str] = Field(default_factory=list)
+    backend_health_check_interval: float = Field(default=30.0, gt=0)  # Seconds
     api_version: str = "v1"
 
     # Evaluation parameters
@@ -60,22 +63,111 @@ class EvaluationConfig(BaseModel):
     retry_attempts: int = Field(default=3, ge=0)
     retry_delay: float = Field(default=2.0, ge=0)
 
+    # Per-stage admission control. Concurrency (also the pipeline worker count per
+    # stage) defaults to max_concurrent_requests; rate limits (requests per minute)
+    # are off unless set
+    generation_concurrency: int | None = Field(default=None, ge=1)
+    generation_rpm: int | None = Field(default=None, ge=1)
+    evaluation_concurrency: int | None = Field(default=None, ge=1)
+    evaluation_rpm: int | None = Field(default=None, ge=1)
+
+    # Adaptive (AIMD) concurrency control for both stages. When enabled, each stage
+    # starts at its configured concurrency and moves within the min/max bounds
+    adaptive_concurrency: bool = False
+    adaptive_min_concurrency: int = Field(default=1, ge=1)
+    adaptive_max_concurrency: int = Field(default=16, ge=1)
+    adaptive_latency_tolerance: float = Field(default=2.0, gt=1)  # Multiple of baseline latency
+    adaptive_backoff_factor: float = Field(default=0.5, gt=0, lt=1)
+
+    # Group-sequential sampling: runs are scheduled in batches of sampling_batch_size
+    # per prompt and mode, and a prompt stops early once sampling_rule is met for
+    # sampling_metric. runs_per_prompt becomes the maximum
+    adaptive_sampling: bool = False
+    sampling_batch_size: int = Field(default=10, ge=2)
+    sampling_metric: str = "overall_score"
+    sampling_rule: Literal["ci_width", "obrien_fleming"] = "ci_width"
+    sampling_target_ci_width: float = Field(default=5.0, gt=0)  # In sampling_metric units
+
+    # Dispatch order. "random" shuffles all runs; "longest_first" groups the shuffled
+    # runs into blocks of schedule_block_runs replications and dispatches prompts
+    # with the longest expected runs first within each block. Durations come from
+    # schedule_history_dir (an earlier output directory) or complexity_score
+    scheduling: Literal["random", "longest_first"] = "random"
+    schedule_block_runs: int = Field(default=1, ge=1)
+    schedule_history_dir: Path | None = None
+
+    # Runs waiting between the generation and scoring pipeline stages
+    pipeline_queue_size: int = Field(default=10, ge=1)
+
+    # Connection pool shared by all requests of an evaluation (0 = unlimited)
+    connection_pool_size: int = Field(default=100, ge=0)
+    connection_pool_size_per_host: int = Field(default=0, ge=0)
+    keepalive_timeout: float = Field(default=30.0, ge=0)
+    dns_cache_ttl: int = Field(default=300, ge=0)
+
+    # Coordinator/worker mode
+    coordinator_host: str = "127.0.0.1"
+    coordinator_port: int = Field(default=8765, ge=0, le=65535)
+    lease_timeout: float = Field(default=60.0, gt=0)  # Seconds without heartbeat
+    coordinator_token: str | None = None
+
+    # Live metrics: Prometheus text endpoint (off unless metrics_port is set) and a
+    # live_metrics.json snapshot in the output directory every metrics_interval seconds
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int | None = Field(default=None, ge=1, le=65535)
+    metrics_interval: float = Field(default=10.0, gt=0)
+
     # Output configuration
     output_dir: Path = Path("./output")
     save_raw_responses: bool = True
     save_evaluation_scores: bool = True
+    store_code_blobs: bool = True
+    results_store: bool = True
     generate_visualizations: bool = True
 
     # Statistical parameters
     confidence_level: float = Field(default=0.95, ge=0, le=1)
     outlier_detection: bool = True
     outlier_threshold: float = Field(default=3.0, ge=1)  # Standard deviations
+    # Bootstrap confidence intervals in the reports (0 resamples turns them off)
+    bootstrap_resamples: int = Field(default=10_000, ge=0)
+    bootstrap_workers: int | None = Field(default=None, ge=1)  # Processes (default: CPU count)
 
     class Config:
         """Pydantic configuration."""
 
         validate_assignment = True
 
+    def get_backend_urls(self) -> list[str]:
+        """Get the backend URLs runs are distributed across."""
+        return self.backend_urls or [self.backend_url]
+
+
+# Phases of a run timed on the monotonic clock, seconds, recorded in
+# ``EvaluationResult.metadata["timings"]``. ``backend_*`` phases come from the
+# task's backend timestamps instead. ``*_connect`` and ``*_first_byte`` are
+# transport timings of the phase's HTTP request (0 connect = reused connection).
+TIMING_PHASES = [
+    "room_create",
+    "generation_admission",  # Waiting for a generation slot
+    "task_create",
+    "task_wait",  # Task creation response until completion is observed
+    "backend_queue_wait",  # Task created until the backend started processing it
+    "backend_processing",  # Task started until it completed or failed
+    "completion_lag",  # Rest of task_wait: polling delay and network round trips
+    "room_text",
+    "client_overhead",  # Rest of response_time not covered by the phases above
+    "scoring_queue",  # Generated code waiting for the scoring stage
+    "evaluation_admission",  # Waiting for an evaluation slot
+    "evaluation_request",
+    "task_create_connect",
+    "task_create_first_byte",
+    "room_text_connect",
+    "room_text_first_byte",
+    "evaluation_connect",
+    "evaluation_first_byte",
+]
+
 
 @dataclass
 class EvaluationResult:
@@ -110,6 +202,11 @@ class EvaluationResult:
         """Check if the evaluation was successful."""
         return self.error is None and self.overall_score is not None
 
+    @property
+    def run_key(self) -> tuple[str, str, int]:
+        """Identify the run within an evaluation suite."""
+        return (self.prompt_id, self.mode.value, self.run_number)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -130,6 +227,27 @@ class EvaluationResult:
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "EvaluationResult":
+        """Create a result from its serialized dictionary form."""
+        return cls(
+            prompt_id=data["prompt_id"],
+            prompt_name=data["prompt_name"],
+            mode=AgentMode(data["mode"]),
+            run_number=data["run_number"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            response_time=data["response_time"],
+            total_tokens=data.get("total_tokens"),
+            response_content=data.get("response_content", ""),
+            error=data.get("error"),
+            overall_score=data.get("overall_score"),
+            code_quality_score=data.get("code_quality_score"),
+            architecture_score=data.get("architecture_score"),
+            performance_score=data.get("performance_score"),
+            accessibility_score=data.get("accessibility_score"),
+            metadata=data.get("metadata", {}),
+        )
+
 
 class PromptConfiguration:
     """Manager for loading and validating prompts."""
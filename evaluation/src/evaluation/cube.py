@@ -0,0 +1,208 @@
+"""Results cube: metric values as a prompt × mode × metric × run array."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# Modes along the cube's second axis
+CUBE_MODES = ("sequential", "parallel")
+
+# Columns that identify a run rather than measure it
+KEY_COLUMNS = ("prompt_id", "prompt_name", "mode", "run_number")
+
+
+def sorted_quantile(values: np.ndarray, counts: np.ndarray, q: float) -> np.ndarray:
+    """Quantile along the last axis of values sorted with NaN padding last.
+
+    Uses linear interpolation, like ``np.percentile``'s default method.
+
+    Args:
+        values: Sorted values; each row holds ``counts`` values, then NaN
+        counts: Number of values per row
+        q: Quantile in [0, 1]
+
+    Returns:
+        Quantile per row (NaN for empty rows)
+    """
+    position = q * np.maximum(counts - 1, 0)
+    lower = np.floor(position).astype(np.intp)
+    upper = np.ceil(position).astype(np.intp)
+    low = np.take_along_axis(values, lower[..., None], axis=-1)[..., 0]
+    high = np.take_along_axis(values, upper[..., None], axis=-1)[..., 0]
+    result = low + (high - low) * (position - lower)
+    return np.where(counts > 0, result, np.nan)
+
+
+def summarize(
+    values: np.ndarray, confidence_level: float, remove_outliers: bool | np.ndarray
+) -> dict[str, np.ndarray]:
+    """Summary statistics of every group at once, along the last axis.
+
+    Mirrors ``MetricsCollector.calculate_summary``: quartiles come from all
+    values, IQR outliers (beyond 1.5 IQR) are optionally dropped before the
+    mean, standard deviation, extremes and t-interval are computed.
+
+    Args:
+        values: Group values with NaN for missing ones, shape ``(..., runs)``
+        confidence_level: Confidence level of the t-interval
+        remove_outliers: Drop outliers, for all groups or per group
+            (broadcast against ``values.shape[:-1]``)
+
+    Returns:
+        Arrays of shape ``values.shape[:-1]``: ``n_values``, ``n_samples``,
+        ``mean``, ``median``, ``std``, ``min``, ``max``, ``q1``, ``q3``,
+        ``iqr``, ``ci_lower``, ``ci_upper``, plus the boolean ``outlier`` mask
+        over ``values`` itself
+    """
+    if values.shape[-1] == 0:
+        values = np.full((*values.shape[:-1], 1), np.nan)
+    ordered = np.sort(values, axis=-1)
+    present = ~np.isnan(ordered)
+    counts = present.sum(axis=-1)
+
+    q1 = sorted_quantile(ordered, counts, 0.25)
+    median = sorted_quantile(ordered, counts, 0.5)
+    q3 = sorted_quantile(ordered, counts, 0.75)
+    iqr = q3 - q1
+    lower_bound = (q1 - 1.5 * iqr)[..., None]
+    upper_bound = (q3 + 1.5 * iqr)[..., None]
+
+    with np.errstate(invalid="ignore"):
+        inside = (ordered >= lower_bound) & (ordered <= upper_bound)
+        outlier = (values < lower_bound) | (values > upper_bound)
+    drop = np.asarray(remove_outliers, dtype=bool)[..., None]
+    kept = np.where(drop, inside, present)
+    n = kept.sum(axis=-1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(kept, ordered, 0.0).sum(axis=-1) / n
+        deviations = np.where(kept, ordered - mean[..., None], 0.0)
+        std = np.where(n > 1, np.sqrt((deviations**2).sum(axis=-1) / (n - 1)), 0.0)
+        sem = std / np.sqrt(n)
+        t_critical = stats.t.ppf((1 + confidence_level) / 2, np.maximum(n - 1, 1))
+        # Zero spread gives an undefined interval, as with scipy's t.interval
+        half_width = np.where(sem > 0, t_critical * sem, np.nan)
+    ci_lower = np.where(n > 1, mean - half_width, mean)
+    ci_upper = np.where(n > 1, mean + half_width, mean)
+
+    return {
+        "n_values": counts,
+        "n_samples": n,
+        "mean": mean,
+        "median": median,
+        "std": std,
+        "min": np.where(kept, ordered, np.inf).min(axis=-1),
+        "max": np.where(kept, ordered, -np.inf).max(axis=-1),
+        "q1": q1,
+        "q3": q3,
+        "iqr": iqr,
+        "ci_lower": ci_lower,
+        "ci_upper": ci_upper,
+        "outlier": outlier,
+    }
+
+
+class ResultsCube:
+    """Metric values of all runs arranged as a prompt × mode × metric × run array.
+
+    Built in one pass over the DataFrame. Groups with fewer runs than the
+    largest are padded with NaN, as are missing metric values, so every
+    statistic over runs is one NumPy reduction along the last axis for all
+    prompts, modes and metrics at once.
+
+    Attributes:
+        prompts: Prompt IDs along the first axis, in order of appearance
+        metrics: Metric columns along the third axis
+        values: Array of shape (prompts, modes, metrics, runs)
+        rows: Runs per prompt and mode, including runs missing a metric
+        positions: DataFrame row position of each run, shape (prompts, modes,
+            runs), -1 for padding
+    """
+
+    def __init__(self, df: pd.DataFrame, metrics: Sequence[str] | None = None):
+        """Build the cube.
+
+        Args:
+            df: Metrics DataFrame with ``prompt_id`` and ``mode`` columns
+            metrics: Numeric columns to include (default: all non-key columns)
+        """
+        if metrics is None:
+            metrics = [c for c in df.columns if c not in KEY_COLUMNS]
+        self.metrics = list(metrics)
+        self._metric_index = {metric: k for k, metric in enumerate(self.metrics)}
+
+        in_cube = df["mode"].isin(CUBE_MODES).to_numpy() if len(df) else np.array([], dtype=bool)
+        data = df[in_cube]
+        prompt_codes, prompts = pd.factorize(data["prompt_id"]) if len(data) else ([], [])
+        self.prompts = [str(p) for p in prompts]
+        self._prompt_index = {prompt: p for p, prompt in enumerate(self.prompts)}
+
+        prompt_codes = np.asarray(prompt_codes, dtype=np.intp)
+        mode_codes = (
+            data["mode"].map({mode: m for m, mode in enumerate(CUBE_MODES)}).to_numpy(np.intp)
+            if len(data)
+            else np.array([], dtype=np.intp)
+        )
+        slots = (
+            data.groupby([prompt_codes, mode_codes]).cumcount().to_numpy()
+            if len(data)
+            else np.array([], dtype=np.intp)
+        )
+
+        shape = (len(self.prompts), len(CUBE_MODES))
+        self.rows = np.zeros(shape, dtype=np.intp)
+        np.add.at(self.rows, (prompt_codes, mode_codes), 1)
+
+        runs = int(self.rows.max()) if self.rows.size else 0
+        self.values = np.full((*shape, len(self.metrics), runs), np.nan)
+        self.positions = np.full((*shape, runs), -1, dtype=np.intp)
+        if len(data):
+            self.positions[prompt_codes, mode_codes, slots] = np.flatnonzero(in_cube)
+            columns = np.column_stack(
+                [
+                    pd.to_numeric(data[metric], errors="coerce").to_numpy(np.float64)
+                    for metric in self.metrics
+                ]
+            )
+            self.values[prompt_codes, mode_codes, :, slots] = columns
+
+    def __contains__(self, metric: str) -> bool:
+        return metric in self._metric_index
+
+    def metric_index(self, metric: str) -> int:
+        """Position of a metric along the third axis."""
+        return self._metric_index[metric]
+
+    def group_values(self, metric: str, mode: str, prompt_id: str | None = None) -> np.ndarray:
+        """Non-missing values of a metric for one mode, of one prompt or all prompts.
+
+        Values of all prompts are concatenated prompt by prompt, so their order
+        differs from the DataFrame's; the statistics computed from them do not
+        depend on order.
+        """
+        k = self._metric_index[metric]
+        m = CUBE_MODES.index(mode)
+        if prompt_id is None:
+            values = self.values[:, m, k, :].ravel()
+        elif prompt_id in self._prompt_index:
+            values = self.values[self._prompt_index[prompt_id], m, k, :]
+        else:
+            return np.array([])
+        return values[~np.isnan(values)]
+
+    def group_rows(self, mode: str, prompt_id: str | None = None) -> int:
+        """Number of runs of a mode, of one prompt or all prompts."""
+        m = CUBE_MODES.index(mode)
+        if prompt_id is None:
+            return int(self.rows[:, m].sum())
+        if prompt_id not in self._prompt_index:
+            return 0
+        return int(self.rows[self._prompt_index[prompt_id], m])
+
+    def prompt_position(self, prompt_id: str) -> int | None:
+        """Position of a prompt along the first axis, if it has runs."""
+        return self._prompt_index.get(prompt_id)
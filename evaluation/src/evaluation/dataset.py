@@ -0,0 +1,243 @@
+"""Cached, consolidated results table shared by the analysis scripts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from collections.abc import Iterable
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from .blobs import BlobStore
+from .checkpoint import CHECKPOINT_FILE, JOURNAL_FILE, load_output_results
+from .config import AgentMode, EvaluationResult
+from .store import BOOLEAN_COLUMNS, COLUMNS, RESULTS_DB, ResultsStore, result_from_row, result_row
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = ".cache"
+CACHE_FILE = "results_dataset.sqlite"
+# Bump when the consolidated table layout changes to invalidate old caches
+CACHE_VERSION = 4
+
+# Results directory used when neither an argument nor the environment names one
+LEGACY_RESULTS_DIR = Path("/Users/codecrdt/evaluation/evaluation_results")
+RESULTS_DIR_ENV = "CODECRDT_RESULTS_DIR"
+
+# Store columns plus prompt attributes lifted out of the metadata for filtering
+DATASET_COLUMNS = [name for name, _ in COLUMNS] + ["prompt_category", "prompt_complexity"]
+
+
+def resolve_results_dir(path: str | Path | None = None) -> Path:
+    """Resolve the results directory for the analysis scripts.
+
+    Args:
+        path: Explicit directory, e.g. from the command line
+
+    Returns:
+        ``path`` if given, else ``$CODECRDT_RESULTS_DIR``, else the legacy default
+    """
+    if path:
+        return Path(path)
+    if os.environ.get(RESULTS_DIR_ENV):
+        return Path(os.environ[RESULTS_DIR_ENV])
+    return LEGACY_RESULTS_DIR
+
+
+def result_file_path(output_dir: Path, row: dict[str, Any]) -> Path:
+    """Get the ``results/*.json`` path the evaluator writes for a dataset row."""
+    name = f"{row['prompt_id']}_{row['mode']}_run{int(row['run_number']):03d}.json"
+    return Path(output_dir) / "results" / name
+
+
+class ResultsDataset:
+    """Lazily built, cached table of every run in an evaluation output directory.
+
+    The first query consolidates the results store (or, for older runs, the
+    checkpoint and ``results/*.json``) into ``.cache/results_dataset.sqlite``.
+    Later queries, including from other scripts, read that cache as long as
+    the source files are unchanged. Filters and column selection are pushed
+    down into SQL, so only matching rows and requested columns are loaded.
+    """
+
+    def __init__(self, output_dir: Path, validate: str = "mtime"):
+        """Initialize the dataset. Nothing is read until the first query.
+
+        Args:
+            output_dir: Evaluation output directory
+            validate: How to detect changed sources: "mtime" compares file
+                sizes and modification times, "hash" compares file contents
+        """
+        if validate not in ("mtime", "hash"):
+            raise ValueError(f"validate must be 'mtime' or 'hash', got {validate!r}")
+
+        self.output_dir = Path(output_dir)
+        self.validate = validate
+        self.cache_path = self.output_dir / CACHE_DIR / CACHE_FILE
+        self.blobs = BlobStore.for_output_dir(self.output_dir)
+        self._checked = False
+
+    def _source_files(self) -> list[Path]:
+        if (self.output_dir / RESULTS_DB).exists():
+            candidates = [self.output_dir / RESULTS_DB, self.output_dir / f"{RESULTS_DB}-wal"]
+        else:
+            candidates = [self.output_dir / CHECKPOINT_FILE, self.output_dir / JOURNAL_FILE]
+            candidates += sorted((self.output_dir / "results").glob("*.json"))
+        return [path for path in candidates if path.exists()]
+
+    def _fingerprint(self) -> str:
+        digest = hashlib.sha256(f"v{CACHE_VERSION}:{self.validate}".encode())
+        for path in self._source_files():
+            digest.update(path.name.encode())
+            if self.validate == "hash":
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        digest.update(chunk)
+            else:
+                stat = path.stat()
+                digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return digest.hexdigest()
+
+    def _cached_fingerprint(self) -> str | None:
+        if not self.cache_path.exists():
+            return None
+        try:
+            with closing(sqlite3.connect(self.cache_path)) as conn:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def _ensure_cache(self) -> None:
+        if self._checked:
+            return
+
+        fingerprint = self._fingerprint()
+        if self._cached_fingerprint() != fingerprint:
+            self._build(fingerprint)
+        self._checked = True
+
+    def refresh(self) -> None:
+        """Rebuild the cache from the source files."""
+        self._build(self._fingerprint())
+        self._checked = True
+
+    def _build(self, fingerprint: str) -> None:
+        logger.info(f"Building results dataset cache for {self.output_dir}")
+
+        if (self.output_dir / RESULTS_DB).exists():
+            with ResultsStore.for_output_dir(self.output_dir) as store:
+                df = store.load_dataframe([name for name, _ in COLUMNS])
+        else:
+            # Older runs keep their code inline in the cache; the read path
+            # never writes next to the source files
+            rows = [result_row(result, None) for result in load_output_results(self.output_dir)]
+            df = pd.DataFrame(rows, columns=[name for name, _ in COLUMNS])
+
+        metadata = [json.loads(m) if m else {} for m in df["metadata"]]
+        df["prompt_category"] = [m.get("prompt_category") for m in metadata]
+        df["prompt_complexity"] = [m.get("prompt_complexity") for m in metadata]
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        tmp_path.unlink(missing_ok=True)
+        with closing(sqlite3.connect(tmp_path)) as conn, conn:
+            df.to_sql("dataset", conn, index=False)
+            for column in ("prompt_id", "mode", "prompt_category"):
+                conn.execute(f"CREATE INDEX idx_{column} ON dataset ({column})")
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("INSERT INTO meta VALUES ('fingerprint', ?)", (fingerprint,))
+        os.replace(tmp_path, self.cache_path)
+
+    def query(
+        self,
+        prompt_ids: Iterable[str] | None = None,
+        modes: Iterable[str | AgentMode] | None = None,
+        categories: Iterable[str] | None = None,
+        columns: list[str] | None = None,
+        successful_only: bool = False,
+        rows: list[int] | None = None,
+    ) -> pd.DataFrame:
+        """Select runs from the consolidated table.
+
+        Args:
+            prompt_ids: Keep only these prompts
+            modes: Keep only these agent modes
+            categories: Keep only prompts in these categories
+            columns: Columns to load (default: all ``DATASET_COLUMNS``)
+            successful_only: Keep only successful runs
+            rows: Load only the matching runs at these positions, in this order
+
+        Returns:
+            Matching runs in the order they were recorded, or in ``rows`` order
+        """
+        columns = columns or DATASET_COLUMNS
+        unknown = [c for c in columns if c not in DATASET_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown dataset columns: {unknown}")
+
+        conditions: list[str] = []
+        params: list[Any] = []
+        for column, values in (
+            ("prompt_id", prompt_ids),
+            ("mode", [m.value if isinstance(m, AgentMode) else m for m in modes or []] or None),
+            ("prompt_category", categories),
+        ):
+            if values is None:
+                continue
+            values = list(values)
+            conditions.append(f"{column} IN ({', '.join('?' for _ in values)})")
+            params.extend(values)
+        if successful_only:
+            conditions.append("success = 1")
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        self._ensure_cache()
+        with closing(sqlite3.connect(self.cache_path)) as conn:
+            if rows is None:
+                sql = f"SELECT {', '.join(columns)} FROM dataset{where} ORDER BY rowid"
+                df = pd.read_sql_query(sql, conn, params=params)
+            else:
+                # Positions count matching runs; map them to rowids first so
+                # only the selected rows are read in full
+                order = conn.execute(
+                    f"SELECT rowid FROM dataset{where} ORDER BY rowid", params
+                ).fetchall()
+                selected = [order[row][0] for row in rows]
+                sql = (
+                    f"SELECT rowid AS _rowid, {', '.join(columns)} FROM dataset "
+                    f"WHERE rowid IN ({', '.join('?' for _ in selected)})"
+                )
+                df = pd.read_sql_query(sql, conn, params=selected).set_index("_rowid")
+                df = df.loc[selected].reset_index(drop=True)
+
+        for column in BOOLEAN_COLUMNS.intersection(df.columns):
+            df[column] = df[column].astype(bool)
+        return df
+
+    def load_results(self, rows: list[int] | None = None, **filters: Any) -> list[EvaluationResult]:
+        """Load matching runs as ``EvaluationResult`` objects, without code.
+
+        Accepts the same filters and ``rows`` as ``query()``, except ``columns``.
+        """
+        df = self.query(columns=[name for name, _ in COLUMNS], rows=rows, **filters)
+        return [result_from_row(values) for values in df.to_dict("records")]
+
+    def code(self, row: dict[str, Any]) -> str:
+        """Read the generated code of a row, from the blob store or inline.
+
+        Args:
+            row: Dataset row with ``response_content_blob`` and ``response_content``
+        """
+        digest = row.get("response_content_blob")
+        if isinstance(digest, str) and digest:
+            return self.blobs.get(digest)
+        content = row.get("response_content")
+        return content if isinstance(content, str) else ""
@@ -0,0 +1,480 @@
+"""Coordinator/worker mode for spreading an evaluation over processes and hosts.
+
+The coordinator owns the shuffled task list and the output directory. Workers
+connect over TCP, lease one run at a time, execute it against their backends
+and stream the result back. Messages are newline-delimited JSON objects; each
+request from a worker gets exactly one reply.
+
+Worker -> coordinator:
+    hello      {"worker_id", "token"}            -> welcome {"heartbeat_interval"}
+    request    {}                                -> lease {"lease_id", "prompt", "mode",
+                                                    "run_number"} | wait {"retry_in"} | done
+    heartbeat  {"lease_ids"}                     -> ok
+    result     {"lease_id", "result", "response"} -> ok
+    release    {"lease_id"}                      -> ok
+
+A lease expires if it is not renewed by a heartbeat within ``lease_timeout``
+seconds, or as soon as the worker's connection drops. Its run then goes back
+to the front of the queue, so a dead worker delays runs but never loses them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import socket
+import sys
+import time
+import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from rich.console import Console
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeRemainingColumn
+
+from .config import AgentMode, EvaluationConfig, EvaluationPrompt, EvaluationResult
+
+logger = logging.getLogger(__name__)
+console = Console()
+
+# Result messages carry generated code and raw responses
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+WAIT_RETRY_INTERVAL = 1.0
+SHUTDOWN_GRACE = 5.0
+# Same entry point as the codecrdt-eval script, which may not be on PATH
+WORKER_ENTRY_POINT = "from evaluation.cli import main; main()"
+
+EvaluationTask = tuple[EvaluationPrompt, AgentMode, int]
+ResultCallback = Callable[[EvaluationResult, dict[str, Any] | None], Awaitable[None]]
+
+
+class ProtocolError(Exception):
+    """Raised when a peer sends an unexpected or malformed message."""
+
+
+def parse_address(address: str, default_port: int) -> tuple[str, int]:
+    """Parse ``host:port`` (or just ``host``) into a host and port."""
+    host, _, port = address.rpartition(":")
+    if not host:
+        return port, default_port
+    return host, int(port)
+
+
+async def _send(writer: asyncio.StreamWriter, message: dict[str, Any]) -> None:
+    writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+
+
+async def _receive(reader: asyncio.StreamReader) -> dict[str, Any] | None:
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        message = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ProtocolError(f"Malformed message: {e}") from e
+    if not isinstance(message, dict) or "type" not in message:
+        raise ProtocolError(f"Message without type: {message!r}")
+    return message
+
+
+@dataclass
+class _Lease:
+    """A run handed out to a worker."""
+
+    task_index: int
+    worker_id: str
+    expires_at: float
+
+
+class EvaluationCoordinator:
+    """Hand out evaluation runs to workers and collect their results."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        lease_timeout: float = 60.0,
+        token: str | None = None,
+    ):
+        """Initialize the coordinator.
+
+        Args:
+            host: Interface to listen on
+            port: TCP port to listen on (0 picks a free port)
+            lease_timeout: Seconds a lease survives without a heartbeat
+            token: Shared secret workers must present, if set
+        """
+        self.host = host
+        self.port = port
+        self.lease_timeout = lease_timeout
+        self.token = token
+
+        self._tasks: list[EvaluationTask] = []
+        self._pending: deque[int] = deque()
+        self._leases: dict[str, _Lease] = {}
+        self._completed: set[int] = set()
+        self._results: list[EvaluationResult] = []
+        self._on_result: ResultCallback | None = None
+        self._finished = asyncio.Event()
+        self._on_progress: Callable[[], None] | None = None
+        self.server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        """Start listening for workers.
+
+        Call this before starting local workers when ``port`` is 0, so they
+        can be pointed at the port that was actually bound.
+        """
+        if self.server is None:
+            self.server = await asyncio.start_server(
+                self._handle_worker, self.host, self.port, limit=MAX_MESSAGE_SIZE
+            )
+            self.port = self.server.sockets[0].getsockname()[1]
+
+    async def run(
+        self, tasks: list[EvaluationTask], on_result: ResultCallback
+    ) -> list[EvaluationResult]:
+        """Serve ``tasks`` to workers until every run has a result.
+
+        Args:
+            tasks: Runs in dispatch order
+            on_result: Called once per run with the result and raw response
+
+        Returns:
+            Results in completion order
+        """
+        self._tasks = tasks
+        self._pending = deque(range(len(tasks)))
+        self._on_result = on_result
+        if not tasks:
+            # Workers that are already connected still get told to stop
+            self._finished.set()
+
+        await self.start()
+        assert self.server is not None
+        console.print(
+            f"Coordinator listening on {self.host}:{self.port}, "
+            f"lease timeout {self.lease_timeout:.0f}s"
+        )
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeRemainingColumn(),
+            console=console,
+        ) as progress:
+            task_id = progress.add_task("[cyan]Running evaluations", total=len(tasks))
+            self._on_progress = lambda: progress.update(task_id, advance=1)
+
+            expiry = asyncio.create_task(self._expire_leases())
+            try:
+                await self._finished.wait()
+            finally:
+                expiry.cancel()
+                self.server.close()
+                # Give polling workers a moment to receive "done" and hang up
+                try:
+                    await asyncio.wait_for(self.server.wait_closed(), timeout=SHUTDOWN_GRACE)
+                except TimeoutError:
+                    logger.warning("Workers still connected at shutdown")
+
+        return self._results
+
+    def _next_message(self, worker_id: str) -> dict[str, Any]:
+        """Lease the next pending run to a worker, or tell it to wait or stop."""
+        while self._pending:
+            index = self._pending.popleft()
+            if index in self._completed:
+                continue
+
+            lease_id = uuid.uuid4().hex
+            self._leases[lease_id] = _Lease(
+                task_index=index,
+                worker_id=worker_id,
+                expires_at=time.monotonic() + self.lease_timeout,
+            )
+            prompt, mode, run_number = self._tasks[index]
+            return {
+                "type": "lease",
+                "lease_id": lease_id,
+                "prompt": prompt.model_dump(mode="json"),
+                "mode": mode.value,
+                "run_number": run_number,
+            }
+
+        if self._finished.is_set():
+            return {"type": "done"}
+        # Outstanding leases may still expire and need another worker
+        return {"type": "wait", "retry_in": WAIT_RETRY_INTERVAL}
+
+    def _requeue(self, lease_id: str, reason: str) -> None:
+        lease = self._leases.pop(lease_id, None)
+        if lease is None or lease.task_index in self._completed:
+            return
+        prompt, mode, run_number = self._tasks[lease.task_index]
+        logger.warning(
+            f"Requeueing {prompt.id} ({mode.value}) run {run_number} "
+            f"from worker {lease.worker_id}: {reason}"
+        )
+        # Front of the queue: keep the run close to its planned position
+        self._pending.appendleft(lease.task_index)
+
+    async def _expire_leases(self) -> None:
+        while True:
+            await asyncio.sleep(min(1.0, self.lease_timeout / 4))
+            now = time.monotonic()
+            for lease_id, lease in list(self._leases.items()):
+                if lease.expires_at <= now:
+                    self._requeue(lease_id, "lease expired")
+
+    async def _accept_result(
+        self, worker_id: str, lease_id: str, data: dict[str, Any], response: dict[str, Any] | None
+    ) -> None:
+        lease = self._leases.pop(lease_id, None)
+        result = EvaluationResult.from_dict(data)
+        result.metadata["worker_id"] = worker_id
+
+        if lease is not None:
+            index = lease.task_index
+        else:
+            # Late result of an expired lease: still useful unless another
+            # worker already delivered the run
+            keys = {
+                (prompt.id, mode.value, run_number): i
+                for i, (prompt, mode, run_number) in enumerate(self._tasks)
+            }
+            index = keys.get(result.run_key, -1)
+            if index < 0:
+                raise ProtocolError(f"Result for unknown run {result.run_key}")
+        if index in self._completed:
+            return
+
+        self._completed.add(index)
+        self._results.append(result)
+        assert self._on_result is not None
+        await self._on_result(result, response)
+        if self._on_progress:
+            self._on_progress()
+
+        if len(self._completed) == len(self._tasks):
+            self._finished.set()
+
+    async def _handle_worker(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        peer = writer.get_extra_info("peername")
+        worker_id = f"{peer[0]}:{peer[1]}" if peer else "unknown"
+        try:
+            hello = await _receive(reader)
+            if hello is None or hello["type"] != "hello":
+                raise ProtocolError("Expected hello")
+            if self.token and hello.get("token") != self.token:
+                raise ProtocolError("Invalid token")
+            worker_id = str(hello.get("worker_id") or worker_id)
+            console.print(f"Worker connected: {worker_id}")
+            await _send(
+                writer, {"type": "welcome", "heartbeat_interval": self.lease_timeout / 3}
+            )
+
+            while (message := await _receive(reader)) is not None:
+                kind = message["type"]
+                if kind == "request":
+                    await _send(writer, self._next_message(worker_id))
+                elif kind == "heartbeat":
+                    deadline = time.monotonic() + self.lease_timeout
+                    for lease_id in message.get("lease_ids", []):
+                        if lease_id in self._leases:
+                            self._leases[lease_id].expires_at = deadline
+                    await _send(writer, {"type": "ok"})
+                elif kind == "result":
+                    await self._accept_result(
+                        worker_id, message["lease_id"], message["result"], message.get("response")
+                    )
+                    await _send(writer, {"type": "ok"})
+                elif kind == "release":
+                    self._requeue(message["lease_id"], "released by worker")
+                    await _send(writer, {"type": "ok"})
+                else:
+                    raise ProtocolError(f"Unknown message type: {kind}")
+        except (ProtocolError, KeyError, ValueError) as e:
+            logger.error(f"Dropping worker {worker_id}: {e}")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            # Runs the worker still held go back to the queue right away
+            for lease_id, lease in list(self._leases.items()):
+                if lease.worker_id == worker_id:
+                    self._requeue(lease_id, "worker disconnected")
+            console.print(f"Worker disconnected: {worker_id}")
+            writer.close()
+
+
+async def spawn_local_workers(
+    count: int, host: str, port: int, config_path: str | None, use_mock: bool
+) -> list[asyncio.subprocess.Process]:
+    """Start worker processes on this machine, connected to a coordinator.
+
+    Args:
+        count: Number of worker processes
+        host: Coordinator host
+        port: Coordinator port
+        config_path: Configuration file the workers load
+        use_mock: Use the mock backend client in the workers
+    """
+    args = [sys.executable, "-c", WORKER_ENTRY_POINT, "worker", "--connect", f"{host}:{port}"]
+    if config_path:
+        args += ["--config", config_path]
+    if use_mock:
+        args.append("--mock")
+
+    return [await asyncio.create_subprocess_exec(*args) for _ in range(count)]
+
+
+class EvaluationWorker:
+    """Lease runs from a coordinator and execute them against local backends."""
+
+    def __init__(
+        self,
+        config: EvaluationConfig,
+        host: str,
+        port: int,
+        slots: int | None = None,
+        use_mock: bool = False,
+        worker_id: str | None = None,
+    ):
+        """Initialize the worker.
+
+        Args:
+            config: Evaluation configuration (backends, limits, timeouts)
+            host: Coordinator host
+            port: Coordinator port
+            slots: Runs executed concurrently (default: ``max_concurrent_requests``
+                per backend)
+            use_mock: Use the mock backend client
+            worker_id: Name reported to the coordinator (default: host name and PID)
+        """
+        # Imported here: the evaluator module uses this one for coordinated runs
+        from .evaluator import AgentEvaluator
+
+        self.config = config
+        self.host = host
+        self.port = port
+        self.slots = slots or config.max_concurrent_requests * len(config.get_backend_urls())
+        self.worker_id = worker_id or f"{socket.gethostname()}-{uuid.uuid4().hex[:6]}"
+        self.evaluator = AgentEvaluator(config, use_mock=use_mock)
+        self._active_leases: set[str] = set()
+        self._lock = asyncio.Lock()
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def _call(self, message: dict[str, Any]) -> dict[str, Any]:
+        """Send a message and wait for its reply; one exchange at a time."""
+        assert self._reader is not None and self._writer is not None
+        async with self._lock:
+            await _send(self._writer, message)
+            reply = await _receive(self._reader)
+        if reply is None:
+            raise ConnectionError("Coordinator closed the connection")
+        return reply
+
+    async def run(self) -> int:
+        """Process runs until the coordinator has none left.
+
+        Returns:
+            Number of runs this worker completed
+        """
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port, limit=MAX_MESSAGE_SIZE
+        )
+        completed = 0
+        try:
+            welcome = await self._call(
+                {
+                    "type": "hello",
+                    "worker_id": self.worker_id,
+                    "token": self.config.coordinator_token,
+                }
+            )
+            if welcome["type"] != "welcome":
+                raise ProtocolError(f"Expected welcome, got {welcome['type']}")
+            console.print(
+                f"Worker {self.worker_id} connected to {self.host}:{self.port} "
+                f"with {self.slots} slots"
+            )
+
+            async with self.evaluator._create_pool() as pool:
+                # Same group as the slots: a failed heartbeat ends the worker
+                # instead of letting the coordinator expire leases still running
+                async with asyncio.TaskGroup() as tg:
+                    heartbeat = tg.create_task(self._heartbeat(welcome["heartbeat_interval"]))
+                    slots = tg.create_task(self._run_slots(pool, heartbeat))
+                completed = slots.result()
+        finally:
+            await self.evaluator.close()
+            self._writer.close()
+
+        console.print(f"Worker {self.worker_id} finished: {completed} runs")
+        return completed
+
+    async def _run_slots(self, pool: Any, heartbeat: asyncio.Task[None]) -> int:
+        try:
+            async with asyncio.TaskGroup() as tg:
+                slot_tasks = [tg.create_task(self._slot(pool)) for _ in range(self.slots)]
+        finally:
+            heartbeat.cancel()
+        return sum(task.result() for task in slot_tasks)
+
+    async def _heartbeat(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            if self._active_leases:
+                await self._call({"type": "heartbeat", "lease_ids": list(self._active_leases)})
+
+    async def _slot(self, pool: Any) -> int:
+        completed = 0
+        while True:
+            message = await self._call({"type": "request"})
+            if message["type"] == "done":
+                return completed
+            if message["type"] == "wait":
+                await asyncio.sleep(message["retry_in"])
+                continue
+            if message["type"] != "lease":
+                raise ProtocolError(f"Unexpected reply: {message['type']}")
+
+            lease_id = message["lease_id"]
+            prompt = EvaluationPrompt(**message["prompt"])
+            mode = AgentMode(message["mode"])
+            self._active_leases.add(lease_id)
+            try:
+                client = pool.acquire()
+                try:
+                    generated = await self.evaluator._generate(
+                        client, prompt, mode, message["run_number"]
+                    )
+                    result = await self.evaluator._score(client, generated)
+                finally:
+                    pool.release(client)
+            except Exception as e:
+                logger.error(f"Run failed on worker, releasing lease: {e}")
+                self._active_leases.discard(lease_id)
+                await self._call({"type": "release", "lease_id": lease_id})
+                continue
+
+            response = generated.response if self.config.save_raw_responses else None
+            await self._call(
+                {
+                    "type": "result",
+                    "lease_id": lease_id,
+                    "result": result.to_dict(),
+                    "response": response,
+                }
+            )
+            self._active_leases.discard(lease_id)
+            completed += 1
@@ -8,22 +8,154 @@ import logging
 import platform
 import random
 import sys
+import time
 from collections.abc import Coroutine
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from aiohttp import ClientSession
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeRemainingColumn
 
-from .client import BackendClient, MockBackendClient
+from .blobs import BlobStore
+from .checkpoint import CheckpointJournal, ResultWriter, load_output_results
+from .client import (
+    AIMDController,
+    BackendClient,
+    BackendPool,
+    MockBackendClient,
+    PhaseTimings,
+    create_pooled_session,
+)
 from .config import AgentMode, EvaluationConfig, EvaluationPrompt, EvaluationResult
+from .monitoring import LIVE_METRICS_FILE, LiveMetrics, MetricsExporter
+from .sampling import SequentialSampler
+from .scheduling import estimate_durations, load_duration_history, longest_first
+from .store import RESULTS_DB, ResultsStore
+
+if TYPE_CHECKING:
+    from .distributed import EvaluationCoordinator
 
 logger = logging.getLogger(__name__)
 console = Console()
 
-# Set random seed for reproducibility
-random.seed(42)
+# Seed for the execution order shuffle, kept fixed for reproducibility
+RANDOM_SEED = 42
+
+# Execution order of an evaluation, saved so an interrupted run can resume it
+PLAN_FILE = "evaluation_plan.json"
+
+
+def load_evaluation_plan(output_dir: Path) -> dict[str, Any] | None:
+    """Load the saved plan of an evaluation output directory, if it has one."""
+    plan_file = output_dir / PLAN_FILE
+    if not plan_file.exists():
+        return None
+    with open(plan_file) as f:
+        return json.load(f)
+
+
+def plan_selection(plan: dict[str, Any]) -> tuple[int, str, list[str]]:
+    """Runs per prompt, modes and prompts covered by a saved plan.
+
+    Returns:
+        ``runs_per_prompt``, the modes as a ``--modes`` value ("both",
+        "sequential" or "parallel") and the prompt IDs in plan order
+    """
+    planned_modes = {mode for _, mode, _ in plan["tasks"]}
+    modes = next(iter(planned_modes)) if len(planned_modes) == 1 else "both"
+    prompt_ids = list(dict.fromkeys(prompt_id for prompt_id, _, _ in plan["tasks"]))
+    return plan["runs_per_prompt"], modes, prompt_ids
+
+
+def check_plan_selection(
+    plan: dict[str, Any], runs_per_prompt: int, modes: str, prompt_ids: list[str]
+) -> None:
+    """Check that a resumed evaluation selects exactly what its plan covers.
+
+    Raises:
+        ValueError: If runs per prompt, modes or prompts differ from the plan
+    """
+    planned_runs, planned_modes, planned_ids = plan_selection(plan)
+    conflicts = []
+    if runs_per_prompt != planned_runs:
+        conflicts.append(f"runs per prompt is {runs_per_prompt}, plan has {planned_runs}")
+    if modes != planned_modes:
+        conflicts.append(f"modes is {modes!r}, plan has {planned_modes!r}")
+    missing = [prompt_id for prompt_id in planned_ids if prompt_id not in prompt_ids]
+    extra = sorted(set(prompt_ids).difference(planned_ids))
+    if missing:
+        conflicts.append(f"planned prompts not selected: {', '.join(missing)}")
+    if extra:
+        conflicts.append(f"selected prompts not in the plan: {', '.join(extra)}")
+    if conflicts:
+        raise ValueError(f"Selection differs from {PLAN_FILE}: " + "; ".join(conflicts))
+
+
+@dataclass
+class GeneratedRun:
+    """Output of the generation stage, handed to the scoring stage."""
+
+    prompt: EvaluationPrompt
+    mode: AgentMode
+    run_number: int
+    timestamp: datetime
+    document_id: str | None = None
+    response: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None  # Exception raised while generating
+    timings: dict[str, float] = field(default_factory=dict)  # Phase durations, seconds
+    finished: float = 0.0  # Monotonic clock when generation ended
+
+
+@dataclass
+class StageStats:
+    """Throughput and input queue depth metrics for one pipeline stage."""
+
+    name: str
+    workers: int
+    processed: int = 0
+    busy_time: float = 0.0  # Summed across workers, seconds
+    max_queue_depth: int = 0
+    queue_depth_total: int = 0
+    queue_depth_samples: int = 0
+
+    def record_processed(self, duration: float) -> None:
+        """Record one item handled by a worker of this stage."""
+        self.processed += 1
+        self.busy_time += duration
+
+    def record_queue_depth(self, depth: int) -> None:
+        """Record the depth of this stage's input queue."""
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+        self.queue_depth_total += depth
+        self.queue_depth_samples += 1
+
+    @property
+    def mean_queue_depth(self) -> float:
+        """Mean input queue depth over all samples."""
+        if self.queue_depth_samples == 0:
+            return 0.0
+        return self.queue_depth_total / self.queue_depth_samples
+
+    def utilization(self, elapsed: float) -> float:
+        """Fraction of worker time spent busy over the given wall time."""
+        if elapsed <= 0 or self.workers == 0:
+            return 0.0
+        return self.busy_time / (elapsed * self.workers)
+
+    def to_dict(self, elapsed: float) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "name": self.name,
+            "workers": self.workers,
+            "processed": self.processed,
+            "busy_time": self.busy_time,
+            "utilization": self.utilization(elapsed),
+            "mean_queue_depth": self.mean_queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+        }
 
 
 class AgentEvaluator:
@@ -35,6 +167,111 @@ class AgentEvaluator:
         self.use_mock = use_mock
         self.results: list[EvaluationResult] = []
         self.output_dir: Path | None = None
+        self.journal: CheckpointJournal | None = None
+        self.writer: ResultWriter | None = None
+        self.session: ClientSession | None = None
+        self.stage_stats: list[StageStats] = []
+        # Expected run duration per prompt, with longest_first scheduling
+        self.duration_estimates: dict[str, float] | None = None
+        self.live_metrics = LiveMetrics()
+
+        # Adaptive controllers per backend URL; they outlive individual clients
+        # so learned limits carry over between prompts
+        self.generation_controllers: dict[str, AIMDController] = {}
+        self.evaluation_controllers: dict[str, AIMDController] = {}
+        if config.adaptive_concurrency:
+            for url in config.get_backend_urls():
+                self.generation_controllers[url] = self._create_controller(
+                    config.generation_concurrency
+                )
+                self.evaluation_controllers[url] = self._create_controller(
+                    config.evaluation_concurrency
+                )
+
+    def _create_controller(self, stage_concurrency: int | None) -> AIMDController:
+        """Create an AIMD controller starting at the stage's configured concurrency."""
+        return AIMDController(
+            initial_limit=stage_concurrency or self.config.max_concurrent_requests,
+            min_limit=self.config.adaptive_min_concurrency,
+            max_limit=self.config.adaptive_max_concurrency,
+            latency_tolerance=self.config.adaptive_latency_tolerance,
+            backoff_factor=self.config.adaptive_backoff_factor,
+        )
+
+    def _get_session(self) -> ClientSession | None:
+        """Get the pooled session shared by all clients of this evaluation.
+
+        The session is created on first use and kept open until ``close()``,
+        so consecutive prompts reuse warm connections to the backend.
+        """
+        if self.use_mock:
+            return None
+
+        if self.session is None or self.session.closed:
+            self.session = create_pooled_session(
+                timeout=self.config.request_timeout,
+                pool_size=self.config.connection_pool_size,
+                pool_size_per_host=self.config.connection_pool_size_per_host,
+                keepalive_timeout=self.config.keepalive_timeout,
+                dns_cache_ttl=self.config.dns_cache_ttl,
+            )
+        return self.session
+
+    def _get_writer(self) -> ResultWriter:
+        """Get the background writer that persists results off the event loop.
+
+        The writer is started on first use and flushed by ``close()``.
+        """
+        if self.writer is None:
+            blobs = store = None
+            if self.output_dir:
+                blobs = self._get_blob_store(self.output_dir)
+                if self.config.results_store:
+                    store = ResultsStore(self.output_dir / RESULTS_DB, blobs)
+            self.writer = ResultWriter(journal=self.journal, blobs=blobs, store=store)
+        return self.writer
+
+    def _get_blob_store(self, output_dir: Path) -> BlobStore | None:
+        """Get the store for generated code, or None to keep code inline."""
+        if not self.config.store_code_blobs:
+            return None
+        return BlobStore.for_output_dir(output_dir)
+
+    def _create_client(self, base_url: str) -> BackendClient:
+        """Create a backend client bound to the shared session."""
+        ClientClass = MockBackendClient if self.use_mock else BackendClient
+        return ClientClass(
+            base_url=base_url,
+            timeout=self.config.request_timeout,
+            max_concurrent=self.config.max_concurrent_requests,
+            session=self._get_session(),
+            generation_concurrency=self.config.generation_concurrency,
+            generation_rpm=self.config.generation_rpm,
+            evaluation_concurrency=self.config.evaluation_concurrency,
+            evaluation_rpm=self.config.evaluation_rpm,
+            generation_controller=self.generation_controllers.get(base_url),
+            evaluation_controller=self.evaluation_controllers.get(base_url),
+        )
+
+    def _create_pool(self) -> BackendPool:
+        """Create a pool with one client per configured backend."""
+        clients = [self._create_client(url) for url in self.config.get_backend_urls()]
+        self.live_metrics.track_clients(clients)
+        return BackendPool(
+            clients, health_check_interval=self.config.backend_health_check_interval
+        )
+
+    async def close(self) -> None:
+        """Close the shared session and flush pending result writes."""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+        if self.writer:
+            writer, self.writer = self.writer, None
+            await asyncio.to_thread(writer.close)
+        if self.journal:
+            self.journal.close()
 
     def _setup_output_directory(self) -> Path:
         """Create timestamped output directory."""
@@ -50,6 +287,27 @@ class AgentEvaluator:
         self._save_environment_info(output_dir)
 
         self.output_dir = output_dir
+        self.journal = CheckpointJournal(output_dir, blobs=self._get_blob_store(output_dir))
+        return output_dir
+
+    def _resume_output_directory(self, output_dir: Path) -> Path:
+        """Reuse the output directory of an interrupted run."""
+        (output_dir / "results").mkdir(exist_ok=True)
+        (output_dir / "visualizations").mkdir(exist_ok=True)
+
+        # Keep the original environment info and record when it was resumed
+        env_file = output_dir / "environment_info.json"
+        if env_file.exists():
+            with open(env_file) as f:
+                env_info = json.load(f)
+            env_info.setdefault("resumed_at", []).append(datetime.now().isoformat())
+            with open(env_file, "w") as f:
+                json.dump(env_info, f, indent=2)
+        else:
+            self._save_environment_info(output_dir)
+
+        self.output_dir = output_dir
+        self.journal = CheckpointJournal(output_dir, blobs=self._get_blob_store(output_dir))
         return output_dir
 
     def _save_environment_info(self, output_dir: Path) -> None:
@@ -66,12 +324,15 @@ class AgentEvaluator:
                 "python_implementation": platform.python_implementation(),
             },
             "configuration": {
-                "backend_url": self.config.backend_url,
+                "backend_urls": self.config.get_backend_urls(),
                 "runs_per_prompt": self.config.runs_per_prompt,
                 "max_concurrent_requests": self.config.max_concurrent_requests,
+                "connection_pool_size": self.config.connection_pool_size,
+                "connection_pool_size_per_host": self.config.connection_pool_size_per_host,
+                "adaptive_concurrency": self.config.adaptive_concurrency,
                 "confidence_level": self.config.confidence_level,
                 "outlier_detection": self.config.outlier_detection,
-                "random_seed": 42,
+                "random_seed": RANDOM_SEED,
             },
             "notes": {
                 "temperature": "0.0 for reproducibility",
@@ -85,24 +346,85 @@ class AgentEvaluator:
             json.dump(env_info, f, indent=2)
 
     async def _run_single_evaluation(
-        self, client: BackendClient, prompt: EvaluationPrompt, mode: AgentMode, run_number: int
+        self, pool: BackendPool, prompt: EvaluationPrompt, mode: AgentMode, run_number: int
     ) -> EvaluationResult:
-        """Run a single evaluation."""
-        start_time = datetime.now()
+        """Run a single evaluation on the least loaded backend of the pool."""
+        client = pool.acquire()
+        try:
+            generated = await self._generate(client, prompt, mode, run_number)
+            return await self._score(client, generated)
+        finally:
+            pool.release(client)
 
+    async def _generate(
+        self, client: BackendClient, prompt: EvaluationPrompt, mode: AgentMode, run_number: int
+    ) -> GeneratedRun:
+        """Generation stage: create a room and generate code for one run."""
+        generated = GeneratedRun(
+            prompt=prompt, mode=mode, run_number=run_number, timestamp=datetime.now()
+        )
+
+        timings = PhaseTimings()
         try:
             # Create document
-            doc_id = await client.create_document()
+            with timings.phase("room_create"):
+                generated.document_id = await client.create_document()
 
             # Send prompt
-            response = await client.send_prompt(
-                document_id=doc_id, prompt=prompt.prompt, mode=mode.value
+            generated.response = await client.send_prompt(
+                document_id=generated.document_id,
+                prompt=prompt.prompt,
+                mode=mode.value,
+                prompt_id=prompt.id,
             )
+            timings.timings.update(generated.response.get("timings", {}))
+        except Exception as e:
+            logger.error(f"Evaluation failed: {e}")
+            generated.error = str(e)
+
+        generated.timings = timings.timings
+        generated.finished = time.monotonic()
+        return generated
+
+    async def _score(self, client: BackendClient, generated: GeneratedRun) -> EvaluationResult:
+        """Scoring stage: evaluate generated code and build the run's result."""
+        prompt = generated.prompt
+        if generated.error is not None:
+            return self._failed_result(generated, generated.error, client.base_url)
+
+        try:
+            response = generated.response
+            timings = {
+                **generated.timings,
+                "scoring_queue": time.monotonic() - generated.finished,
+            }
+
+            metadata: dict[str, Any] = {
+                "document_id": generated.document_id,
+                "backend_url": client.base_url,
+                "prompt_category": prompt.category.value,
+                "prompt_complexity": prompt.complexity_score,
+                "timings": timings,
+            }
+            if response.get("concurrency_limit") is not None:
+                metadata["generation_concurrency"] = response["concurrency_limit"]
+            if response.get("backend_timestamps"):
+                metadata["backend_timestamps"] = response["backend_timestamps"]
+            usage = response.get("usage")
+            if usage:
+                metadata["token_usage"] = usage
 
             # Evaluate generated code if successful
             evaluation_scores = {}
             if response.get("content") and not response.get("error") and response.get("success"):
+                started = time.monotonic()
                 eval_result = await client.evaluate_code(response["content"])
+                self.live_metrics.record_evaluation_latency(
+                    generated.mode, time.monotonic() - started
+                )
+                if eval_result.get("concurrency_limit") is not None:
+                    metadata["evaluation_concurrency"] = eval_result["concurrency_limit"]
+                timings.update(eval_result.get("timings", {}))
 
                 if eval_result.get("success"):
                     evaluation_scores = {
@@ -116,18 +438,15 @@ class AgentEvaluator:
             result = EvaluationResult(
                 prompt_id=prompt.id,
                 prompt_name=prompt.name,
-                mode=mode,
-                run_number=run_number,
-                timestamp=start_time,
+                mode=generated.mode,
+                run_number=generated.run_number,
+                timestamp=generated.timestamp,
                 response_time=response.get("elapsed_time", 0),
+                total_tokens=usage["input_tokens"] + usage["output_tokens"] if usage else None,
                 response_content=response.get("content", ""),
                 error=response.get("error"),
                 **evaluation_scores,
-                metadata={
-                    "document_id": doc_id,
-                    "prompt_category": prompt.category.value,
-                    "prompt_complexity": prompt.complexity_score,
-                },
+                metadata=metadata,
             )
 
             # Save result with raw response if configured
@@ -140,20 +459,27 @@ class AgentEvaluator:
 
         except Exception as e:
             logger.error(f"Evaluation failed: {e}")
-            return EvaluationResult(
-                prompt_id=prompt.id,
-                prompt_name=prompt.name,
-                mode=mode,
-                run_number=run_number,
-                timestamp=start_time,
-                response_time=0,
-                error=str(e),
-            )
+            return self._failed_result(generated, str(e), client.base_url)
+
+    def _failed_result(
+        self, generated: GeneratedRun, error: str, backend_url: str
+    ) -> EvaluationResult:
+        """Build the result for a run that raised before producing a response."""
+        return EvaluationResult(
+            prompt_id=generated.prompt.id,
+            prompt_name=generated.prompt.name,
+            mode=generated.mode,
+            run_number=generated.run_number,
+            timestamp=generated.timestamp,
+            response_time=0,
+            error=error,
+            metadata={"backend_url": backend_url},
+        )
 
     async def _save_result(
         self, result: EvaluationResult, response: dict[str, Any] | None = None
     ) -> None:
-        """Save evaluation result with optional raw response to a single file."""
+        """Queue evaluation result with optional raw response to be saved to a single file."""
         if not self.output_dir:
             return
 
@@ -165,8 +491,8 @@ class AgentEvaluator:
         if response and self.config.save_raw_responses:
             data["raw_response"] = response
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        # Serialized and written by the writer thread
+        self._get_writer().write_result(filepath, data)
 
     async def evaluate_prompt(
         self, prompt: EvaluationPrompt, mode: AgentMode, runs: int
@@ -174,18 +500,13 @@ class AgentEvaluator:
         """Evaluate a single prompt multiple times."""
         results = []
 
-        # Create client
-        ClientClass = MockBackendClient if self.use_mock else BackendClient
-        async with ClientClass(
-            base_url=self.config.backend_url,
-            timeout=self.config.request_timeout,
-            max_concurrent=self.config.max_concurrent_requests,
-        ) as client:
+        # Create clients on the shared session (closed by ``close()``)
+        async with self._create_pool() as pool:
             # Run evaluations with progress bar
             tasks = []
             for run_num in range(1, runs + 1):
                 task = self._run_single_evaluation(
-                    client=client, prompt=prompt, mode=mode, run_number=run_num
+                    pool=pool, prompt=prompt, mode=mode, run_number=run_num
                 )
                 tasks.append(task)
 
@@ -222,10 +543,94 @@ class AgentEvaluator:
         return results
 
     async def run_evaluation(
-        self, prompts: list[EvaluationPrompt], modes: str = "both"
+        self,
+        prompts: list[EvaluationPrompt],
+        modes: str = "both",
+        resume_dir: Path | None = None,
+        coordinator: EvaluationCoordinator | None = None,
     ) -> list[EvaluationResult]:
-        """Run complete evaluation suite with randomized execution order."""
-        self._setup_output_directory()
+        """Run complete evaluation suite with randomized execution order.
+
+        With ``adaptive_sampling`` enabled, runs are executed in
+        group-sequential looks and prompts stop early once the configured
+        stopping rule is met; see ``SequentialSampler``.
+
+        Args:
+            prompts: Prompts to evaluate
+            modes: Modes to run ("sequential", "parallel" or "both")
+            resume_dir: Output directory of an interrupted run. Successful runs
+                found there are kept and only missing or failed runs are
+                executed, in the order of the original plan. Prompts, modes
+                and ``runs_per_prompt`` must match the plan.
+            coordinator: Hand runs out to remote workers through this
+                coordinator instead of executing them in this process. Results
+                are still saved here.
+
+        Returns:
+            Results of all runs, including those completed before resuming
+
+        Raises:
+            ValueError: If resuming with a selection that differs from the plan
+        """
+        plan = load_evaluation_plan(resume_dir) if resume_dir is not None else None
+        if plan is not None:
+            check_plan_selection(
+                plan, self.config.runs_per_prompt, modes, [prompt.id for prompt in prompts]
+            )
+
+        sampler = None
+        if self.config.adaptive_sampling:
+            if coordinator is not None:
+                raise ValueError("adaptive_sampling is not supported in coordinator mode")
+            sampler = SequentialSampler(
+                self.config, [mode for mode in AgentMode if modes in ("both", mode.value)]
+            )
+
+        evaluation_tasks = self._prepare_tasks(prompts, modes, resume_dir)
+
+        self.live_metrics = LiveMetrics()
+        exporter = MetricsExporter(
+            self.live_metrics,
+            host=self.config.metrics_host,
+            port=self.config.metrics_port,
+            json_path=self.output_dir / LIVE_METRICS_FILE if self.output_dir else None,
+            interval=self.config.metrics_interval,
+        )
+
+        completed = list(self.results)
+        try:
+            await exporter.start()
+            if coordinator is not None:
+                new_results = await coordinator.run(evaluation_tasks, self._record_result)
+            elif sampler is not None:
+                async with self._create_pool() as pool:
+                    new_results = await self._run_sequential(pool, evaluation_tasks, sampler)
+            else:
+                async with self._create_pool() as pool:
+                    new_results = await self._run_tasks(pool, evaluation_tasks)
+            all_results = completed + new_results
+        finally:
+            await exporter.stop()
+            await self.close()
+
+        # Fold the journal into the final checkpoint
+        await self._compact_checkpoint()
+
+        console.print("\n[bold green]Evaluation complete![/bold green]")
+        console.print(f"Total evaluations: {len(all_results)}")
+        console.print(f"Successful: {sum(1 for r in all_results if r.success)}")
+        console.print(f"Failed: {sum(1 for r in all_results if not r.success)}")
+
+        return all_results
+
+    def _prepare_tasks(
+        self, prompts: list[EvaluationPrompt], modes: str, resume_dir: Path | None
+    ) -> list[tuple[EvaluationPrompt, AgentMode, int]]:
+        """Set up the output directory and build the randomized task list."""
+        if resume_dir is not None:
+            self._resume_output_directory(resume_dir)
+        else:
+            self._setup_output_directory()
 
         console.print("[bold green]Starting evaluation suite[/bold green]")
         console.print(f"Output directory: {self.output_dir}")
@@ -254,63 +659,301 @@ class AgentEvaluator:
                     evaluation_tasks.append((prompt, AgentMode.PARALLEL, run_num))
 
         # Randomize execution order to prevent order effects
-        random.shuffle(evaluation_tasks)
+        random.Random(RANDOM_SEED).shuffle(evaluation_tasks)
+        if self.config.scheduling == "longest_first" and resume_dir is None:
+            self.duration_estimates = self._estimate_durations(prompts)
+            evaluation_tasks = longest_first(
+                evaluation_tasks, self.duration_estimates, self.config.schedule_block_runs
+            )
+            console.print(
+                f"Scheduling: longest expected first within blocks of "
+                f"{self.config.schedule_block_runs} run(s) per prompt and mode"
+            )
 
-        console.print(f"Total evaluations: {len(evaluation_tasks)} (randomized order)")
-        console.print(f"Random seed: 42 (for reproducibility)")
+        if resume_dir is not None:
+            evaluation_tasks = self._pending_tasks(evaluation_tasks)
+            console.print(
+                f"Resuming: {len(self.results)} completed, "
+                f"{len(evaluation_tasks)} remaining (original order)"
+            )
+        else:
+            self._save_evaluation_plan(evaluation_tasks)
+            console.print(f"Total evaluations: {len(evaluation_tasks)} (randomized order)")
+        console.print(f"Random seed: {RANDOM_SEED} (for reproducibility)")
         console.print()
 
-        all_results = []
+        return evaluation_tasks
 
-        # Create client once for all evaluations
-        ClientClass = MockBackendClient if self.use_mock else BackendClient
-        async with ClientClass(
-            base_url=self.config.backend_url,
-            timeout=self.config.request_timeout,
-            max_concurrent=self.config.max_concurrent_requests,
-        ) as client:
-            # Run evaluations with progress bar
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeRemainingColumn(),
-                console=console,
-            ) as progress:
-                task_id = progress.add_task(
-                    "[cyan]Running evaluations", total=len(evaluation_tasks)
-                )
+    async def _record_result(
+        self, result: EvaluationResult, response: dict[str, Any] | None
+    ) -> None:
+        """Persist a result produced by a remote worker."""
+        if (
+            self.config.save_raw_responses or self.config.save_evaluation_scores
+        ) and self.output_dir:
+            await self._save_result(result, response)
+        self.results.append(result)
+        self.live_metrics.record_result(result)
+        await self._save_checkpoint(result)
+
+    def _estimate_durations(self, prompts: list[EvaluationPrompt]) -> dict[str, float]:
+        """Estimate run durations from an earlier evaluation or complexity scores."""
+        history = None
+        history_dir = self.config.schedule_history_dir
+        if history_dir is not None:
+            if history_dir.exists():
+                history = load_duration_history(history_dir, [prompt.id for prompt in prompts])
+            else:
+                logger.warning(f"Schedule history {history_dir} not found; using complexity")
+        return estimate_durations(prompts, history)
+
+    def _save_evaluation_plan(
+        self, evaluation_tasks: list[tuple[EvaluationPrompt, AgentMode, int]]
+    ) -> None:
+        """Save the shuffled execution order so an interrupted run can resume it."""
+        if not self.output_dir:
+            return
+
+        data = {
+            "random_seed": RANDOM_SEED,
+            "runs_per_prompt": self.config.runs_per_prompt,
+            "scheduling": self.config.scheduling,
+            "estimated_durations": self.duration_estimates,
+            "tasks": [
+                [prompt.id, mode.value, run_num] for prompt, mode, run_num in evaluation_tasks
+            ],
+        }
+        with open(self.output_dir / PLAN_FILE, "w") as f:
+            json.dump(data, f, indent=2)
 
-                for prompt, mode, run_num in evaluation_tasks:
-                    result = await self._run_single_evaluation(
-                        client=client, prompt=prompt, mode=mode, run_number=run_num
+    def _pending_tasks(
+        self, evaluation_tasks: list[tuple[EvaluationPrompt, AgentMode, int]]
+    ) -> list[tuple[EvaluationPrompt, AgentMode, int]]:
+        """Drop runs that already succeeded, keeping the original execution order."""
+        tasks_by_key = {
+            (prompt.id, mode.value, run_num): (prompt, mode, run_num)
+            for prompt, mode, run_num in evaluation_tasks
+        }
+
+        # Only runs of the plan count; run_evaluation checked it matches the tasks
+        previous = load_output_results(self.output_dir) if self.output_dir else []
+        self.results = [r for r in previous if r.success and r.run_key in tasks_by_key]
+        ignored = sum(1 for r in previous if r.success and r.run_key not in tasks_by_key)
+        if ignored:
+            logger.warning(f"Ignoring {ignored} completed run(s) outside the evaluation plan")
+        completed = {r.run_key for r in self.results}
+
+        # Directories from before the results store existed get it backfilled
+        if self.config.results_store and self.output_dir and self.results:
+            blobs = self._get_blob_store(self.output_dir)
+            with ResultsStore(self.output_dir / RESULTS_DB, blobs) as store:
+                store.write(self.results)
+
+        # Follow the saved plan; directories without one keep the seeded order
+        plan = load_evaluation_plan(self.output_dir) if self.output_dir else None
+        if plan is None:
+            ordered_keys = list(tasks_by_key)
+        else:
+            ordered_keys = [tuple(task) for task in plan["tasks"]]
+
+        return [tasks_by_key[key] for key in ordered_keys if key not in completed]
+
+    async def _run_sequential(
+        self,
+        pool: BackendPool,
+        evaluation_tasks: list[tuple[EvaluationPrompt, AgentMode, int]],
+        sampler: SequentialSampler,
+    ) -> list[EvaluationResult]:
+        """Run tasks in group-sequential looks, dropping prompts that can stop.
+
+        Each look runs the next batch of run numbers for the prompts still
+        being sampled, in the (randomized) order of ``evaluation_tasks``, and
+        then applies the sampler's stopping rule. Decisions only depend on runs
+        up to the look, so a resumed evaluation reaches the same decisions.
+        """
+        all_results: list[EvaluationResult] = []
+        active = {prompt.id for prompt, _, _ in evaluation_tasks}
+        active.update(result.prompt_id for result in self.results)
+
+        for look, max_run in enumerate(sampler.looks, start=1):
+            if not active:
+                break
+
+            runs = sampler.stage_runs(look)
+            stage_tasks = [
+                task for task in evaluation_tasks if task[0].id in active and task[2] in runs
+            ]
+            console.print(
+                f"[bold]Look {look}/{len(sampler.looks)}:[/bold] runs {runs.start}-{max_run} "
+                f"for {len(active)} prompts ({len(stage_tasks)} to execute)"
+            )
+            all_results.extend(await self._run_tasks(pool, stage_tasks))
+
+            for decision in sampler.check(self.results, active, look):
+                if decision.stopped:
+                    active.discard(decision.prompt_id)
+                    console.print(
+                        f"  Stopped {decision.prompt_id} after {decision.runs} runs "
+                        f"({decision.reason}: {decision.statistic:.3f} "
+                        f"vs {decision.threshold:.3f})"
                     )
+
+        summary = sampler.to_dict()
+        console.print(
+            f"Adaptive sampling: {summary['executed_runs']} of "
+            f"{summary['planned_runs']} planned runs"
+        )
+        if self.output_dir:
+            sampler.save(self.output_dir)
+
+        return all_results
+
+    async def _run_tasks(
+        self,
+        pool: BackendPool,
+        evaluation_tasks: list[tuple[EvaluationPrompt, AgentMode, int]],
+    ) -> list[EvaluationResult]:
+        """Run evaluation tasks through a two-stage generate -> score pipeline.
+
+        Generation workers pull tasks from the front of the list, so runs are
+        dispatched in the given order. Generated code is handed to scoring
+        workers through a bounded queue, so scoring run N overlaps generating
+        run N+1 while a slow judge applies backpressure to generation. Each run
+        stays on the backend picked for it by the pool in both stages.
+        """
+        all_results: list[EvaluationResult] = []
+        if not evaluation_tasks:
+            return all_results
+
+        # Concurrency settings are per backend. With adaptive concurrency,
+        # workers cover the upper bound and the client's limiters decide how
+        # many are actually admitted
+        if self.config.adaptive_concurrency:
+            generation_workers = scoring_workers = self.config.adaptive_max_concurrency
+        else:
+            generation_workers = (
+                self.config.generation_concurrency or self.config.max_concurrent_requests
+            )
+            scoring_workers = (
+                self.config.evaluation_concurrency or self.config.max_concurrent_requests
+            )
+        generation_workers *= len(pool.clients)
+        scoring_workers *= len(pool.clients)
+        generation_stats = StageStats(
+            name="generation", workers=min(generation_workers, len(evaluation_tasks))
+        )
+        scoring_stats = StageStats(
+            name="scoring", workers=min(scoring_workers, len(evaluation_tasks))
+        )
+        self.stage_stats = [generation_stats, scoring_stats]
+        for stats in self.stage_stats:
+            console.print(f"{stats.name.capitalize()} workers: {stats.workers}")
+
+        # Dispatch queue preserves the task order; workers pull from the front
+        task_queue: asyncio.Queue[tuple[EvaluationPrompt, AgentMode, int]] = asyncio.Queue()
+        for item in evaluation_tasks:
+            task_queue.put_nowait(item)
+        scoring_queue: asyncio.Queue[tuple[BackendClient, GeneratedRun] | None] = asyncio.Queue(
+            maxsize=self.config.pipeline_queue_size
+        )
+
+        # Run evaluations with progress bar
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeRemainingColumn(),
+            console=console,
+        ) as progress:
+            task_id = progress.add_task("[cyan]Running evaluations", total=len(evaluation_tasks))
+
+            async def generation_worker() -> None:
+                while True:
+                    try:
+                        prompt, mode, run_num = task_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+
+                    generation_stats.record_queue_depth(task_queue.qsize())
+                    client = pool.acquire()
+                    started = time.monotonic()
+                    with self.live_metrics.stage("generation"):
+                        generated = await self._generate(client, prompt, mode, run_num)
+                    generation_stats.record_processed(time.monotonic() - started)
+
+                    await scoring_queue.put((client, generated))
+                    scoring_stats.record_queue_depth(scoring_queue.qsize())
+
+            async def run_generation() -> None:
+                async with asyncio.TaskGroup() as tg:
+                    for _ in range(generation_stats.workers):
+                        tg.create_task(generation_worker())
+                # One sentinel per scoring worker signals the end of input
+                for _ in range(scoring_stats.workers):
+                    await scoring_queue.put(None)
+
+            async def scoring_worker() -> None:
+                while True:
+                    item = await scoring_queue.get()
+                    if item is None:
+                        return
+
+                    client, generated = item
+                    started = time.monotonic()
+                    try:
+                        with self.live_metrics.stage("scoring"):
+                            result = await self._score(client, generated)
+                    finally:
+                        pool.release(client)
+                    scoring_stats.record_processed(time.monotonic() - started)
+
                     all_results.append(result)
                     self.results.append(result)
+                    self.live_metrics.record_result(result)
                     progress.update(task_id, advance=1)
 
-                    # Save checkpoint every 10 evaluations
-                    if len(all_results) % 10 == 0:
-                        await self._save_checkpoint()
+                    await self._save_checkpoint(result)
 
-        # Final checkpoint
-        await self._save_checkpoint()
+            pipeline_start = time.monotonic()
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(run_generation())
+                for _ in range(scoring_stats.workers):
+                    tg.create_task(scoring_worker())
+            elapsed = time.monotonic() - pipeline_start
 
-        console.print("\n[bold green]Evaluation complete![/bold green]")
-        console.print(f"Total evaluations: {len(all_results)}")
-        console.print(f"Successful: {sum(1 for r in all_results if r.success)}")
-        console.print(f"Failed: {sum(1 for r in all_results if not r.success)}")
+        for stats in self.stage_stats:
+            console.print(
+                f"{stats.name.capitalize()} stage: {stats.processed} runs, "
+                f"utilization {stats.utilization(elapsed):.0%}, "
+                f"queue depth mean {stats.mean_queue_depth:.1f} / max {stats.max_queue_depth}"
+            )
+        self._save_pipeline_stats(elapsed)
 
         return all_results
 
-    async def _save_checkpoint(self) -> None:
-        """Save intermediate checkpoint of results."""
+    def _save_pipeline_stats(self, elapsed: float) -> None:
+        """Save per-stage pipeline metrics next to the results."""
         if not self.output_dir:
             return
 
-        checkpoint_file = self.output_dir / "checkpoint.json"
-        data = [r.to_dict() for r in self.results]
-
-        with open(checkpoint_file, "w") as f:
+        data = {
+            "wall_time": elapsed,
+            "stages": [stats.to_dict(elapsed) for stats in self.stage_stats],
+        }
+        with open(self.output_dir / "pipeline_stats.json", "w") as f:
             json.dump(data, f, indent=2)
+
+    async def _save_checkpoint(self, result: EvaluationResult) -> None:
+        """Queue a finished run for the checkpoint journal."""
+        if not self.journal:
+            return
+
+        self._get_writer().append(result)
+
+    async def _compact_checkpoint(self) -> None:
+        """Replace the checkpoint journal with the final checkpoint.json."""
+        if not self.journal:
+            return
+
+        await asyncio.to_thread(self.journal.compact, self.results)
@@ -1,7 +1,11 @@
 """Statistical metrics and analysis for evaluation results."""
 
+import functools
+import inspect
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 import numpy as np
@@ -9,10 +13,59 @@ import pandas as pd
 from scipy import stats
 from scipy.stats import mannwhitneyu, ttest_ind
 
-from .config import EvaluationResult
+from .bootstrap import BootstrapJob, run_bootstrap
+from .config import TIMING_PHASES, EvaluationResult
+from .cube import CUBE_MODES, ResultsCube, summarize
+from .dataset import ResultsDataset
+from .store import ANALYSIS_COLUMNS, TIMING_COLUMNS, ResultsStore, content_size
 
 logger = logging.getLogger(__name__)
 
+# Throughput columns derived from the token and size columns: (name, numerator, denominator)
+THROUGHPUT_COLUMNS = [
+    ("tokens_per_second", "output_tokens", "response_time"),
+    ("chars_per_second", "response_chars", "response_time"),
+    ("tokens_per_line", "output_tokens", "response_lines"),
+]
+
+# Metrics summarized per prompt and mode: (key, column, remove outliers)
+PROMPT_SUMMARY_METRICS = [
+    ("response_time", "response_time", True),  # Always remove outliers for response time
+    ("overall_score", "overall_score", False),  # Keep all score data
+    ("code_quality", "code_quality_score", False),
+    ("architecture", "architecture_score", False),
+    ("performance", "performance_score", False),
+    ("accessibility", "accessibility_score", False),
+]
+
+# Metrics checked for anomalous values
+ANOMALY_METRICS = tuple(column for _, column, _ in PROMPT_SUMMARY_METRICS)
+
+# Metrics with bootstrap intervals, and the quantiles bootstrapped besides mean and median
+BOOTSTRAP_METRICS = ANOMALY_METRICS
+BOOTSTRAP_QUANTILES = {"response_time": {"p90": 0.9, "p99": 0.99}}
+
+
+def _memoized(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Cache a ``MetricsCollector`` method's result per data version and arguments.
+
+    Arguments are normalized with their defaults, so ``compare_modes("x")``
+    and ``compare_modes("x", None)`` share an entry. Cached results are
+    shared between callers and must not be modified.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self: "MetricsCollector", *args: Any, **kwargs: Any) -> Any:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (self.data_version, method.__name__, *list(bound.arguments.values())[1:])
+        if key not in self._memo:
+            self._memo[key] = method(self, *args, **kwargs)
+        return self._memo[key]
+
+    return wrapper
+
 
 @dataclass
 class StatisticalSummary:
@@ -52,31 +105,139 @@ class ComparisonResult:
 
 
 class MetricsCollector:
-    """Collect and analyze metrics from evaluation results."""
-
-    def __init__(self, results: list[EvaluationResult], confidence_level: float = 0.95, remove_outliers: bool = False):
+    """Collect and analyze metrics from evaluation results.
+
+    Summaries, comparisons and other derived statistics are computed once per
+    data version and reused. Assigning ``df`` or calling ``add_results()``
+    starts a new version; modifying ``df`` in place does not.
+    """
+
+    def __init__(
+        self,
+        results: list[EvaluationResult] | None,
+        confidence_level: float = 0.95,
+        remove_outliers: bool = False,
+        df: pd.DataFrame | None = None,
+        results_loader: Callable[[list[int] | None], list[EvaluationResult]] | None = None,
+    ):
         """Initialize metrics collector.
 
         Args:
-            results: List of evaluation results
+            results: List of evaluation results. May be None when ``df`` is given.
             confidence_level: Confidence level for statistical tests (default: 0.95)
             remove_outliers: Whether to remove outliers from calculations (default: False)
                             Note: Outlier removal can mask variance and reduce statistical power
+            df: Precomputed metrics DataFrame, e.g. loaded from the results store
+            results_loader: Loads results in ``df`` row order when ``results``
+                is None: all of them, or those at the row positions given.
+                Only called if result objects are needed (``results_at()``).
         """
-        self.results = results
+        self._results = results
+        self._results_loader = results_loader
         self.confidence_level = confidence_level
         self.alpha = 1 - confidence_level
         self.remove_outliers = remove_outliers
         # Number of metrics compared - used for Bonferroni correction
         self.num_comparisons = 6  # response_time, overall_score, code_quality, architecture, performance, accessibility
 
+        # Summaries and comparisons computed for the current data, see _memoized
+        self.data_version = 0
+        self._memo: dict[tuple[Any, ...], Any] = {}
+        self._cube: ResultsCube | None = None
+
         # Convert to DataFrame for easier analysis
-        self.df = self._results_to_dataframe()
+        self._df = self._add_throughput_columns(
+            df if df is not None else self._results_to_dataframe(self.results)
+        )
+
+    @classmethod
+    def from_store(
+        cls, output_dir: Path, confidence_level: float = 0.95, remove_outliers: bool = False
+    ) -> "MetricsCollector":
+        """Create a collector from the results store of an output directory.
 
-    def _results_to_dataframe(self) -> pd.DataFrame:
+        Args:
+            output_dir: Evaluation output directory containing ``results.sqlite``
+            confidence_level: Confidence level for statistical tests (default: 0.95)
+            remove_outliers: Whether to remove outliers from calculations (default: False)
+        """
+        store = ResultsStore.for_output_dir(output_dir)
+        return cls(
+            None,
+            confidence_level=confidence_level,
+            remove_outliers=remove_outliers,
+            df=store.load_dataframe(),
+            results_loader=lambda rows: store.load_results(rows=rows),
+        )
+
+    @classmethod
+    def from_dataset(
+        cls,
+        dataset: ResultsDataset,
+        confidence_level: float = 0.95,
+        remove_outliers: bool = False,
+        **filters: Any,
+    ) -> "MetricsCollector":
+        """Create a collector from a cached results dataset.
+
+        Args:
+            dataset: Results dataset of an output directory
+            confidence_level: Confidence level for statistical tests (default: 0.95)
+            remove_outliers: Whether to remove outliers from calculations (default: False)
+            **filters: Filters passed to ``ResultsDataset.query()``
+        """
+        return cls(
+            None,
+            confidence_level=confidence_level,
+            remove_outliers=remove_outliers,
+            df=dataset.query(columns=ANALYSIS_COLUMNS, **filters),
+            results_loader=lambda rows: dataset.load_results(rows=rows, **filters),
+        )
+
+    @property
+    def results(self) -> list[EvaluationResult]:
+        """Evaluation results, in DataFrame row order."""
+        if self._results is None:
+            self._results = self._results_loader(None) if self._results_loader else []
+        return self._results
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """Metrics DataFrame, one row per run."""
+        return self._df
+
+    @df.setter
+    def df(self, df: pd.DataFrame) -> None:
+        # New data: start a new version, dropping everything computed from the old one
+        self._df = df
+        self.data_version += 1
+        self._memo.clear()
+        self._cube = None
+
+    def add_results(self, results: list[EvaluationResult]) -> None:
+        """Append results; cached statistics are recomputed on next use.
+
+        Args:
+            results: New evaluation results
+        """
+        rows = self._add_throughput_columns(self._results_to_dataframe(results))
+        self._results = self.results + list(results)
+        self.df = pd.concat([self.df, rows], ignore_index=True) if len(self.df) else rows
+
+    @property
+    def cube(self) -> ResultsCube:
+        """Metric values as a prompt × mode × metric × run array, built on first use."""
+        if self._cube is None:
+            self._cube = ResultsCube(self.df)
+        return self._cube
+
+    @staticmethod
+    def _results_to_dataframe(results: list[EvaluationResult]) -> pd.DataFrame:
         """Convert evaluation results to pandas DataFrame."""
         data = []
-        for result in self.results:
+        for result in results:
+            timings = result.metadata.get("timings", {})
+            usage = result.metadata.get("token_usage") or {}
             data.append(
                 {
                     "prompt_id": result.prompt_id,
@@ -84,6 +245,10 @@ class MetricsCollector:
                     "mode": result.mode.value,
                     "run_number": result.run_number,
                     "response_time": result.response_time,
+                    "total_tokens": result.total_tokens,
+                    "input_tokens": usage.get("input_tokens"),
+                    "output_tokens": usage.get("output_tokens"),
+                    **content_size(result.response_content),
                     "overall_score": result.overall_score,
                     "code_quality_score": result.code_quality_score,
                     "architecture_score": result.architecture_score,
@@ -91,9 +256,27 @@ class MetricsCollector:
                     "accessibility_score": result.accessibility_score,
                     "success": result.success,
                     "has_error": result.error is not None,
+                    "generation_concurrency": result.metadata.get("generation_concurrency"),
+                    "evaluation_concurrency": result.metadata.get("evaluation_concurrency"),
+                    **{
+                        column: timings.get(phase)
+                        for phase, column in zip(TIMING_PHASES, TIMING_COLUMNS, strict=True)
+                    },
                 }
             )
-        return pd.DataFrame(data)
+        return pd.DataFrame(data, columns=ANALYSIS_COLUMNS)
+
+    @staticmethod
+    def _add_throughput_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """Derive token and character throughput; NaN where an input is missing or 0."""
+        df = df.copy()
+        for name, numerator, denominator in THROUGHPUT_COLUMNS:
+            if numerator not in df or denominator not in df:
+                continue
+            num = pd.to_numeric(df[numerator], errors="coerce")
+            den = pd.to_numeric(df[denominator], errors="coerce")
+            df[name] = num / den.where(den > 0)
+        return df
 
     def _remove_outliers_iqr(self, values: np.ndarray) -> np.ndarray:
         """Remove outliers using the IQR (Interquartile Range) method.
@@ -126,14 +309,27 @@ class MetricsCollector:
         # Convert to float array and handle None/NaN values
         try:
             # Convert to float, replacing None with NaN
-            float_values = np.array(values, dtype=np.float64)
-            # Remove NaN values
-            clean_values = float_values[~np.isnan(float_values)]
+            float_values = np.array(values, dtype=np.float64).ravel()
         except (ValueError, TypeError):
             # If conversion fails, return empty summary
-            clean_values = np.array([])
+            float_values = np.array([])
+
+        summary = summarize(float_values, self.confidence_level, remove_outliers)
+        return self._summary_at(summary, (), float_values, len(values))
 
-        if len(clean_values) == 0:
+    @staticmethod
+    def _summary_at(
+        summary: dict[str, np.ndarray], index: tuple[int, ...], values: np.ndarray, rows: int
+    ) -> StatisticalSummary:
+        """Pick one group's summary out of ``summarize()`` arrays.
+
+        Args:
+            summary: Arrays returned by ``summarize()``
+            index: Position of the group in the summary arrays
+            values: The group's values, NaN for missing ones
+            rows: Number of runs in the group, including runs without a value
+        """
+        if summary["n_values"][index] == 0:
             return StatisticalSummary(
                 mean=0,
                 median=0,
@@ -150,68 +346,30 @@ class MetricsCollector:
                 success_rate=0,
             )
 
-        # Calculate quartiles
-        q1, median, q3 = np.percentile(clean_values, [25, 50, 75])
-        iqr = q3 - q1
-
-        # Detect outliers using IQR method
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
-        outliers = clean_values[(clean_values < lower_bound) | (clean_values > upper_bound)]
-
-        # Remove outliers if requested
-        if remove_outliers and len(outliers) > 0:
-            filtered_values = clean_values[
-                (clean_values >= lower_bound) & (clean_values <= upper_bound)
-            ]
-        else:
-            filtered_values = clean_values
-
-        # Calculate statistics
-        mean = np.mean(filtered_values)
-
-        # Handle single sample case
-        if len(filtered_values) == 1:
-            std = 0.0
-            sem = 0.0
-            ci_lower, ci_upper = mean, mean
-        else:
-            std = np.std(filtered_values, ddof=1)  # Sample standard deviation
-            sem = std / np.sqrt(len(filtered_values))  # Standard error
-
-            # Calculate confidence interval
-            ci = stats.t.interval(
-                self.confidence_level, len(filtered_values) - 1, loc=mean, scale=sem
-            )
-            ci_lower, ci_upper = ci
-
+        n_samples = int(summary["n_samples"][index])
+        outliers = values[summary["outlier"][index][: len(values)]]
         return StatisticalSummary(
-            mean=mean,
-            median=median,
-            std=std,
-            min=np.min(filtered_values),
-            max=np.max(filtered_values),
-            q1=q1,
-            q3=q3,
-            iqr=iqr,
-            ci_lower=ci_lower,
-            ci_upper=ci_upper,
+            mean=float(summary["mean"][index]),
+            median=float(summary["median"][index]),
+            std=float(summary["std"][index]),
+            min=float(summary["min"][index]),
+            max=float(summary["max"][index]),
+            q1=float(summary["q1"][index]),
+            q3=float(summary["q3"][index]),
+            iqr=float(summary["iqr"][index]),
+            ci_lower=float(summary["ci_lower"][index]),
+            ci_upper=float(summary["ci_upper"][index]),
             outliers=outliers.tolist(),
-            n_samples=len(filtered_values),
-            success_rate=len(filtered_values) / len(values) if len(values) > 0 else 0,
+            n_samples=n_samples,
+            success_rate=n_samples / rows if rows > 0 else 0,
         )
 
+    @_memoized
     def compare_modes(self, metric: str, prompt_id: str | None = None) -> ComparisonResult:
         """Compare sequential vs parallel modes for a given metric."""
-        # Filter data
-        if prompt_id:
-            data = self.df[self.df["prompt_id"] == prompt_id]
-        else:
-            data = self.df
-
         # Get values for each mode
-        seq_values = data[data["mode"] == "sequential"][metric].dropna().to_numpy()
-        par_values = data[data["mode"] == "parallel"][metric].dropna().to_numpy()
+        seq_values = self.cube.group_values(metric, "sequential", prompt_id or None)
+        par_values = self.cube.group_values(metric, "parallel", prompt_id or None)
 
         # Remove outliers for response_time using IQR method
         if metric == "response_time":
@@ -313,46 +471,35 @@ class MetricsCollector:
             test_used=test_used,
         )
 
+    @_memoized
     def get_prompt_performance(self, prompt_id: str) -> dict[str, Any]:
         """Get detailed performance metrics for a specific prompt."""
-        prompt_data = self.df[self.df["prompt_id"] == prompt_id]
-
-        if prompt_data.empty:
+        p = self.cube.prompt_position(prompt_id)
+        if p is None:
             return {}
 
-        metrics = {}
-        for mode in ["sequential", "parallel"]:
-            mode_data = prompt_data[prompt_data["mode"] == mode]
-
-            if not mode_data.empty:
-                metrics[mode] = {
-                    "response_time": self.calculate_summary(
-                        mode_data["response_time"].to_numpy(),
-                        remove_outliers=True  # Always remove outliers for response time
-                    ),
-                    "overall_score": self.calculate_summary(
-                        mode_data["overall_score"].to_numpy(),
-                        remove_outliers=False  # Keep all score data
-                    ),
-                    "code_quality": self.calculate_summary(
-                        mode_data["code_quality_score"].to_numpy(),
-                        remove_outliers=False  # Keep all score data
-                    ),
-                    "architecture": self.calculate_summary(
-                        mode_data["architecture_score"].to_numpy(),
-                        remove_outliers=False  # Keep all score data
-                    ),
-                    "performance": self.calculate_summary(
-                        mode_data["performance_score"].to_numpy(),
-                        remove_outliers=False  # Keep all score data
-                    ),
-                    "accessibility": self.calculate_summary(
-                        mode_data["accessibility_score"].to_numpy(),
-                        remove_outliers=False  # Keep all score data
-                    ),
-                    "success_rate": mode_data["success"].mean(),
-                    "error_rate": mode_data["has_error"].mean(),
-                }
+        summaries = self._get_prompt_summaries()
+        values = self.cube.values
+        success = self.cube.metric_index("success")
+        has_error = self.cube.metric_index("has_error")
+
+        metrics: dict[str, Any] = {}
+        for m, mode in enumerate(CUBE_MODES):
+            rows = int(self.cube.rows[p, m])
+            if rows == 0:
+                continue
+
+            metrics[mode] = {
+                key: self._summary_at(
+                    summaries,
+                    (p, m, j),
+                    values[p, m, self.cube.metric_index(column), :rows],
+                    rows,
+                )
+                for j, (key, column, _) in enumerate(PROMPT_SUMMARY_METRICS)
+            }
+            metrics[mode]["success_rate"] = float(np.nanmean(values[p, m, success, :rows]))
+            metrics[mode]["error_rate"] = float(np.nanmean(values[p, m, has_error, :rows]))
 
         # Add comparison
         metrics["comparison"] = {
@@ -366,6 +513,18 @@ class MetricsCollector:
 
         return metrics
 
+    @_memoized
+    def _get_prompt_summaries(self) -> dict[str, np.ndarray]:
+        """Summaries of ``PROMPT_SUMMARY_METRICS`` for all prompts and modes at once.
+
+        Returns:
+            ``summarize()`` arrays indexed by (prompt, mode, metric)
+        """
+        columns = [self.cube.metric_index(column) for _, column, _ in PROMPT_SUMMARY_METRICS]
+        remove = np.array([remove for _, _, remove in PROMPT_SUMMARY_METRICS])
+        return summarize(self.cube.values[:, :, columns, :], self.confidence_level, remove)
+
+    @_memoized
     def get_overall_statistics(self) -> dict[str, Any]:
         """Get overall statistics across all prompts."""
         stats = {
@@ -382,6 +541,8 @@ class MetricsCollector:
                 "count": len(mode_data),
                 "success_rate": mode_data["success"].mean(),
                 "avg_response_time": mode_data["response_time"].mean(),
+                "avg_queue_wait": mode_data["timing_backend_queue_wait"].mean(),
+                "avg_processing_time": mode_data["timing_backend_processing"].mean(),
                 "avg_overall_score": mode_data["overall_score"].mean(),
                 "avg_code_quality": mode_data["code_quality_score"].mean(),
                 "avg_architecture": mode_data["architecture_score"].mean(),
@@ -402,39 +563,191 @@ class MetricsCollector:
 
         return stats
 
-    def detect_anomalies(self, threshold: float = 3.0) -> list[EvaluationResult]:
-        """Detect anomalous results using z-score method."""
-        anomalies = []
-
-        for metric in ["response_time", "overall_score"]:
-            values = self.df[metric].dropna()
-            # Need at least 2 values with variance to calculate z-scores
-            if len(values) > 1 and values.std() > 0:
-                try:
-                    z_scores = np.abs(stats.zscore(values))
-                    anomaly_indices = self.df.index[z_scores > threshold].tolist()
-
-                    for idx in anomaly_indices:
-                        if idx < len(self.results):
-                            anomalies.append(self.results[idx])
-                except (ValueError, RuntimeError) as e:
-                    logger.warning(
-                        f"Cannot calculate z-scores for {metric}, skipping anomaly detection: {e}"
-                    )
+    @_memoized
+    def get_token_efficiency(self) -> dict[str, dict[str, float]]:
+        """Token usage and throughput of successful runs per mode.
+
+        Output tokens per second and per generated (non-blank) line show how
+        efficiently each mode turns tokens into code, next to its latency.
+        Runs without token counts (backends that do not report usage) only
+        contribute to the character and latency figures.
+
+        Returns:
+            Means per mode, plus the number of runs with token counts
+        """
+        def mean(data: pd.DataFrame, column: str) -> float:
+            values = pd.to_numeric(data[column], errors="coerce").dropna()
+            return float(values.mean()) if len(values) else float("nan")
+
+        efficiency: dict[str, dict[str, float]] = {}
+        successful = self.df[self.df["success"].astype(bool)]
+        for mode in ["sequential", "parallel"]:
+            mode_data = successful[successful["mode"] == mode]
+            if mode_data.empty:
+                continue
+
+            efficiency[mode] = {
+                "runs_with_tokens": int(mode_data["output_tokens"].notna().sum()),
+                "avg_response_time": mean(mode_data, "response_time"),
+                "avg_input_tokens": mean(mode_data, "input_tokens"),
+                "avg_output_tokens": mean(mode_data, "output_tokens"),
+                "avg_total_tokens": mean(mode_data, "total_tokens"),
+                "avg_tokens_per_second": mean(mode_data, "tokens_per_second"),
+                "avg_chars_per_second": mean(mode_data, "chars_per_second"),
+                "avg_tokens_per_line": mean(mode_data, "tokens_per_line"),
+            }
+        return efficiency
+
+    @_memoized
+    def get_latency_breakdown(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Break the latency of each mode down into its phases.
+
+        Only successful runs are included, so that phases cut short by errors
+        do not skew the breakdown. Phases no run recorded are left out.
+
+        Returns:
+            Mean and median seconds, and the number of runs, per mode and phase
+        """
+        breakdown: dict[str, dict[str, dict[str, float]]] = {}
+        successful = self.df[self.df["success"].astype(bool)]
+        for mode in ["sequential", "parallel"]:
+            mode_data = successful[successful["mode"] == mode]
+            phases = {}
+            for phase, column in zip(TIMING_PHASES, TIMING_COLUMNS, strict=True):
+                values = pd.to_numeric(mode_data[column], errors="coerce").dropna()
+                if values.empty:
                     continue
+                phases[phase] = {
+                    "mean": float(values.mean()),
+                    "median": float(values.median()),
+                    "n": len(values),
+                }
+            breakdown[mode] = phases
+        return breakdown
+
+    @_memoized
+    def get_bootstrap_intervals(
+        self,
+        resamples: int = 10_000,
+        seed: int = 0,
+        workers: int | None = None,
+        metrics: tuple[str, ...] = BOOTSTRAP_METRICS,
+    ) -> dict[str, Any]:
+        """Bootstrap confidence intervals per mode, overall and for each prompt.
+
+        Percentile intervals need no normality assumption, which suits
+        bounded scores and skewed response times better than t-intervals.
+        Each mode gets intervals for the mean and median of each metric, plus
+        p90 and p99 of response time; each comparison gets an interval for
+        Cohen's d. Effect sizes use the same samples as ``compare_modes()``
+        (IQR-filtered response times), so the interval brackets its effect
+        size. Runs are resampled, all metrics at once; see ``bootstrap``.
 
-        # Remove duplicates by keeping track of seen result indices
-        seen_indices = set()
-        unique_anomalies = []
-        for anomaly in anomalies:
-            # Use result index as unique identifier
-            result_idx = self.results.index(anomaly)
-            if result_idx not in seen_indices:
-                seen_indices.add(result_idx)
-                unique_anomalies.append(anomaly)
+        Args:
+            resamples: Bootstrap resamples per group
+            seed: Seed of the random streams, for reproducible intervals
+            workers: Worker processes (default: CPU count; 1 runs in-process)
+            metrics: Metric columns to bootstrap
 
-        return unique_anomalies
+        Returns:
+            ``overall`` and ``prompts`` (by prompt ID) intervals, each with
+            ``sequential`` and ``parallel`` (metric → statistic) and
+            ``effect_size`` (metric) entries holding ``estimate``,
+            ``ci_lower`` and ``ci_upper``
+        """
+        columns = [self.cube.metric_index(metric) for metric in metrics]
+        jobs = []
+        for p, prompt_id in [(None, None), *enumerate(self.cube.prompts)]:
+            groups = {}
+            for m, mode in enumerate(CUBE_MODES):
+                if p is None:
+                    # (prompts, metrics, runs) -> (prompts × runs, metrics), without padding
+                    values = self.cube.values[:, m, columns, :].transpose(0, 2, 1)
+                    groups[mode] = values[self.cube.positions[:, m, :] >= 0]
+                else:
+                    groups[mode] = self.cube.values[p, m, columns, : self.cube.rows[p, m]].T
+            jobs.append(
+                BootstrapJob(
+                    key=prompt_id,
+                    metrics=list(metrics),
+                    groups=groups,
+                    quantiles=BOOTSTRAP_QUANTILES,
+                    effect_size=CUBE_MODES,
+                    effect_values={
+                        mode: self._comparison_values(values, list(metrics))
+                        for mode, values in groups.items()
+                    },
+                )
+            )
 
+        results = run_bootstrap(jobs, resamples, self.confidence_level, seed, workers)
+        return {
+            "overall": results.pop(None),
+            "prompts": results,
+        }
+
+    def _comparison_values(self, values: np.ndarray, metrics: list[str]) -> np.ndarray:
+        """Values as ``compare_modes()`` sees them: response time outliers set to NaN."""
+        if "response_time" not in metrics:
+            return values
+        filtered = values.copy()
+        column = filtered[:, metrics.index("response_time")]
+        present = column[~np.isnan(column)]
+        column[~np.isin(column, self._remove_outliers_iqr(present))] = np.nan
+        return filtered
+
+    @_memoized
+    def detect_anomalies(
+        self,
+        threshold: float = 3.0,
+        metrics: tuple[str, ...] = ANOMALY_METRICS,
+        grouped: bool = True,
+    ) -> list[int]:
+        """Detect anomalous runs using the z-score method.
+
+        A run is anomalous if any metric lies more than ``threshold`` standard
+        deviations from the mean. With ``grouped``, means and deviations are
+        per prompt and mode, so a slow complex prompt is not flagged against
+        easy ones. Groups without variance flag nothing. All metrics and groups
+        are scored in one pass over the results cube.
+
+        Args:
+            threshold: Absolute z-score above which a value is anomalous
+            metrics: Metric columns to check
+            grouped: Score within each prompt and mode instead of across all runs
+
+        Returns:
+            DataFrame row positions of anomalous runs, ascending; see ``results_at()``
+        """
+        cube = self.cube
+        values = cube.values[:, :, [cube.metric_index(metric) for metric in metrics], :]
+        # Statistics along the run axis, or across all prompts, modes and runs
+        axis = -1 if grouped else (0, 1, 3)
+
+        present = ~np.isnan(values)
+        count = present.sum(axis=axis, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(present, values, 0.0).sum(axis=axis, keepdims=True) / count
+            deviations = np.where(present, values - mean, 0.0)
+            std = np.sqrt((deviations**2).sum(axis=axis, keepdims=True) / count)
+            z_scores = np.abs(deviations) / np.where(std > 0, std, np.nan)
+            anomalous = (z_scores > threshold).any(axis=2)
+
+        return sorted(cube.positions[anomalous].tolist())
+
+    def results_at(self, rows: list[int]) -> list[EvaluationResult]:
+        """Evaluation results at DataFrame row positions, e.g. detected anomalies.
+
+        Until all results are needed, only the results at ``rows`` are loaded.
+        """
+        if not rows:
+            return []
+        if self._results is None and self._results_loader is not None:
+            return self._results_loader(list(rows))
+        results = self.results
+        return [results[row] for row in rows]
+
+    @_memoized
     def calculate_statistical_power(self, metric: str, prompt_id: str | None = None) -> float:
         """Calculate post-hoc statistical power for a comparison.
 
@@ -454,13 +767,8 @@ class MetricsCollector:
             return float('nan')
 
         # Get sample sizes
-        if prompt_id:
-            data = self.df[self.df["prompt_id"] == prompt_id]
-        else:
-            data = self.df
-
-        n_seq = len(data[data["mode"] == "sequential"])
-        n_par = len(data[data["mode"] == "parallel"])
+        n_seq = self.cube.group_rows("sequential", prompt_id or None)
+        n_par = self.cube.group_rows("parallel", prompt_id or None)
 
         if n_seq < 2 or n_par < 2:
             return float('nan')
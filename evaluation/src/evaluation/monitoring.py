@@ -0,0 +1,289 @@
+"""Live metrics of a running evaluation: Prometheus endpoint and JSON snapshots."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import time
+from collections import Counter, deque
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+
+from .client import BackendClient
+from .config import AgentMode, EvaluationResult
+
+logger = logging.getLogger(__name__)
+
+LIVE_METRICS_FILE = "live_metrics.json"
+
+# Histogram bucket upper bounds, seconds
+LATENCY_BUCKETS = (1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+# Trailing window for the throughput gauge, seconds
+THROUGHPUT_WINDOW = 60.0
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Cumulative latency histogram with Prometheus semantics."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        """Initialize an empty histogram with the given bucket upper bounds."""
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "buckets": {str(bound): n for bound, n in zip(self.buckets, self.counts, strict=True)},
+        }
+
+
+class LiveMetrics:
+    """Counters, gauges and histograms updated while an evaluation runs.
+
+    All updates happen on the event loop, so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize all metrics at zero."""
+        self.started_at = datetime.now()
+        self._started = time.monotonic()
+        self.runs: Counter[tuple[str, str]] = Counter()  # (mode, "success"/"failed")
+        self.in_flight: dict[str, int] = {"generation": 0, "scoring": 0}
+        self.response_time = {mode.value: Histogram() for mode in AgentMode}
+        self.evaluation_latency = {mode.value: Histogram() for mode in AgentMode}
+        self._completions: deque[float] = deque()
+        self._clients: list[BackendClient] = []
+
+    def track_clients(self, clients: Sequence[BackendClient]) -> None:
+        """Include the error counters of these backend clients."""
+        self._clients.extend(clients)
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Count a run as in flight in a pipeline stage for the duration of the block."""
+        self.in_flight[name] = self.in_flight.get(name, 0) + 1
+        try:
+            yield
+        finally:
+            self.in_flight[name] -= 1
+
+    def record_result(self, result: EvaluationResult) -> None:
+        """Record a finished run."""
+        mode = result.mode.value
+        self.runs[mode, "success" if result.success else "failed"] += 1
+        if result.response_time:
+            self.response_time[mode].observe(result.response_time)
+        self._completions.append(time.monotonic())
+
+    def record_evaluation_latency(self, mode: AgentMode, latency: float) -> None:
+        """Record the duration of one LLM-judge evaluation call."""
+        self.evaluation_latency[mode.value].observe(latency)
+
+    def throughput_per_minute(self) -> float:
+        """Runs finished per minute over the trailing window."""
+        now = time.monotonic()
+        while self._completions and self._completions[0] < now - THROUGHPUT_WINDOW:
+            self._completions.popleft()
+        window = min(THROUGHPUT_WINDOW, now - self._started)
+        return len(self._completions) * 60.0 / window if window > 0 else 0.0
+
+    def backend_errors(self) -> Counter[tuple[str, str, str]]:
+        """Failed backend requests by (backend URL, operation, error code)."""
+        errors: Counter[tuple[str, str, str]] = Counter()
+        for client in self._clients:
+            for (operation, code), count in client.error_counts.items():
+                errors[client.base_url, operation, code] += count
+        return errors
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current values of all metrics."""
+        completed = sum(n for (_, status), n in self.runs.items() if status == "success")
+        failed = sum(n for (_, status), n in self.runs.items() if status == "failed")
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "started_at": self.started_at.isoformat(),
+            "elapsed": time.monotonic() - self._started,
+            "runs": {
+                "completed": completed,
+                "failed": failed,
+                "by_mode": {
+                    mode.value: {
+                        "completed": self.runs[mode.value, "success"],
+                        "failed": self.runs[mode.value, "failed"],
+                    }
+                    for mode in AgentMode
+                },
+            },
+            "in_flight": dict(self.in_flight),
+            "throughput_per_minute": self.throughput_per_minute(),
+            "response_time": {m: h.to_dict() for m, h in self.response_time.items()},
+            "evaluation_latency": {m: h.to_dict() for m, h in self.evaluation_latency.items()},
+            "backend_errors": [
+                {"backend": backend, "operation": operation, "code": code, "count": count}
+                for (backend, operation, code), count in sorted(self.backend_errors().items())
+            ],
+        }
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        header("codecrdt_runs_total", "counter", "Finished evaluation runs.")
+        for mode in AgentMode:
+            for status in ("success", "failed"):
+                lines.append(
+                    f'codecrdt_runs_total{{mode="{mode.value}",status="{status}"}} '
+                    f"{self.runs[mode.value, status]}"
+                )
+
+        header("codecrdt_runs_in_flight", "gauge", "Runs currently in a pipeline stage.")
+        for stage, count in self.in_flight.items():
+            lines.append(f'codecrdt_runs_in_flight{{stage="{stage}"}} {count}')
+
+        header(
+            "codecrdt_throughput_runs_per_minute",
+            "gauge",
+            f"Runs finished per minute over the last {THROUGHPUT_WINDOW:.0f} seconds.",
+        )
+        lines.append(f"codecrdt_throughput_runs_per_minute {self.throughput_per_minute():.4f}")
+
+        for name, histograms, help_text in (
+            ("codecrdt_response_time_seconds", self.response_time, "Generation response time."),
+            (
+                "codecrdt_evaluation_latency_seconds",
+                self.evaluation_latency,
+                "LLM-judge evaluation call latency.",
+            ),
+        ):
+            header(name, "histogram", help_text)
+            for mode, histogram in histograms.items():
+                for bound, count in zip(histogram.buckets, histogram.counts, strict=True):
+                    lines.append(f'{name}_bucket{{mode="{mode}",le="{bound:g}"}} {count}')
+                lines.append(f'{name}_bucket{{mode="{mode}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{name}_sum{{mode="{mode}"}} {histogram.sum:.6f}')
+                lines.append(f'{name}_count{{mode="{mode}"}} {histogram.count}')
+
+        header("codecrdt_backend_errors_total", "counter", "Failed backend requests.")
+        for (backend, operation, code), count in sorted(self.backend_errors().items()):
+            lines.append(
+                f'codecrdt_backend_errors_total{{backend="{backend}",'
+                f'operation="{operation}",code="{code}"}} {count}'
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """Publish live metrics over HTTP and as a periodically rewritten JSON file.
+
+    ``GET /metrics`` returns the Prometheus text format and ``GET
+    /metrics.json`` the JSON snapshot. The file is replaced atomically, so
+    readers never see a partial snapshot.
+    """
+
+    def __init__(
+        self,
+        metrics: LiveMetrics,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+        json_path: Path | None = None,
+        interval: float = 10.0,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            metrics: Metrics to publish
+            host: Interface the HTTP endpoint listens on
+            port: Port of the HTTP endpoint (None disables it)
+            json_path: File the JSON snapshot is written to (None disables it)
+            interval: Seconds between JSON snapshots
+        """
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self.json_path = json_path
+        self.interval = interval
+        self._runner: web.AppRunner | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start the HTTP endpoint and the snapshot writer."""
+        if self.port is not None:
+            app = web.Application()
+            app.router.add_get("/metrics", self._handle_prometheus)
+            app.router.add_get("/metrics.json", self._handle_json)
+            self._runner = web.AppRunner(app, access_log=None)
+            await self._runner.setup()
+            await web.TCPSite(self._runner, self.host, self.port).start()
+            logger.info(f"Live metrics at http://{self.host}:{self.port}/metrics")
+
+        if self.json_path is not None:
+            self._writer_task = asyncio.create_task(self._write_loop())
+
+    async def stop(self) -> None:
+        """Stop publishing; the JSON file is left with a final snapshot."""
+        if self._writer_task:
+            self._writer_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer_task
+            self._writer_task = None
+            await self._write_snapshot()
+
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_prometheus(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.metrics.render_prometheus().encode(),
+            headers={"Content-Type": PROMETHEUS_CONTENT_TYPE},
+        )
+
+    async def _handle_json(self, request: web.Request) -> web.Response:
+        return web.json_response(self.metrics.snapshot())
+
+    async def _write_loop(self) -> None:
+        while True:
+            await self._write_snapshot()
+            await asyncio.sleep(self.interval)
+
+    async def _write_snapshot(self) -> None:
+        assert self.json_path is not None
+        try:
+            await asyncio.to_thread(_write_json_atomic, self.json_path, self.metrics.snapshot())
+        except OSError as e:
+            logger.warning(f"Failed to write live metrics: {e}")
+
+
+def _write_json_atomic(path: Path, data: dict[str, Any]) -> None:
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
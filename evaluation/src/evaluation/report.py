@@ -14,8 +14,9 @@ from matplotlib.backends.backend_pdf import PdfPages
 from rich.console import Console
 from rich.table import Table
 
-from .config import EvaluationResult
+from .config import TIMING_PHASES, EvaluationResult
 from .metrics import MetricsCollector
+from .sampling import load_sampling_summary
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -28,17 +29,37 @@ sns.set_palette("husl")
 class ReportGenerator:
     """Generate comprehensive evaluation reports."""
 
-    def __init__(self, results: list[EvaluationResult], output_dir: Path, config: dict[str, Any]):
-        """Initialize the report generator."""
+    def __init__(
+        self,
+        results: list[EvaluationResult] | None,
+        output_dir: Path,
+        config: dict[str, Any],
+        metrics: MetricsCollector | None = None,
+    ):
+        """Initialize the report generator.
+
+        Args:
+            results: Evaluation results to report on. May be None when
+                ``metrics`` is given; results are then loaded only where the
+                report lists individual runs.
+            output_dir: Directory the report is written to
+            config: Report configuration
+            metrics: Metrics collector to reuse, e.g. one loaded from the results store
+        """
+        if results is None and metrics is None:
+            raise ValueError("Either results or metrics must be given")
         self.results = results
         self.output_dir = output_dir
         self.config = config
-        self.metrics = MetricsCollector(
+        self.metrics = metrics or MetricsCollector(
             results,
             confidence_level=config.get("confidence_level", 0.95),
             remove_outliers=config.get("remove_outliers", False)
         )
 
+        # Stopping rule and decisions of an adaptively sampled evaluation
+        self.sampling = load_sampling_summary(output_dir)
+
         # Ensure visualization directory exists
         self.viz_dir = output_dir / "visualizations"
         self.viz_dir.mkdir(exist_ok=True)
@@ -89,11 +110,12 @@ class ReportGenerator:
                 "title": "CRDT Agentic Synchronization Evaluation Results",
                 "timestamp": datetime.now().isoformat(),
                 "version": "1.0.0",
-                "total_evaluations": len(self.results),
+                "total_evaluations": len(self.metrics.df),
                 "configuration": {
                     "runs_per_prompt": self.config.get("runs_per_prompt"),
                     "confidence_level": self.config.get("confidence_level", 0.95),
                     "backend_url": self.config.get("backend_url"),
+                    "backend_urls": self.config.get("backend_urls"),
                     "outlier_removal": "response_time only",
                 },
                 "notes": {
@@ -113,6 +135,17 @@ class ReportGenerator:
             "prompt_results": self._format_prompt_results(),
             "statistical_significance": self._format_statistical_tests(),
         }
+        latency = self._format_latency_breakdown()
+        if latency:
+            report["latency_breakdown"] = latency
+        efficiency = self._format_token_efficiency()
+        if efficiency:
+            report["token_efficiency"] = efficiency
+        bootstrap = self._format_bootstrap_intervals()
+        if bootstrap:
+            report["bootstrap_intervals"] = bootstrap
+        if self.sampling:
+            report["sequential_sampling"] = self._format_sampling()
 
         return report
 
@@ -146,11 +179,118 @@ class ReportGenerator:
         return {
             "metadata": {
                 "timestamp": datetime.now().isoformat(),
-                "total_evaluations": len(self.results),
+                "total_evaluations": len(self.metrics.df),
             },
             "overall_statistics": overall_stats,
             "prompt_results": prompt_results,
-            "anomalies": [r.to_dict() for r in self.metrics.detect_anomalies()],
+            "anomalies": [
+                r.to_dict()
+                for r in self.metrics.results_at(
+                    self.metrics.detect_anomalies(self.config.get("outlier_threshold", 3.0))
+                )
+            ],
+            "latency_breakdown": self.metrics.get_latency_breakdown(),
+            "token_efficiency": self.metrics.get_token_efficiency(),
+            "bootstrap_intervals": self._bootstrap_intervals(),
+            "sequential_sampling": self.sampling,
+        }
+
+    def _format_token_efficiency(self) -> dict[str, Any]:
+        """Format token usage and throughput next to latency, one row per metric."""
+        efficiency = self.metrics.get_token_efficiency()
+        if not efficiency:
+            return {}
+
+        rows = [
+            ("response_time", "avg_response_time", "{:.2f}s"),
+            ("input_tokens", "avg_input_tokens", "{:.0f}"),
+            ("output_tokens", "avg_output_tokens", "{:.0f}"),
+            ("total_tokens", "avg_total_tokens", "{:.0f}"),
+            ("tokens_per_second", "avg_tokens_per_second", "{:.1f}"),
+            ("chars_per_second", "avg_chars_per_second", "{:.1f}"),
+            ("tokens_per_line", "avg_tokens_per_line", "{:.2f}"),
+        ]
+        formatted: dict[str, Any] = {}
+        for name, key, fmt in rows:
+            formatted[name] = {}
+            for mode, values in efficiency.items():
+                value = values[key]
+                formatted[name][mode] = "n/a" if np.isnan(value) else fmt.format(value)
+        formatted["runs_with_token_counts"] = {
+            mode: values["runs_with_tokens"] for mode, values in efficiency.items()
+        }
+        return formatted
+
+    def _bootstrap_intervals(self) -> dict[str, Any]:
+        """Bootstrap intervals with the configured resamples; empty when turned off."""
+        resamples = self.config.get("bootstrap_resamples", 10_000)
+        if not resamples:
+            return {}
+        return self.metrics.get_bootstrap_intervals(
+            resamples=resamples, workers=self.config.get("bootstrap_workers")
+        )
+
+    def _format_bootstrap_intervals(self) -> dict[str, Any]:
+        """Format overall bootstrap intervals as ``estimate [lower, upper]`` per metric."""
+        overall = self._bootstrap_intervals().get("overall", {})
+        formatted: dict[str, Any] = {}
+        for mode in ["sequential", "parallel"]:
+            for metric, statistics in overall.get(mode, {}).items():
+                formatted.setdefault(metric, {})[mode] = {
+                    statistic: _format_interval(interval)
+                    for statistic, interval in statistics.items()
+                }
+        for metric, interval in overall.get("effect_size", {}).items():
+            formatted.setdefault(metric, {})["effect_size"] = _format_interval(interval, "{:.3f}")
+        return formatted
+
+    def _format_latency_breakdown(self) -> dict[str, Any]:
+        """Format mean phase durations per mode, phases in pipeline order."""
+        breakdown = self.metrics.get_latency_breakdown()
+        sequential = breakdown.get("sequential", {})
+        parallel = breakdown.get("parallel", {})
+
+        formatted = {}
+        for phase in [p for p in TIMING_PHASES if p in sequential or p in parallel]:
+            seq_mean = sequential.get(phase, {}).get("mean")
+            par_mean = parallel.get(phase, {}).get("mean")
+            formatted[phase] = {
+                "sequential_mean": f"{seq_mean:.3f}s" if seq_mean is not None else "n/a",
+                "parallel_mean": f"{par_mean:.3f}s" if par_mean is not None else "n/a",
+                "difference": (
+                    f"{par_mean - seq_mean:+.3f}s"
+                    if seq_mean is not None and par_mean is not None
+                    else "n/a"
+                ),
+            }
+        return formatted
+
+    def _format_sampling(self) -> dict[str, Any]:
+        """Format the group-sequential stopping rule and per-prompt sample sizes."""
+        sampling = self.sampling or {}
+        if sampling["rule"] == "ci_width":
+            rule = (
+                f"Stop a prompt once the {sampling['confidence_level']:.0%} CI of "
+                f"{sampling['metric']} is at most {sampling['target_ci_width']:g} wide "
+                "in every mode"
+            )
+        else:
+            rule = (
+                f"Stop a prompt once the sequential vs parallel comparison of "
+                f"{sampling['metric']} crosses the O'Brien-Fleming boundary "
+                f"(overall alpha {1 - sampling['confidence_level']:.2f})"
+            )
+
+        return {
+            "stopping_rule": rule,
+            "looks": sampling["looks"],
+            "boundaries": sampling["boundaries"],
+            "executed_runs": sampling["executed_runs"],
+            "planned_runs": sampling["planned_runs"],
+            "runs_per_prompt": {
+                prompt_id: {"runs": info["runs"], "stopped_by": info["reason"]}
+                for prompt_id, info in sampling["prompts"].items()
+            },
         }
 
     def _format_mode_comparison(self, comparisons: dict) -> dict[str, Any]:
@@ -175,6 +315,8 @@ class ReportGenerator:
             "total_runs": stats["count"],
             "success_rate": f"{stats['success_rate']:.2%}",
             "average_response_time": f"{stats['avg_response_time']:.2f}s",
+            "average_backend_queue_wait": _format_seconds(stats["avg_queue_wait"]),
+            "average_backend_processing_time": _format_seconds(stats["avg_processing_time"]),
             "average_scores": {
                 "overall": f"{stats['avg_overall_score']:.1f}",
                 "code_quality": f"{stats['avg_code_quality']:.1f}",
@@ -538,7 +680,7 @@ class ReportGenerator:
                 ha="center",
                 size=12,
             )
-            fig.text(0.5, 0.3, f"Total Evaluations: {len(self.results)}", ha="center", size=14)
+            fig.text(0.5, 0.3, f"Total Evaluations: {len(self.metrics.df)}", ha="center", size=14)
             plt.axis("off")
             pdf.savefig(fig, bbox_inches="tight")
             plt.close()
@@ -572,7 +714,7 @@ class ReportGenerator:
 ## Summary
 
 - **Date**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-- **Total Evaluations**: {len(self.results)}
+- **Total Evaluations**: {len(self.metrics.df)}
 - **Unique Prompts**: {stats['unique_prompts']}
 - **Overall Success Rate**: {stats['overall_success_rate']:.2%}
 
@@ -580,11 +722,15 @@ class ReportGenerator:
 
 ### Sequential Mode
 - **Average Response Time**: {stats['sequential_stats']['avg_response_time']:.2f}s
+- **Average Backend Queue Wait**: {_format_seconds(stats['sequential_stats']['avg_queue_wait'])}
+- **Average Backend Processing Time**: {_format_seconds(stats['sequential_stats']['avg_processing_time'])}
 - **Average Overall Score**: {stats['sequential_stats']['avg_overall_score']:.1f}
 - **Success Rate**: {stats['sequential_stats']['success_rate']:.2%}
 
 ### Parallel Mode
 - **Average Response Time**: {stats['parallel_stats']['avg_response_time']:.2f}s
+- **Average Backend Queue Wait**: {_format_seconds(stats['parallel_stats']['avg_queue_wait'])}
+- **Average Backend Processing Time**: {_format_seconds(stats['parallel_stats']['avg_processing_time'])}
 - **Average Overall Score**: {stats['parallel_stats']['avg_overall_score']:.1f}
 - **Success Rate**: {stats['parallel_stats']['success_rate']:.2%}
 
@@ -603,6 +749,80 @@ class ReportGenerator:
 
 """
 
+        latency = self._format_latency_breakdown()
+        if latency:
+            content += """## Latency Breakdown
+
+Mean duration of each phase of successful runs (see `timings` in the result metadata).
+
+| Phase | Sequential | Parallel | Difference |
+|-------|------------|----------|------------|
+"""
+            for phase, row in latency.items():
+                content += (
+                    f"| {phase} | {row['sequential_mean']} | {row['parallel_mean']} "
+                    f"| {row['difference']} |\n"
+                )
+            content += "\n"
+
+        efficiency = self._format_token_efficiency()
+        if efficiency:
+            content += """## Token Efficiency
+
+Means over successful runs. Throughput counts output tokens and generated characters per second
+of response time; lines are non-blank lines of generated code.
+
+| Metric | Sequential | Parallel |
+|--------|------------|----------|
+"""
+            for name, row in efficiency.items():
+                content += (
+                    f"| {name} | {row.get('sequential', 'n/a')} | {row.get('parallel', 'n/a')} |\n"
+                )
+            content += "\n"
+
+        bootstrap = self._format_bootstrap_intervals()
+        if bootstrap:
+            resamples = self.config.get("bootstrap_resamples", 10_000)
+            content += f"""## Bootstrap Confidence Intervals
+
+{self.metrics.confidence_level:.0%} percentile intervals over {resamples} resamples of the runs.
+
+| Metric | Statistic | Sequential | Parallel |
+|--------|-----------|------------|----------|
+"""
+            for metric, row in bootstrap.items():
+                sequential = row.get("sequential", {})
+                parallel = row.get("parallel", {})
+                for statistic in {**sequential, **parallel}:
+                    content += (
+                        f"| {metric} | {statistic} | {sequential.get(statistic, 'n/a')} "
+                        f"| {parallel.get(statistic, 'n/a')} |\n"
+                    )
+
+            content += """
+| Metric | Cohen's d (parallel vs sequential) |
+|--------|------------------------------------|
+"""
+            for metric, row in bootstrap.items():
+                content += f"| {metric} | {row.get('effect_size', 'n/a')} |\n"
+            content += "\n"
+
+        if self.sampling:
+            sampling = self._format_sampling()
+            content += f"""## Sequential Sampling
+
+- **Stopping Rule**: {sampling['stopping_rule']}
+- **Looks (runs per mode)**: {', '.join(str(n) for n in sampling['looks'])}
+- **Runs Executed**: {sampling['executed_runs']} of {sampling['planned_runs']} planned
+
+| Prompt | Runs per Mode | Stopped By |
+|--------|---------------|------------|
+"""
+            for prompt_id, info in sampling["runs_per_prompt"].items():
+                content += f"| {prompt_id} | {info['runs']} | {info['stopped_by']} |\n"
+            content += "\n"
+
         content += """## Files Generated
 
 - `evaluation_report.yaml` - Main report for scientific publication
@@ -651,6 +871,16 @@ If you use these results in your research, please cite:
                 f"{stats['sequential_stats']['avg_response_time']:.2f}s",
                 f"{stats['parallel_stats']['avg_response_time']:.2f}s",
             ),
+            (
+                "Avg Queue Wait",
+                _format_seconds(stats["sequential_stats"]["avg_queue_wait"]),
+                _format_seconds(stats["parallel_stats"]["avg_queue_wait"]),
+            ),
+            (
+                "Avg Processing Time",
+                _format_seconds(stats["sequential_stats"]["avg_processing_time"]),
+                _format_seconds(stats["parallel_stats"]["avg_processing_time"]),
+            ),
             (
                 "Avg Overall Score",
                 f"{stats['sequential_stats']['avg_overall_score']:.1f}",
@@ -671,3 +901,20 @@ If you use these results in your research, please cite:
             table.add_row(metric_name, seq_val, par_val, diff_str)
 
         console.print(table)
+
+
+def _format_seconds(value: float) -> str:
+    """Format a mean duration, or "n/a" when no run reported it."""
+    return "n/a" if np.isnan(value) else f"{value:.2f}s"
+
+
+def _format_interval(interval: dict[str, float], fmt: str = "{:.2f}") -> str:
+    """Format a bootstrap interval as "estimate [lower, upper]"."""
+    if np.isnan(interval["estimate"]):
+        return "n/a"
+    if np.isnan(interval["ci_lower"]):
+        return f"{fmt.format(interval['estimate'])} [n/a]"
+    return (
+        f"{fmt.format(interval['estimate'])} "
+        f"[{fmt.format(interval['ci_lower'])}, {fmt.format(interval['ci_upper'])}]"
+    )
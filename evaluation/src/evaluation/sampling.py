@@ -0,0 +1,228 @@
+"""Group-sequential (adaptive) sampling of evaluation runs."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from scipy import stats
+
+from .config import AgentMode, EvaluationConfig, EvaluationResult
+from .metrics import MetricsCollector
+from .store import ANALYSIS_COLUMNS
+
+SAMPLING_FILE = "sampling.json"
+
+# Simulated trials used to calibrate O'Brien-Fleming boundaries
+BOUNDARY_SIMULATIONS = 200_000
+
+
+def obrien_fleming_boundaries(sample_sizes: list[int], alpha: float) -> list[float]:
+    """Two-sided O'Brien-Fleming critical z-values for a sequence of looks.
+
+    The boundary at look k is ``c / sqrt(t_k)``, where ``t_k`` is the fraction
+    of the maximum sample size observed so far. ``c`` is calibrated on the
+    joint null distribution of the interim z-statistics (simulated with a
+    fixed seed) so that the overall type I error over all looks is ``alpha``.
+
+    Args:
+        sample_sizes: Cumulative runs per group at each look, increasing
+        alpha: Overall two-sided significance level
+
+    Returns:
+        Critical |z| for each look
+    """
+    sizes = np.asarray(sample_sizes, dtype=np.float64)
+    fractions = sizes / sizes[-1]
+
+    # Brownian motion at the information fractions; z_k = B(t_k) / sqrt(t_k)
+    rng = np.random.default_rng(0)
+    steps = np.diff(fractions, prepend=0.0)
+    increments = rng.standard_normal((BOUNDARY_SIMULATIONS, len(sizes))) * np.sqrt(steps)
+    paths = np.cumsum(increments, axis=1)
+    # |z_k| >= c / sqrt(t_k)  <=>  |B(t_k)| >= c
+    c = float(np.quantile(np.abs(paths).max(axis=1), 1 - alpha))
+
+    return [c / float(np.sqrt(t)) for t in fractions]
+
+
+@dataclass
+class StoppingDecision:
+    """Outcome of the stopping rule for one prompt at one look."""
+
+    prompt_id: str
+    look: int
+    runs: int  # Planned runs per mode observed at this look
+    stopped: bool
+    reason: str  # "ci_width", "boundary", "max_runs" or "continue"
+    statistic: float  # Widest CI across modes, or |z| of the mode comparison (NaN if undefined)
+    threshold: float  # Target CI width, or the critical |z| at this look
+
+
+class SequentialSampler:
+    """Decide after each batch of runs which prompts need more samples.
+
+    Runs are scheduled in looks of ``sampling_batch_size`` runs per prompt and
+    mode, up to ``runs_per_prompt``. After each look a prompt stops when its
+    stopping rule is met:
+
+    - ``ci_width``: the confidence interval of ``sampling_metric`` is at most
+      ``sampling_target_ci_width`` wide in every mode.
+    - ``obrien_fleming``: the sequential vs parallel comparison of
+      ``sampling_metric`` crosses the O'Brien-Fleming boundary for the look,
+      which keeps the overall type I error at ``1 - confidence_level``.
+    """
+
+    def __init__(self, config: EvaluationConfig, modes: list[AgentMode]):
+        """Initialize the sampler.
+
+        Args:
+            config: Evaluation configuration with the sampling settings
+            modes: Modes being evaluated
+
+        Raises:
+            ValueError: If the metric is unknown or the rule needs both modes
+        """
+        if config.sampling_metric not in ANALYSIS_COLUMNS:
+            raise ValueError(f"Unknown sampling_metric: {config.sampling_metric!r}")
+        if config.sampling_rule == "obrien_fleming" and len(modes) < 2:
+            raise ValueError("The obrien_fleming sampling rule compares modes; run both modes")
+
+        self.config = config
+        self.modes = modes
+        self.metric = config.sampling_metric
+        self.rule = config.sampling_rule
+        self.alpha = 1 - config.confidence_level
+
+        batch = config.sampling_batch_size
+        maximum = config.runs_per_prompt
+        self.looks = list(range(batch, maximum, batch)) + [maximum]
+        self.boundaries = (
+            obrien_fleming_boundaries(self.looks, self.alpha)
+            if self.rule == "obrien_fleming"
+            else None
+        )
+        self.decisions: list[StoppingDecision] = []
+
+    def stage_runs(self, look: int) -> range:
+        """Run numbers scheduled in a look (1-based)."""
+        first = self.looks[look - 2] + 1 if look > 1 else 1
+        return range(first, self.looks[look - 1] + 1)
+
+    def check(
+        self, results: list[EvaluationResult], prompt_ids: set[str], look: int
+    ) -> list[StoppingDecision]:
+        """Apply the stopping rule to prompts after a look.
+
+        Args:
+            results: All results so far; runs beyond the look are ignored
+            prompt_ids: Prompts still being sampled
+            look: Look just completed (1-based)
+
+        Returns:
+            One decision per prompt, also recorded on the sampler
+        """
+        runs = self.looks[look - 1]
+        observed = [r for r in results if r.prompt_id in prompt_ids and r.run_number <= runs]
+        metrics = MetricsCollector(observed, confidence_level=self.config.confidence_level)
+
+        if self.rule == "ci_width":
+            threshold = self.config.sampling_target_ci_width
+        else:
+            assert self.boundaries is not None
+            threshold = self.boundaries[look - 1]
+
+        decisions = []
+        for prompt_id in sorted(prompt_ids):
+            statistic = self._statistic(metrics, prompt_id) if observed else float("nan")
+            if self.rule == "ci_width":
+                met = statistic <= threshold
+            else:
+                met = statistic >= threshold
+
+            if met:
+                reason = "ci_width" if self.rule == "ci_width" else "boundary"
+            elif look == len(self.looks):
+                reason = "max_runs"
+            else:
+                reason = "continue"
+            decisions.append(
+                StoppingDecision(
+                    prompt_id=prompt_id,
+                    look=look,
+                    runs=runs,
+                    stopped=reason != "continue",
+                    reason=reason,
+                    statistic=statistic,
+                    threshold=threshold,
+                )
+            )
+
+        self.decisions.extend(decisions)
+        return decisions
+
+    def _statistic(self, metrics: MetricsCollector, prompt_id: str) -> float:
+        if self.rule == "obrien_fleming":
+            comparison = metrics.compare_modes(self.metric, prompt_id)
+            return float(stats.norm.isf(comparison.p_value / 2))
+
+        # Widest confidence interval across modes
+        data = metrics.df[metrics.df["prompt_id"] == prompt_id]
+        widths = []
+        for mode in self.modes:
+            values = data[data["mode"] == mode.value][self.metric].to_numpy()
+            summary = metrics.calculate_summary(values, remove_outliers=False)
+            if summary.n_samples < 2:
+                return float("nan")
+            widths.append(float(summary.ci_upper - summary.ci_lower))
+        return max(widths)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Describe the stopping rule and every decision for the report."""
+        stopped = {d.prompt_id: d for d in self.decisions if d.stopped}
+        planned = self.config.runs_per_prompt * len(self.modes) * len(stopped)
+        executed = sum(d.runs for d in stopped.values()) * len(self.modes)
+        return {
+            "rule": self.rule,
+            "metric": self.metric,
+            "confidence_level": self.config.confidence_level,
+            "batch_size": self.config.sampling_batch_size,
+            "max_runs_per_prompt": self.config.runs_per_prompt,
+            "looks": self.looks,
+            "target_ci_width": (
+                self.config.sampling_target_ci_width if self.rule == "ci_width" else None
+            ),
+            "boundaries": self.boundaries,
+            "planned_runs": planned,
+            "executed_runs": executed,
+            "prompts": {
+                prompt_id: {"runs": d.runs, "look": d.look, "reason": d.reason}
+                for prompt_id, d in sorted(stopped.items())
+            },
+            "decisions": [_serializable(asdict(d)) for d in self.decisions],
+        }
+
+    def save(self, output_dir: Path) -> None:
+        """Write the sampling summary next to the results."""
+        with open(output_dir / SAMPLING_FILE, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def _serializable(decision: dict[str, Any]) -> dict[str, Any]:
+    # Undefined statistics (too few successful runs) become null in JSON
+    for key in ("statistic", "threshold"):
+        if not np.isfinite(decision[key]):
+            decision[key] = None
+    return decision
+
+
+def load_sampling_summary(output_dir: Path) -> dict[str, Any] | None:
+    """Read the sampling summary of an output directory, if it used adaptive sampling."""
+    path = output_dir / SAMPLING_FILE
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
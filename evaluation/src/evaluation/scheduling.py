@@ -0,0 +1,92 @@
+"""Makespan-aware ordering of evaluation runs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import AgentMode, EvaluationPrompt
+from .dataset import ResultsDataset
+
+EvaluationTask = tuple[EvaluationPrompt, AgentMode, int]
+
+
+def load_duration_history(output_dir: Path, prompt_ids: list[str]) -> pd.DataFrame:
+    """Load response times of successful runs from an earlier evaluation.
+
+    Args:
+        output_dir: Output directory of a previous evaluation
+        prompt_ids: Prompts to load history for
+
+    Returns:
+        DataFrame with ``prompt_id`` and ``response_time`` columns
+    """
+    dataset = ResultsDataset(output_dir)
+    return dataset.query(
+        prompt_ids=prompt_ids, columns=["prompt_id", "response_time"], successful_only=True
+    )
+
+
+def estimate_durations(
+    prompts: list[EvaluationPrompt], history: pd.DataFrame | None = None
+) -> dict[str, float]:
+    """Estimate the duration of one run of each prompt.
+
+    Prompts with history get their median response time. The others get
+    ``complexity_score`` scaled by the median seconds per complexity point of
+    the prompts with history, so both kinds of estimate are comparable.
+    Without any history the estimate is the complexity score itself, which
+    is enough to order runs.
+
+    Args:
+        prompts: Prompts being evaluated
+        history: Earlier runs with ``prompt_id`` and ``response_time`` columns
+
+    Returns:
+        Expected duration per prompt ID
+    """
+    observed: dict[str, float] = {}
+    if history is not None and not history.empty:
+        times = history[history["response_time"] > 0]
+        observed = times.groupby("prompt_id")["response_time"].median().to_dict()
+
+    rates = [
+        observed[prompt.id] / prompt.complexity_score
+        for prompt in prompts
+        if prompt.id in observed and prompt.complexity_score > 0
+    ]
+    rate = float(np.median(rates)) if rates else 1.0
+
+    return {
+        prompt.id: float(observed.get(prompt.id, prompt.complexity_score * rate))
+        for prompt in prompts
+    }
+
+
+def longest_first(
+    tasks: list[EvaluationTask], estimates: dict[str, float], block_runs: int = 1
+) -> list[EvaluationTask]:
+    """Order shuffled tasks longest-expected-first within randomized blocks.
+
+    Block ``b`` holds run numbers ``b * block_runs + 1`` to
+    ``(b + 1) * block_runs`` of every prompt and mode, so each block is a
+    complete replication and conditions stay balanced over time. Within a
+    block, prompts with longer expected runs are dispatched first, which
+    keeps the last runs of the evaluation short and workers busy until the
+    end. Estimates are per prompt, and the sort is stable, so the relative
+    order of the modes of a prompt stays as randomized by the shuffle.
+
+    Args:
+        tasks: Runs in shuffled order
+        estimates: Expected duration per prompt ID
+        block_runs: Replications (run numbers) per block
+
+    Returns:
+        Reordered runs
+    """
+    return sorted(
+        tasks,
+        key=lambda task: ((task[2] - 1) // block_runs, -estimates.get(task[0].id, 0.0)),
+    )
@@ -0,0 +1,341 @@
+"""Columnar SQLite store for evaluation results."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from .blobs import BlobStore
+from .config import TIMING_PHASES, AgentMode, EvaluationResult
+
+RESULTS_DB = "results.sqlite"
+
+# One column per phase in ``metadata["timings"]``
+TIMING_COLUMNS = [f"timing_{phase}" for phase in TIMING_PHASES]
+
+# Typed columns of the results table. Scalar metrics get their own column so
+# analyses can select them without parsing JSON; generated code lives in the
+# blob store and is referenced by digest, or is kept inline without one.
+COLUMNS: list[tuple[str, str]] = [
+    ("prompt_id", "TEXT NOT NULL"),
+    ("prompt_name", "TEXT NOT NULL"),
+    ("mode", "TEXT NOT NULL"),
+    ("run_number", "INTEGER NOT NULL"),
+    ("timestamp", "TEXT NOT NULL"),
+    ("response_time", "REAL"),
+    ("total_tokens", "INTEGER"),
+    ("input_tokens", "INTEGER"),
+    ("output_tokens", "INTEGER"),
+    ("response_chars", "INTEGER"),
+    ("response_lines", "INTEGER"),
+    ("error", "TEXT"),
+    ("success", "INTEGER NOT NULL"),
+    ("has_error", "INTEGER NOT NULL"),
+    ("overall_score", "REAL"),
+    ("code_quality_score", "REAL"),
+    ("architecture_score", "REAL"),
+    ("performance_score", "REAL"),
+    ("accessibility_score", "REAL"),
+    ("backend_url", "TEXT"),
+    ("generation_concurrency", "INTEGER"),
+    ("evaluation_concurrency", "INTEGER"),
+    ("response_content_blob", "TEXT"),
+    ("response_content", "TEXT"),
+    ("metadata", "TEXT"),
+    *[(name, "REAL") for name in TIMING_COLUMNS],
+]
+
+# Columns identifying a run, the table's primary key
+KEY_COLUMNS = ("prompt_id", "mode", "run_number")
+
+# Columns MetricsCollector analyzes, in its DataFrame order
+ANALYSIS_COLUMNS = [
+    "prompt_id",
+    "prompt_name",
+    "mode",
+    "run_number",
+    "response_time",
+    "total_tokens",
+    "input_tokens",
+    "output_tokens",
+    "response_chars",
+    "response_lines",
+    "overall_score",
+    "code_quality_score",
+    "architecture_score",
+    "performance_score",
+    "accessibility_score",
+    "success",
+    "has_error",
+    "generation_concurrency",
+    "evaluation_concurrency",
+    *TIMING_COLUMNS,
+]
+
+BOOLEAN_COLUMNS = {"success", "has_error"}
+
+
+class ResultsStore:
+    """Evaluation results in a single SQLite table, one row per run.
+
+    Loading a suite is one query instead of parsing a JSON file per run. Rows
+    are keyed by (prompt_id, mode, run_number); writing a run again updates
+    its row in place, so rows stay in the order runs first completed. A
+    connection belongs to the thread that opened it.
+    """
+
+    def __init__(self, path: Path, blobs: BlobStore | None = None):
+        """Initialize the store.
+
+        Args:
+            path: Path of the SQLite database file
+            blobs: Blob store for generated code; code is kept inline in the
+                ``response_content`` column if None
+        """
+        self.path = path
+        self.blobs = blobs
+        self._conn: sqlite3.Connection | None = None
+
+    @classmethod
+    def for_output_dir(cls, output_dir: Path, store_code_blobs: bool = True) -> ResultsStore:
+        """Get the results store of an evaluation output directory.
+
+        Args:
+            output_dir: Evaluation output directory
+            store_code_blobs: Write generated code to the directory's blob
+                store instead of keeping it inline
+        """
+        blobs = BlobStore.for_output_dir(output_dir) if store_code_blobs else None
+        return cls(output_dir / RESULTS_DB, blobs)
+
+    @staticmethod
+    def exists_in(output_dir: Path) -> bool:
+        """Check whether an output directory has a results store."""
+        return (output_dir / RESULTS_DB).exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            columns = ", ".join(f"{name} {sql_type}" for name, sql_type in COLUMNS)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS results ({columns}, "
+                "PRIMARY KEY (prompt_id, mode, run_number))"
+            )
+            # Stores written before a column was added get it as NULL
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(results)")}
+            for name, sql_type in COLUMNS:
+                if name not in existing:
+                    self._conn.execute(f"ALTER TABLE results ADD COLUMN {name} {sql_type}")
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> ResultsStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _row(self, result: EvaluationResult) -> tuple[Any, ...]:
+        content = result.response_content
+        digest = self.blobs.put(content) if self.blobs is not None and content else None
+        values = result_row(result, digest)
+        return tuple(values[name] for name, _ in COLUMNS)
+
+    def write(self, results: Iterable[EvaluationResult]) -> int:
+        """Insert or update runs in one transaction.
+
+        Returns:
+            Number of rows written
+        """
+        rows = [self._row(result) for result in results]
+        if not rows:
+            return 0
+
+        conn = self._connect()
+        names = ", ".join(name for name, _ in COLUMNS)
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        # Updating in place keeps the rowid, unlike REPLACE's delete and insert
+        updates = ", ".join(
+            f"{name} = excluded.{name}" for name, _ in COLUMNS if name not in KEY_COLUMNS
+        )
+        with conn:
+            conn.executemany(
+                f"INSERT INTO results ({names}) VALUES ({placeholders}) "
+                f"ON CONFLICT({', '.join(KEY_COLUMNS)}) DO UPDATE SET {updates}",
+                rows,
+            )
+        return len(rows)
+
+    def load_dataframe(self, columns: list[str] | None = None) -> pd.DataFrame:
+        """Load runs into a DataFrame with one typed column per metric.
+
+        Args:
+            columns: Columns to select (default: ``ANALYSIS_COLUMNS``)
+
+        Returns:
+            DataFrame in insertion order
+        """
+        columns = columns or ANALYSIS_COLUMNS
+        known = {name for name, _ in COLUMNS}
+        unknown = [c for c in columns if c not in known]
+        if unknown:
+            raise ValueError(f"Unknown results store columns: {unknown}")
+
+        df = pd.read_sql_query(
+            f"SELECT {', '.join(columns)} FROM results ORDER BY rowid", self._connect()
+        )
+        for column in BOOLEAN_COLUMNS.intersection(df.columns):
+            df[column] = df[column].astype(bool)
+        return df
+
+    def load_results(
+        self, with_content: bool = False, rows: list[int] | None = None
+    ) -> list[EvaluationResult]:
+        """Load runs as ``EvaluationResult`` objects, in insertion order.
+
+        Args:
+            with_content: Read generated code back, from the blob store or inline
+            rows: Load only the runs at these positions, in this order
+        """
+        names = [name for name, _ in COLUMNS]
+        conn = self._connect()
+        sql = f"SELECT rowid, {', '.join(names)} FROM results"
+        if rows is None:
+            records = conn.execute(f"{sql} ORDER BY rowid").fetchall()
+        else:
+            order = conn.execute("SELECT rowid FROM results ORDER BY rowid").fetchall()
+            selected = [order[row][0] for row in rows]
+            by_rowid = {
+                record[0]: record
+                for record in conn.execute(
+                    f"{sql} WHERE rowid IN ({', '.join('?' for _ in selected)})", selected
+                )
+            }
+            records = [by_rowid[rowid] for rowid in selected]
+
+        results = []
+        for record in records:
+            values = dict(zip(names, record[1:], strict=True))
+            content = ""
+            if with_content:
+                digest = values["response_content_blob"]
+                content = self._blob_store().get(digest) if digest else values["response_content"]
+            results.append(result_from_row(values, content or ""))
+        return results
+
+    def _blob_store(self) -> BlobStore:
+        # Rows written with blobs can be read back by a store that keeps code inline
+        return self.blobs or BlobStore.for_output_dir(self.path.parent)
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+
+def result_row(result: EvaluationResult, content_digest: str | None) -> dict[str, Any]:
+    """Flatten a result into the store's column values.
+
+    Args:
+        result: Evaluation result
+        content_digest: Blob digest of the generated code; without one the
+            code is kept inline
+
+    Returns:
+        Mapping of every name in ``COLUMNS`` to its value
+    """
+    metadata = result.metadata
+    timings = metadata.get("timings", {})
+    usage = metadata.get("token_usage") or {}
+    return {
+        "prompt_id": result.prompt_id,
+        "prompt_name": result.prompt_name,
+        "mode": result.mode.value,
+        "run_number": result.run_number,
+        "timestamp": result.timestamp.isoformat(),
+        "response_time": result.response_time,
+        "total_tokens": result.total_tokens,
+        "input_tokens": usage.get("input_tokens"),
+        "output_tokens": usage.get("output_tokens"),
+        **content_size(result.response_content),
+        "error": result.error,
+        "success": result.success,
+        "has_error": result.error is not None,
+        "overall_score": result.overall_score,
+        "code_quality_score": result.code_quality_score,
+        "architecture_score": result.architecture_score,
+        "performance_score": result.performance_score,
+        "accessibility_score": result.accessibility_score,
+        "backend_url": metadata.get("backend_url"),
+        "generation_concurrency": metadata.get("generation_concurrency"),
+        "evaluation_concurrency": metadata.get("evaluation_concurrency"),
+        "response_content_blob": content_digest,
+        "response_content": None if content_digest else result.response_content or None,
+        "metadata": json.dumps(metadata),
+        **{
+            column: timings.get(phase)
+            for phase, column in zip(TIMING_PHASES, TIMING_COLUMNS, strict=True)
+        },
+    }
+
+
+def content_size(content: str) -> dict[str, int | None]:
+    """Characters and non-blank lines of generated code (None without code)."""
+    if not content:
+        return {"response_chars": None, "response_lines": None}
+    lines = sum(1 for line in content.splitlines() if line.strip())
+    return {"response_chars": len(content), "response_lines": lines}
+
+
+def result_from_row(values: dict[str, Any], content: str = "") -> EvaluationResult:
+    """Rebuild a result from the store's column values.
+
+    Args:
+        values: Mapping of column names to values, as produced by ``result_row``
+        content: Generated code, if it was loaded from the blob store
+
+    Returns:
+        The evaluation result
+    """
+    metadata = _optional(values.get("metadata"))
+    return EvaluationResult(
+        prompt_id=values["prompt_id"],
+        prompt_name=values["prompt_name"],
+        mode=AgentMode(values["mode"]),
+        run_number=int(values["run_number"]),
+        timestamp=datetime.fromisoformat(values["timestamp"]),
+        response_time=values["response_time"],
+        total_tokens=_optional_int(values.get("total_tokens")),
+        response_content=content,
+        error=_optional(values["error"]),
+        overall_score=_optional(values["overall_score"]),
+        code_quality_score=_optional(values["code_quality_score"]),
+        architecture_score=_optional(values["architecture_score"]),
+        performance_score=_optional(values["performance_score"]),
+        accessibility_score=_optional(values["accessibility_score"]),
+        metadata=json.loads(metadata) if metadata else {},
+    )
+
+
+def _optional(value: Any) -> Any:
+    # DataFrames turn NULLs into NaN; a NaN score would count as scored
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return value
+
+
+def _optional_int(value: Any) -> int | None:
+    # Integer columns come back as floats from DataFrames when they hold NULLs
+    value = _optional(value)
+    return None if value is None else int(value)
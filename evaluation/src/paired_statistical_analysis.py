@@ -7,35 +7,33 @@ that account for the task-level pairing structure (6 tasks × 50 runs per mode).
 """
 
 import json
-import glob
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 import numpy as np
 from scipy import stats
 import pandas as pd
 
+from evaluation.dataset import ResultsDataset, resolve_results_dir
+
 
 def load_evaluation_data(results_dir: str) -> pd.DataFrame:
     """Load all evaluation results into a structured DataFrame."""
-    results_files = glob.glob(f"{results_dir}/results/*.json")
-
-    data = []
-    for file_path in results_files:
-        with open(file_path, 'r') as f:
-            result = json.load(f)
-            data.append({
-                'task': result['prompt_id'],
-                'mode': result['mode'],
-                'run_number': result['run_number'],
-                'response_time': result['response_time'],
-                'overall_score': result['overall_score'],
-                'code_quality': result['code_quality_score'],
-                'architecture': result['architecture_score'],
-                'performance': result['performance_score'],
-                'accessibility': result['accessibility_score'],
-            })
-
-    df = pd.DataFrame(data)
+    # Cached consolidated table: only the score columns are read
+    dataset = ResultsDataset(Path(results_dir))
+    df = dataset.query(columns=[
+        'prompt_id', 'mode', 'run_number', 'response_time', 'overall_score',
+        'code_quality_score', 'architecture_score', 'performance_score',
+        'accessibility_score',
+    ])
+    df = df.rename(columns={
+        'prompt_id': 'task',
+        'code_quality_score': 'code_quality',
+        'architecture_score': 'architecture',
+        'performance_score': 'performance',
+        'accessibility_score': 'accessibility',
+    })
+
     print(f"Loaded {len(df)} evaluation results")
     print(f"Tasks: {sorted(df['task'].unique())}")
     print(f"Modes: {sorted(df['mode'].unique())}")
@@ -188,7 +186,7 @@ def analyze_metric(df: pd.DataFrame, metric: str) -> Dict:
 
 def main():
     """Main analysis pipeline."""
-    results_dir = "/Users/codecrdt/evaluation/evaluation_results"
+    results_dir = resolve_results_dir(sys.argv[1] if len(sys.argv) > 1 else None)
 
     print("Loading evaluation data...")
     df = load_evaluation_data(results_dir)
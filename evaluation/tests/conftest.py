@@ -0,0 +1,39 @@
+"""Shared fixtures for the evaluation tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from evaluation.config import AgentMode, EvaluationResult
+
+
+@pytest.fixture
+def make_result() -> Callable[..., EvaluationResult]:
+    """Build evaluation results with defaults for every field not given."""
+
+    def make(
+        prompt_id: str = "todo_app",
+        mode: AgentMode = AgentMode.SEQUENTIAL,
+        run_number: int = 1,
+        **fields: Any,
+    ) -> EvaluationResult:
+        values: dict[str, Any] = {
+            "prompt_name": prompt_id.replace("_", " ").title(),
+            "timestamp": datetime(2025, 1, 15, 12, 0, 0),
+            "response_time": 10.0,
+            "total_tokens": 1000,
+            "response_content": f"// {prompt_id} {mode.value} {run_number}\n",
+            "overall_score": 80.0,
+            "code_quality_score": 75.0,
+            "architecture_score": 70.0,
+            "performance_score": 85.0,
+            "accessibility_score": 90.0,
+        }
+        values.update(fields)
+        return EvaluationResult(prompt_id=prompt_id, mode=mode, run_number=run_number, **values)
+
+    return make
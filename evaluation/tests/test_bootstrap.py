@@ -0,0 +1,79 @@
+"""Tests for the vectorized bootstrap."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from evaluation.bootstrap import (
+    percentile_interval,
+    resample_counts,
+    weighted_moments,
+    weighted_quantiles,
+)
+
+LEVELS = [0.0, 0.1, 0.25, 0.5, 0.9, 1.0]
+
+
+def expanded(values: np.ndarray, counts: np.ndarray) -> list[np.ndarray]:
+    """Materialize each resample: every run repeated as often as it was drawn."""
+    resamples = [np.repeat(values, column) for column in counts.T]
+    return [resample[~np.isnan(resample)] for resample in resamples]
+
+
+@pytest.fixture
+def sample() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(7)
+    values = rng.normal(70, 12, size=9).round(1)
+    values[[2, 6]] = [values[0], np.nan]  # A tie and a missing value
+    (counts,) = resample_counts(len(values), 300, rng)
+    return values, counts
+
+
+def test_resample_counts_draw_every_run_n_times():
+    rng = np.random.default_rng(0)
+    batches = list(resample_counts(5, 2_000_000, rng))
+
+    assert sum(batch.shape[1] for batch in batches) == 2_000_000
+    assert len(batches) > 1
+    assert all((batch.sum(axis=0) == 5).all() for batch in batches)
+
+
+def test_weighted_quantiles_match_np_quantile(sample):
+    values, counts = sample
+
+    quantiles = weighted_quantiles(counts, values, LEVELS)
+
+    for j, resample in enumerate(expanded(values, counts)):
+        if len(resample):
+            assert quantiles[:, j] == pytest.approx(np.quantile(resample, LEVELS))
+        else:
+            assert np.isnan(quantiles[:, j]).all()
+
+
+def test_weighted_moments_match_expanded_resamples(sample):
+    values, counts = sample
+
+    n, mean, variance = weighted_moments(counts, values[:, None])
+
+    for j, resample in enumerate(expanded(values, counts)):
+        assert n[0, j] == len(resample)
+        assert mean[0, j] == pytest.approx(np.mean(resample))
+        if len(resample) > 1:
+            assert variance[0, j] == pytest.approx(np.var(resample, ddof=1))
+
+
+def test_percentile_interval_ignores_undefined_estimates():
+    estimates = np.array([np.nan, 3.0, 1.0, 2.0, 5.0, 4.0, np.nan])
+
+    interval = percentile_interval(estimates, point=3.0, confidence_level=0.8)
+
+    lower, upper = np.quantile([1.0, 2.0, 3.0, 4.0, 5.0], [0.1, 0.9])
+    assert interval == {"estimate": 3.0, "ci_lower": lower, "ci_upper": upper}
+
+
+def test_percentile_interval_without_estimates_is_undefined():
+    interval = percentile_interval(np.array([np.nan]), point=2.0, confidence_level=0.95)
+
+    assert interval["estimate"] == 2.0
+    assert np.isnan(interval["ci_lower"]) and np.isnan(interval["ci_upper"])
@@ -0,0 +1,95 @@
+"""Tests for the checkpoint journal and its replay."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from evaluation.blobs import BlobStore
+from evaluation.checkpoint import (
+    CHECKPOINT_FILE,
+    JOURNAL_FILE,
+    CheckpointJournal,
+    ResultWriter,
+    load_checkpoint,
+)
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = CheckpointJournal(tmp_path, blobs=BlobStore.for_output_dir(tmp_path))
+    yield journal
+    journal.close()
+
+
+def test_journal_replays_latest_entry_per_run(tmp_path, journal, make_result):
+    journal.append(make_result(run_number=1, error="timeout", overall_score=None))
+    journal.append_many([make_result(run_number=2), make_result(run_number=1)])
+
+    results = load_checkpoint(tmp_path)
+
+    assert [r.run_number for r in results] == [1, 2]
+    assert all(r.success for r in results)
+    assert results[0].response_content == "// todo_app sequential 1\n"
+
+
+def test_truncated_final_journal_line_is_skipped(tmp_path, journal, make_result):
+    journal.append(make_result(run_number=1))
+    journal.close()
+    with open(tmp_path / JOURNAL_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(make_result(run_number=2).to_dict())[:50])
+
+    assert [r.run_number for r in load_checkpoint(tmp_path)] == [1]
+
+
+def test_compact_folds_journal_into_checkpoint(tmp_path, journal, make_result):
+    results = [make_result(run_number=n) for n in (1, 2, 3)]
+    journal.append_many(results)
+    journal.compact(results)
+
+    assert not (tmp_path / JOURNAL_FILE).exists()
+    assert [r.run_number for r in load_checkpoint(tmp_path)] == [1, 2, 3]
+    records = json.loads((tmp_path / CHECKPOINT_FILE).read_text())
+    assert all("response_content_blob" in record for record in records)
+
+    # Runs journaled after compaction take precedence over the checkpoint
+    journal.append(make_result(run_number=2, error="retried", overall_score=None))
+    assert [r.success for r in load_checkpoint(tmp_path)] == [True, False, True]
+
+
+@pytest.mark.parametrize("damage", ["missing", "truncated"])
+@pytest.mark.parametrize("compacted", [False, True])
+def test_entries_with_damaged_blobs_are_skipped(tmp_path, journal, make_result, damage, compacted):
+    damaged = make_result(run_number=1, response_content="// only copy\n")
+    results = [damaged, make_result(run_number=2)]
+    journal.append_many(results)
+    if compacted:
+        journal.compact(results)
+
+    blob = journal.blobs.path(journal.blobs.put(damaged.response_content))
+    if damage == "missing":
+        blob.unlink()
+    else:
+        blob.write_bytes(blob.read_bytes()[:10])
+
+    assert [r.run_number for r in load_checkpoint(tmp_path)] == [2]
+    assert [r.run_number for r in load_checkpoint(tmp_path, with_content=False)] == [1, 2]
+
+
+def test_result_files_are_replaced_atomically(tmp_path, monkeypatch):
+    path = tmp_path / "todo_app_sequential_run001.json"
+    path.write_text(json.dumps({"version": 1}))
+
+    def crash(data, f, **kwargs):
+        f.write('{"version": ')
+        raise OSError("disk full")
+
+    monkeypatch.setattr("evaluation.checkpoint.json.dump", crash)
+    writer = ResultWriter()
+    writer.write_json(path, {"version": 2})
+    with pytest.raises(RuntimeError, match="disk full"):
+        writer.close()
+
+    assert json.loads(path.read_text()) == {"version": 1}
+    assert sorted(p.name for p in tmp_path.glob("*.json")) == [path.name]
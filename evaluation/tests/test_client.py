@@ -0,0 +1,84 @@
+"""Tests for the backend client's task status polling."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+import pytest
+
+from evaluation.client import TaskStatusPoller
+
+
+class FakeResponse:
+    def __init__(self, tasks: list[dict[str, Any]]):
+        self.tasks = tasks
+
+    async def __aenter__(self) -> FakeResponse:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+    async def json(self) -> list[dict[str, Any]]:
+        return self.tasks
+
+
+class FakeSession:
+    """Answers each batch request with the next scripted outcome."""
+
+    def __init__(self, outcomes: list[Exception | list[dict[str, Any]]]):
+        self.outcomes = outcomes
+        self.requests = 0
+
+    def get(self, url: str, params: dict[str, str]) -> FakeResponse:
+        outcome = self.outcomes[min(self.requests, len(self.outcomes) - 1)]
+        self.requests += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return FakeResponse(outcome)
+
+
+def make_poller(outcomes: list[Exception | list[dict[str, Any]]], max_failures: int = 3):
+    session = FakeSession(outcomes)
+    client = SimpleNamespace(session=session, base_url="http://backend")
+    return TaskStatusPoller(client, interval=0, max_failures=max_failures), session
+
+
+async def test_transient_poll_errors_are_retried():
+    completed = {"id": "task-1", "status": "completed"}
+    poller, session = make_poller(
+        [
+            aiohttp.ClientConnectionError("connection reset"),
+            [{"id": "task-1", "status": "processing"}],
+            aiohttp.ClientConnectionError("502 Bad Gateway"),
+            [completed],
+        ]
+    )
+
+    assert await poller.wait("task-1") == completed
+    assert session.requests == 4
+    await poller.close()
+
+
+async def test_consecutive_poll_errors_fail_waiters():
+    poller, session = make_poller([aiohttp.ClientConnectionError("backend down")])
+
+    with pytest.raises(aiohttp.ClientConnectionError, match="backend down"):
+        await poller.wait("task-1")
+    assert session.requests == 3
+    await poller.close()
+
+
+async def test_successful_poll_resets_failure_count():
+    error = aiohttp.ClientConnectionError("flaky")
+    processing = [{"id": "task-1", "status": "processing"}]
+    completed = {"id": "task-1", "status": "completed"}
+    poller, _ = make_poller([error, error, processing, error, error, [completed]])
+
+    assert await poller.wait("task-1") == completed
+    await poller.close()
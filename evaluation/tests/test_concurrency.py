@@ -0,0 +1,81 @@
+"""Tests for adaptive concurrency control."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from evaluation.client import AIMDController, BackendClient
+
+
+class CreatedTask:
+    async def __aenter__(self) -> CreatedTask:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+    async def json(self) -> dict[str, Any]:
+        return {"taskId": "task-1"}
+
+
+class TaskSession:
+    closed = False
+
+    def post(self, url: str, **kwargs: Any) -> CreatedTask:
+        return CreatedTask()
+
+
+def test_lasting_latency_shift_backs_off_once():
+    controller = AIMDController(initial_limit=8, min_limit=1, max_limit=16)
+    for _ in range(20):
+        controller.on_success(1.0, key="sequential:todo_app")
+    assert controller.limit == 10
+
+    # LLM latency doubling for good is one overload episode, not a ratchet
+    for _ in range(100):
+        controller.on_success(2.5, key="sequential:todo_app")
+
+    assert controller.limit > 5
+    assert controller._baselines["sequential:todo_app"] > 2.4
+
+
+def test_spikes_are_tracked_per_key():
+    controller = AIMDController(initial_limit=4)
+    controller.on_success(1.0, key="sequential:todo_app")
+    controller.on_success(30.0, key="parallel:dashboard")
+    controller.on_success(30.0, key="parallel:dashboard")
+
+    assert controller.limit == 4
+
+
+def test_overload_halves_limit_then_cools_down():
+    controller = AIMDController(initial_limit=8)
+    controller.on_overload()
+    controller.on_overload()
+
+    assert controller.limit == 4
+
+
+async def test_generation_latency_is_keyed_by_mode_and_prompt_id():
+    controller = AIMDController(initial_limit=2)
+    client = BackendClient(
+        "http://backend", session=TaskSession(), generation_controller=controller
+    )
+
+    async def wait_for_task(task_id: str) -> dict[str, Any]:
+        return {"id": task_id, "status": "completed"}
+
+    async def get_room_text(room_id: str, trace: Any = None) -> str:
+        return "export default function App() {}"
+
+    client._wait_for_task = wait_for_task
+    client._get_room_text = get_room_text
+
+    prompt = "Build a todo app with filters and local storage. " * 20
+    response = await client.send_prompt("room-1", prompt, "parallel", prompt_id="todo_app")
+
+    assert response["success"]
+    assert list(controller._baselines) == ["parallel:todo_app"]
@@ -0,0 +1,71 @@
+"""Tests for the cached results dataset."""
+
+from __future__ import annotations
+
+import json
+
+from evaluation.config import AgentMode
+from evaluation.dataset import ResultsDataset
+from evaluation.metrics import MetricsCollector
+from evaluation.store import ResultsStore
+
+
+def test_failed_run_round_trips_as_failed(tmp_path, make_result):
+    failed = make_result(
+        run_number=1,
+        error="Task timed out",
+        overall_score=None,
+        code_quality_score=None,
+        architecture_score=None,
+        performance_score=None,
+        accessibility_score=None,
+    )
+    scored = make_result(run_number=2)
+    with ResultsStore.for_output_dir(tmp_path) as store:
+        store.write([failed, scored])
+
+    results = ResultsDataset(tmp_path).load_results()
+
+    assert [r.success for r in results] == [False, True]
+    assert results[0].error == "Task timed out"
+    assert results[0].overall_score is None
+    assert results[0].accessibility_score is None
+    assert results[1].overall_score == 80.0
+
+
+def test_legacy_directory_is_not_written_to(tmp_path, make_result):
+    results_dir = tmp_path / "results"
+    results_dir.mkdir()
+    for result in (make_result(run_number=1, overall_score=None), make_result(run_number=2)):
+        name = f"{result.prompt_id}_{result.mode.value}_run{result.run_number:03d}.json"
+        (results_dir / name).write_text(json.dumps(result.to_dict()))
+
+    dataset = ResultsDataset(tmp_path)
+    rows = dataset.query().to_dict("records")
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [".cache", "results"]
+    assert [dataset.code(row) for row in rows] == [
+        "// todo_app sequential 1\n",
+        "// todo_app sequential 2\n",
+    ]
+    assert [r.success for r in dataset.load_results()] == [False, True]
+
+
+def test_results_at_loads_only_requested_rows(tmp_path, make_result):
+    results = [
+        make_result(prompt_id=prompt_id, mode=mode, run_number=run_number)
+        for prompt_id in ("todo_app", "tic_tac_toe")
+        for mode in AgentMode
+        for run_number in (1, 2)
+    ]
+    with ResultsStore.for_output_dir(tmp_path) as store:
+        store.write(results)
+
+    metrics = MetricsCollector.from_dataset(ResultsDataset(tmp_path), modes=["parallel"])
+    selected = metrics.results_at([3, 0])
+
+    assert [r.run_key for r in selected] == [
+        ("tic_tac_toe", "parallel", 2),
+        ("todo_app", "parallel", 1),
+    ]
+    assert metrics._results is None
@@ -0,0 +1,146 @@
+"""Tests for the coordinator/worker protocol."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from evaluation.config import AgentMode, EvaluationConfig, EvaluationPrompt, PromptCategory
+from evaluation.distributed import EvaluationCoordinator, EvaluationWorker, _receive, _send
+
+PROMPT = EvaluationPrompt(
+    id="todo_app",
+    name="Todo App",
+    category=PromptCategory.SIMPLE,
+    description="A todo list",
+    prompt="Build a todo app",
+    complexity_score=2.0,
+)
+TASKS = [(PROMPT, AgentMode.SEQUENTIAL, 1), (PROMPT, AgentMode.PARALLEL, 1)]
+
+
+class FakeWorker:
+    """Speaks the worker side of the protocol one message at a time."""
+
+    def __init__(self, worker_id: str):
+        self.worker_id = worker_id
+
+    async def connect(self, port: int) -> None:
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+        await self.call({"type": "hello", "worker_id": self.worker_id})
+
+    async def call(self, message: dict[str, Any]) -> dict[str, Any]:
+        await _send(self.writer, message)
+        reply = await _receive(self.reader)
+        assert reply is not None
+        return reply
+
+    async def deliver(self, lease: dict[str, Any], make_result: Any) -> None:
+        result = make_result(mode=AgentMode(lease["mode"]), run_number=lease["run_number"])
+        reply = await self.call(
+            {"type": "result", "lease_id": lease["lease_id"], "result": result.to_dict()}
+        )
+        assert reply["type"] == "ok"
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+async def start(coordinator: EvaluationCoordinator) -> tuple[asyncio.Task, list]:
+    delivered: list = []
+
+    async def on_result(result: Any, response: Any) -> None:
+        delivered.append(result.run_key)
+
+    await coordinator.start()
+    return asyncio.create_task(coordinator.run(TASKS, on_result)), delivered
+
+
+async def test_lease_of_disconnected_worker_is_requeued_first(make_result):
+    coordinator = EvaluationCoordinator(port=0)
+    run, delivered = await start(coordinator)
+    first, second = FakeWorker("first"), FakeWorker("second")
+    await first.connect(coordinator.port)
+    await second.connect(coordinator.port)
+
+    lost = await first.call({"type": "request"})
+    first.close()
+    await asyncio.sleep(0.2)
+
+    requeued = await second.call({"type": "request"})
+    assert requeued["type"] == "lease"
+    assert requeued["lease_id"] != lost["lease_id"]
+    assert (requeued["mode"], requeued["run_number"]) == (lost["mode"], lost["run_number"])
+
+    await second.deliver(requeued, make_result)
+    await second.deliver(await second.call({"type": "request"}), make_result)
+    assert await second.call({"type": "request"}) == {"type": "done"}
+    second.close()
+
+    await asyncio.wait_for(run, timeout=5)
+    assert sorted(delivered) == [("todo_app", "parallel", 1), ("todo_app", "sequential", 1)]
+
+
+async def test_expired_lease_is_requeued_and_late_result_ignored(make_result):
+    coordinator = EvaluationCoordinator(port=0, lease_timeout=0.2)
+    run, delivered = await start(coordinator)
+    stalled, healthy = FakeWorker("stalled"), FakeWorker("healthy")
+    await stalled.connect(coordinator.port)
+    await healthy.connect(coordinator.port)
+
+    expired = await stalled.call({"type": "request"})
+    other = await healthy.call({"type": "request"})
+    await healthy.deliver(other, make_result)
+    assert (await healthy.call({"type": "request"}))["type"] == "wait"
+
+    # No heartbeats from the stalled worker: its lease expires
+    await asyncio.sleep(0.5)
+    requeued = await healthy.call({"type": "request"})
+    assert requeued["type"] == "lease"
+    assert (requeued["mode"], requeued["run_number"]) == (expired["mode"], expired["run_number"])
+
+    await healthy.deliver(requeued, make_result)
+    await stalled.deliver(expired, make_result)
+    stalled.close()
+    healthy.close()
+
+    await asyncio.wait_for(run, timeout=5)
+    assert len(delivered) == 2
+    assert len(set(delivered)) == 2
+
+
+async def test_failed_heartbeat_ends_the_worker():
+    async def coordinator(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while (message := await _receive(reader)) is not None:
+            if message["type"] == "hello":
+                await _send(writer, {"type": "welcome", "heartbeat_interval": 0.01})
+            elif message["type"] == "request":
+                await _send(
+                    writer,
+                    {
+                        "type": "lease",
+                        "lease_id": "lease-1",
+                        "prompt": PROMPT.model_dump(mode="json"),
+                        "mode": "sequential",
+                        "run_number": 1,
+                    },
+                )
+            else:
+                # Drop the connection on the first heartbeat
+                break
+        writer.close()
+
+    server = await asyncio.start_server(coordinator, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    worker = EvaluationWorker(EvaluationConfig(), "127.0.0.1", port, slots=1, use_mock=True)
+
+    async def generate_forever(*args: object) -> None:
+        await asyncio.Event().wait()
+
+    worker.evaluator._generate = generate_forever  # type: ignore[method-assign]
+    async with server:
+        with pytest.raises(ExceptionGroup) as excinfo:
+            await asyncio.wait_for(worker.run(), timeout=5)
+    assert excinfo.group_contains(ConnectionError)
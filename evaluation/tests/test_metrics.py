@@ -0,0 +1,72 @@
+"""Tests for the vectorized summaries of the results cube."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from evaluation.config import AgentMode
+from evaluation.metrics import PROMPT_SUMMARY_METRICS, MetricsCollector
+
+
+@pytest.fixture
+def metrics(make_result) -> MetricsCollector:
+    rng = np.random.default_rng(3)
+    results = []
+    for prompt_id, runs in [("todo_app", 7), ("dashboard", 4)]:
+        for mode in AgentMode:
+            # Uneven group sizes pad the cube with NaN
+            for n in range(1, runs + (mode is AgentMode.PARALLEL) + 1):
+                results.append(
+                    make_result(
+                        prompt_id=prompt_id,
+                        mode=mode,
+                        run_number=n,
+                        response_time=float(rng.gamma(4, 3)),
+                        overall_score=float(rng.normal(75, 8)),
+                        code_quality_score=float(rng.integers(60, 90)),
+                    )
+                )
+    # A response time outlier and a failed run without scores
+    results[0].response_time = 400.0
+    results[1].error = "Task timed out"
+    for field in ("overall_score", "code_quality_score", "architecture_score"):
+        setattr(results[1], field, None)
+    return MetricsCollector(results)
+
+
+def test_prompt_summaries_match_per_group_summaries(metrics):
+    df = metrics.df
+    for prompt_id in ("todo_app", "dashboard"):
+        performance = metrics.get_prompt_performance(prompt_id)
+        for mode in ("sequential", "parallel"):
+            group = df[(df["prompt_id"] == prompt_id) & (df["mode"] == mode)]
+            for key, column, remove_outliers in PROMPT_SUMMARY_METRICS:
+                expected = metrics.calculate_summary(
+                    group[column].to_numpy(), remove_outliers=remove_outliers
+                )
+                # Constant columns have an undefined interval in both
+                expected = pytest.approx(asdict(expected), nan_ok=True)
+                assert asdict(performance[mode][key]) == expected, (prompt_id, mode, key)
+
+
+def test_summary_matches_scalar_statistics():
+    collector = MetricsCollector([])
+    values = np.array([12.0, 15.0, np.nan, 11.0, 14.0, 13.0, 95.0])
+
+    summary = collector.calculate_summary(values, remove_outliers=True)
+
+    present = values[~np.isnan(values)]
+    q1, median, q3 = np.percentile(present, [25, 50, 75])
+    kept = present[(present >= q1 - 1.5 * (q3 - q1)) & (present <= q3 + 1.5 * (q3 - q1))]
+    ci = stats.t.interval(0.95, len(kept) - 1, loc=kept.mean(), scale=stats.sem(kept))
+    assert summary.outliers == [95.0]
+    assert summary.n_samples == 5
+    assert summary.success_rate == pytest.approx(5 / 7)
+    assert (summary.q1, summary.median, summary.q3) == pytest.approx((q1, median, q3))
+    assert (summary.mean, summary.std) == pytest.approx((kept.mean(), kept.std(ddof=1)))
+    assert (summary.min, summary.max) == (11.0, 15.0)
+    assert (summary.ci_lower, summary.ci_upper) == pytest.approx(ci)
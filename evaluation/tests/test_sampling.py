@@ -0,0 +1,72 @@
+"""Tests for group-sequential sampling."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from evaluation.config import AgentMode, EvaluationConfig
+from evaluation.sampling import SequentialSampler, obrien_fleming_boundaries
+
+
+def test_single_look_boundary_is_fixed_sample_critical_value():
+    (boundary,) = obrien_fleming_boundaries([20], alpha=0.05)
+
+    assert boundary == pytest.approx(stats.norm.isf(0.025), abs=0.02)
+
+
+def test_boundaries_shrink_like_inverse_square_root_of_information():
+    sizes = [5, 10, 15, 20]
+    boundaries = obrien_fleming_boundaries(sizes, alpha=0.05)
+
+    assert boundaries == sorted(boundaries, reverse=True)
+    scaled = [b * np.sqrt(n / sizes[-1]) for b, n in zip(boundaries, sizes, strict=True)]
+    assert scaled == pytest.approx([scaled[-1]] * len(sizes))
+    # Tabulated O'Brien-Fleming final boundary for four equally spaced looks
+    assert boundaries[-1] == pytest.approx(2.024, abs=0.02)
+
+
+def test_boundaries_keep_overall_type_one_error():
+    sizes = [4, 8, 12, 20]
+    boundaries = np.array(obrien_fleming_boundaries(sizes, alpha=0.05))
+
+    # Interim z-statistics of cumulative means under the null, independent of
+    # the calibration's simulation
+    rng = np.random.default_rng(1)
+    draws = rng.standard_normal((100_000, sizes[-1]))
+    looks = np.array(sizes)
+    z = np.cumsum(draws, axis=1)[:, looks - 1] / np.sqrt(looks)
+    rejected = (np.abs(z) >= boundaries).any(axis=1)
+
+    assert rejected.mean() == pytest.approx(0.05, abs=0.005)
+
+
+def test_looks_end_at_the_run_limit():
+    config = EvaluationConfig(runs_per_prompt=12, sampling_batch_size=5)
+    sampler = SequentialSampler(config, list(AgentMode))
+
+    assert sampler.looks == [5, 10, 12]
+    assert [list(sampler.stage_runs(look)) for look in (1, 2, 3)] == [
+        [1, 2, 3, 4, 5],
+        [6, 7, 8, 9, 10],
+        [11, 12],
+    ]
+
+
+def test_last_look_stops_at_max_runs(make_result):
+    config = EvaluationConfig(
+        runs_per_prompt=4, sampling_batch_size=2, sampling_target_ci_width=0.1
+    )
+    sampler = SequentialSampler(config, list(AgentMode))
+    results = [
+        make_result(mode=mode, run_number=n, overall_score=50.0 + 10 * n)
+        for mode in AgentMode
+        for n in range(1, 5)
+    ]
+
+    (first,) = sampler.check(results, {"todo_app"}, look=1)
+    (last,) = sampler.check(results, {"todo_app"}, look=2)
+
+    assert (first.stopped, first.reason, first.runs) == (False, "continue", 2)
+    assert (last.stopped, last.reason, last.runs) == (True, "max_runs", 4)
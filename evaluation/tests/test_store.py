@@ -0,0 +1,74 @@
+"""Tests for the blob store and the SQLite results store."""
+
+from __future__ import annotations
+
+import json
+
+from evaluation.blobs import CONTENT_BLOB_KEY, BlobStore, read_result
+from evaluation.config import AgentMode
+from evaluation.store import ResultsStore
+
+
+def test_blob_round_trip_shares_identical_code(tmp_path):
+    blobs = BlobStore.for_output_dir(tmp_path)
+    code = "export const App = () => <div>héllo</div>;\n"
+
+    digest = blobs.put(code)
+
+    assert blobs.put(code) == digest
+    assert blobs.get(digest) == code
+    assert len(list((tmp_path / "blobs").rglob("*.gz"))) == 1
+
+
+def test_externalized_record_resolves_to_original(tmp_path, make_result):
+    blobs = BlobStore.for_output_dir(tmp_path)
+    record = make_result().to_dict()
+    record["raw_response"] = {"content": record["response_content"], "tokens": 1000}
+
+    externalized = blobs.externalize(record)
+
+    assert "response_content" not in externalized
+    assert "content" not in externalized["raw_response"]
+    assert externalized["raw_response"]["content_blob"] == externalized[CONTENT_BLOB_KEY]
+    assert "response_content" in record
+    assert blobs.resolve(externalized) == record
+
+
+def test_inline_record_reads_unchanged(tmp_path, make_result):
+    record = make_result().to_dict()
+    (tmp_path / "results").mkdir()
+    path = tmp_path / "results" / "todo_app_sequential_1.json"
+    path.write_text(json.dumps(record))
+
+    assert read_result(path) == record
+
+
+def test_rewritten_run_keeps_its_row(tmp_path, make_result):
+    with ResultsStore.for_output_dir(tmp_path) as store:
+        store.write([make_result(run_number=1), make_result(run_number=2)])
+        store.write(
+            [
+                make_result(run_number=3),
+                make_result(run_number=1, overall_score=55.0, response_content="// retried\n"),
+            ]
+        )
+
+        df = store.load_dataframe()
+        results = store.load_results(with_content=True)
+
+    assert df["run_number"].tolist() == [1, 2, 3]
+    assert df["overall_score"].tolist() == [55.0, 80.0, 80.0]
+    assert len(store) == 3
+    assert results[0].response_content == "// retried\n"
+    assert [r.run_key for r in results] == [
+        ("todo_app", AgentMode.SEQUENTIAL.value, n) for n in (1, 2, 3)
+    ]
+
+
+def test_load_results_at_rows_follows_insertion_order(tmp_path, make_result):
+    with ResultsStore.for_output_dir(tmp_path, store_code_blobs=False) as store:
+        store.write([make_result(run_number=n) for n in (3, 1, 2)])
+        selected = store.load_results(with_content=True, rows=[2, 0])
+
+    assert [r.run_number for r in selected] == [2, 3]
+    assert selected[0].response_content == "// todo_app sequential 2\n"